@@ -6,6 +6,8 @@
 
 
 class Node:
+    __slots__ = ('val', 'next')
+
     def __init__(self, val, next_=None):
         self.val = val
         self.next = next_
@@ -41,6 +41,8 @@ from math import ceil
 
 class BNode:
     """B树节点，B树的节点没有“阶数”属性，关于阶数的检查需要在B树中实现"""
+    __slots__ = ('_father', '_keys', '_keys_nums', '_sons', '_sons_nums')
+
     def __init__(self, sourceCollection=None):
         """节点构造函数。"""
 
@@ -67,13 +69,13 @@ class BNode:
 
     def __add_key(self, val):
         # 节点为空
-        if not self.keys_nums:
+        if not self._keys_nums:
             self._keys.append(val)
             index = 0
         # 节点不为空
         else:
             self._keys.append(val)
-            index = self.keys_nums
+            index = self._keys_nums
             while index > 0:
                 if self._keys[index] >= self._keys[index - 1]:
                     break
@@ -100,8 +102,8 @@ class BNode:
 
         # 合并子节点
         if self._sons_nums:
-            new_node = BNode(sourceCollection=(self.sons[index].keys + self.sons[index+1].keys))
-            self.sons[index] = new_node
+            new_node = BNode(sourceCollection=(self._sons[index].keys + self._sons[index+1].keys))
+            self._sons[index] = new_node
             self.__delete_node(index + 1)
 
     def add_node(self, newNode, index=None):
@@ -112,12 +114,12 @@ class BNode:
         :param index: 整型，插入节点的索引。需要在该方法外部进行是否满足B树阶数的检查。
         """
         assert isinstance(newNode, BNode), 'Mismatched type!'
-        assert index is None or (index <= self.sons_nums), 'Index out of range!'
+        assert index is None or (index <= self._sons_nums), 'Index out of range!'
         # assert isinstance(partial(BNode, m=self.order), newNode), 'Mismatched orders!'
         self.__add_node(newNode, index)
 
     def __add_node(self, newNode, index=None):
-        if not index or (index == self.sons_nums):
+        if not index or (index == self._sons_nums):
             self._sons.append(newNode)
         # 添加位置在非末尾的位置时
         else:
@@ -135,7 +137,7 @@ class BNode:
     def printKeys(self):
         """打印节点关键字"""
         print('keys: ', end=' ')
-        for i in range(self.keys_nums):
+        for i in range(self._keys_nums):
             print(self._keys[i], end=' ')
         print('\n')
 
@@ -144,17 +146,17 @@ class BNode:
         return self.__search(target)
 
     def __search(self, target):
-        if self.keys_nums == 0:
+        if self._keys_nums == 0:
             return -1
         # 当关键字数量不大于4的情况下使用顺序查找
-        if self.keys_nums <= 4:
-            for index in range(self.keys_nums):
+        if self._keys_nums <= 4:
+            for index in range(self._keys_nums):
                 if self._keys[index] == target:
                     return index
             return -1
         # 当关键字数量大于4的情况下使用二分查找
         else:
-            left, right = 0, self.keys_nums - 1
+            left, right = 0, self._keys_nums - 1
             while left <= right:
                 mid = (left + right) // 2
                 if self._keys[mid] == target:
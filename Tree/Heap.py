@@ -5,21 +5,36 @@
 
 堆的定义：
 堆的特性：
+
+位置索引：
+    以 indexed=True 创建的堆另外维护一个 值 -> 下标 的字典，swap() 等改动节点位置的操作会同步更新它，
+    于是 find 为 O(1)，delete 为 O(log n)。值必须可哈希；相等的值共用一个键，键对应一个下标，
+    出现重复值时则对应一个下标集合。
+
+d叉堆与类型化存储：
+    arity=d 时每个节点有 d 个子节点，下标为 i 的节点的子节点为 d*(i-1)+2 ... d*i+1，父节点为 (i-2)//d+1。
+    d=4 或 8 时树高减为 log_d(n)，向下修复时比较的 d 个子节点在容器中相邻，访问的内存更集中。
+    typecode（如 'q'、'd'）给出时，容器是一个 array.array，数值直接按机器类型连续存放，而不是存放对象指针。
 """
 import abc
+from array import array
 
 
 class Heap(abc.ABC):
     """堆的抽象类"""
-    def __init__(self, sourceCollection=None):
-        self._container = [None]  # 堆容器
+    def __init__(self, sourceCollection=None, indexed=False, arity=2, typecode=None):
+        if arity < 2:
+            raise ValueError('Arity of heap must be at least 2!')
+        self._arity = arity  # 每个节点的子节点数
+        self._typecode = typecode  # 类型化存储的类型码，None 表示使用列表
+        self._container = self._new_container()  # 堆容器
         self._size = 0  # 堆尺寸
         self._top = None  # 堆顶
         self._bottom = None  # 堆尾
+        self._positions = {} if indexed else None  # 位置索引：值 -> 下标，或重复值的下标集合
 
         if sourceCollection:
-            for item in sourceCollection:
-                self.add(item)
+            self.extend(sourceCollection)
 
     @property
     def container(self):
@@ -37,6 +52,18 @@ class Heap(abc.ABC):
     def bottom(self):
         return self._bottom
 
+    @property
+    def indexed(self):
+        return self._positions is not None
+
+    @property
+    def arity(self):
+        return self._arity
+
+    @property
+    def typecode(self):
+        return self._typecode
+
     def is_Empty(self):
         """Return whether self is empty"""
         return len(self) == 0
@@ -63,16 +90,19 @@ class Heap(abc.ABC):
         print('=' * 50)
 
     def __draw(self, root, height, preStr, length):
-        """递归打印二叉树"""
+        """递归打印树，前一半子节点画在上方，后一半画在下方"""
         if root > self._bottom:
             return
-        self.__draw(root * 2 + 1, height + 1, 'V', length)
+        first = self._arity * (root - 1) + 2
+        for child in range(first + self._arity - 1, first + self._arity // 2 - 1, -1):
+            self.__draw(child, height + 1, 'V', length)
         string = preStr + str(self._container[root]) + preStr
         leftLen = (length - len(string)) // 2
         rightLen = length - len(string) - leftLen
         res = " " * leftLen + string + " " * rightLen
         print(" " * height * length + res)
-        self.__draw(root * 2, height + 1, '^', length)
+        for child in range(first + self._arity // 2 - 1, first - 1, -1):
+            self.__draw(child, height + 1, '^', length)
 
     @abc.abstractmethod
     def add(self, newValue):
@@ -89,43 +119,224 @@ class Heap(abc.ABC):
         """Find value in self"""
         pass
 
+    def peek(self):
+        """Return the value at the top of heap"""
+        if self.is_Empty():
+            raise ValueError('Heap is empty!')
+        return self._container[self._top]
+
+    def pop(self):
+        """Remove and return the value at the top of heap"""
+        if self.is_Empty():
+            raise ValueError('Heap is empty!')
+        return self._remove_at(self._top)
+
+    def extend(self, values):
+        """
+        Add every value in values to heap.
+        When they outnumber the nodes of heap by enough, they are appended and the whole heap is rebuilt by Floyd's
+        bottom-up heapify in O(n); otherwise each of them is sifted up, in O(k log n).
+        """
+        values = list(values)
+        if not values:
+            return
+        start = self._size + 1
+        self._container.extend(values)
+        self._size += len(values)
+        self._top = 1
+        self._bottom = self._size
+        if len(values) * self._size.bit_length() > self._size:
+            self._heapify()
+        else:
+            for ind in range(start, self._bottom + 1):
+                if self._positions is not None:
+                    self._index_add(self._container[ind], ind)
+                self._sift_up(ind)
+
+    def pushpop(self, newValue):
+        """Add newValue, then remove and return the top value; faster than add() followed by pop()"""
+        if self.is_Empty() or not self._precedes(self._container[self._top], newValue):
+            return newValue
+        return self._replace_top(newValue)
+
+    def replace(self, newValue):
+        """Remove and return the top value, then add newValue; faster than pop() followed by add()"""
+        if self.is_Empty():
+            raise ValueError('Heap is empty!')
+        return self._replace_top(newValue)
+
     def clear(self):
         """Reset self"""
-        self._container = [None]
+        self._container = self._new_container()
         self._size = 0
         self._top = None
         self._bottom = None
+        if self._positions is not None:
+            self._positions = {}
 
     def swap(self, ind1, ind2):
         assert isinstance(ind1, int)
         assert isinstance(ind2, int)
         assert (ind1 <= self._bottom) and (ind2 <= self._bottom)
-        self._container[ind1], self._container[ind2] = self._container[ind2], self._container[ind1]
+        value1, value2 = self._container[ind1], self._container[ind2]
+        self._container[ind1], self._container[ind2] = value2, value1
+        if self._positions is not None and value1 != value2:
+            self._index_move(value1, ind1, ind2)
+            self._index_move(value2, ind2, ind1)
+
+    def _index_add(self, value, ind):
+        """Record that value is at ind"""
+        positions = self._positions.get(value)
+        if positions is None:
+            self._positions[value] = ind
+        elif type(positions) is int:
+            self._positions[value] = {positions, ind}
+        else:
+            positions.add(ind)
+
+    def _index_remove(self, value, ind):
+        """Forget that value is at ind"""
+        positions = self._positions[value]
+        if type(positions) is int:
+            del self._positions[value]
+        else:
+            positions.discard(ind)
+            if len(positions) == 1:
+                self._positions[value] = positions.pop()
+
+    def _index_move(self, value, old, new):
+        """Record that value moved from old to new"""
+        positions = self._positions[value]
+        if type(positions) is int:
+            self._positions[value] = new
+        else:
+            positions.discard(old)
+            positions.add(new)
 
+    def _lookup(self, value):
+        """Return an index of value by the position index, or -1 if it is not in heap"""
+        positions = self._positions.get(value)
+        if positions is None:
+            return -1
+        if type(positions) is int:
+            return positions
+        return min(positions)
 
-class MaxHeap(Heap):
-    """大顶堆"""
-    def add(self, newValue):
-        """Add newValue to heap"""
-        self.__add(newValue)
+    def _new_container(self):
+        """Return an empty container, whose unused position 0 keeps the indexes of nodes starting from 1"""
+        if self._typecode is None:
+            return [None]
+        return array(self._typecode, [0])
 
-    def __add(self, newValue):
-        """Add newValue"""
+    @abc.abstractmethod
+    def _precedes(self, value1, value2):
+        """Return whether value1 belongs above value2 in self"""
+        pass
+
+    def _sift_up(self, ind):
+        """Swap the node at ind with its father until the father precedes it, and return its final index"""
+        container = self._container
+        arity = self._arity
+        while ind > 1:
+            father = (ind - 2) // arity + 1
+            if not self._precedes(container[ind], container[father]):
+                break
+            self.swap(ind, father)
+            ind = father
+        return ind
+
+    def _sift_down(self, ind):
+        """Swap the node at ind with its leading child until it precedes all children, and return its final index"""
+        container = self._container
+        arity = self._arity
+        precedes = self._precedes
+        while True:
+            first = arity * (ind - 1) + 2
+            if first > self._bottom:
+                break
+            child = first
+            for other in range(first + 1, min(first + arity, self._bottom + 1)):
+                if precedes(container[other], container[child]):
+                    child = other
+            if not precedes(container[child], container[ind]):
+                break
+            self.swap(ind, child)
+            ind = child
+        return ind
+
+    def _heapify(self):
+        """
+        Floyd's bottom-up heapify: sift down every node that has a child, from the last one up to the top, in O(n).
+        The nodes are moved into a hole instead of being swapped, so swap() is not called.
+        """
+        container = self._container
+        bottom = self._size
+        arity = self._arity
+        precedes = self._precedes
+        for start in range((bottom - 2) // arity + 1, 0, -1):
+            value = container[start]
+            ind = start
+            first = arity * (ind - 1) + 2
+            while first <= bottom:
+                child = first
+                for other in range(first + 1, min(first + arity, bottom + 1)):
+                    if precedes(container[other], container[child]):
+                        child = other
+                if not precedes(container[child], value):
+                    break
+                container[ind] = container[child]
+                ind = child
+                first = arity * (ind - 1) + 2
+            container[ind] = value
+        if self._positions is not None:
+            self._positions = {}
+            for ind in range(1, bottom + 1):
+                self._index_add(container[ind], ind)
+
+    def _replace_top(self, newValue):
+        """Put newValue at the top of heap, sift it down, and return the value it replaced"""
+        value = self._container[self._top]
+        self._container[self._top] = newValue
+        if self._positions is not None:
+            self._index_remove(value, self._top)
+            self._index_add(newValue, self._top)
+        self._sift_down(self._top)
+        return value
+
+    def _append(self, newValue):
+        """Add newValue as the last node, and sift it up"""
         self._container.append(newValue)
         self._size += 1
-
-        if len(self) == 1:
-            self._top = 1  # 重置堆顶
-            self._bottom = 1
+        self._top = 1  # 重置堆顶
+        self._bottom = self._size
+        if self._positions is not None:
+            self._index_add(newValue, self._bottom)
+        self._sift_up(self._bottom)
+
+    def _remove_at(self, ind):
+        """Remove and return the value of the node at ind"""
+        # 将最后一个节点与待删节点交换，删除最后一个节点，更新状态，再向上或向下修复堆的性质
+        if ind != self._bottom:
+            self.swap(ind, self._bottom)
+        value = self._container.pop()
+        if self._positions is not None:
+            self._index_remove(value, self._bottom)
+        self._size -= 1
+        if self._size == 0:
+            self._top = None
+            self._bottom = None
         else:
-            self._bottom += 1
-            ind = self._bottom
-            while ind != self._top:
-                if self._container[ind] > self._container[ind // 2]:
-                    self._container[ind], self._container[ind // 2] = self._container[ind // 2], self._container[ind]
-                    ind = ind // 2
-                else:
-                    break
+            self._bottom -= 1
+            if ind <= self._bottom:
+                self._sift_down(self._sift_up(ind))
+        return value
+
+
+class MaxHeap(Heap):
+    """大顶堆"""
+    def add(self, newValue):
+        """Add newValue to heap"""
+        self._append(newValue)
 
     def delete(self, target):
         """Delete specific node from heap"""
@@ -136,43 +347,7 @@ class MaxHeap(Heap):
         ind = self.find(target)
         if ind == -1:
             raise ValueError('Not Found!')
-        if ind == self._top and self._bottom == self._top:
-            self._container.pop()
-            self._size = 0
-            self._top = None
-            self._bottom = None
-        elif ind == self._bottom:
-            self._container.pop()
-            self._size -= 1
-            self._bottom -= 1
-        else:
-            # 将最后一个节点与待删值交换，删除最后一个节点，更新状态，并通过交换值的方式向下修复堆的性质
-            self.swap(ind, self._bottom)
-            self._container.pop()
-            self._size -= 1
-            self._bottom -= 1
-
-            # 删除后修复堆
-            while True:
-                left, right = ind * 2, ind * 2 + 1
-                if left > self._bottom:
-                    break
-                elif right > self._bottom:
-                    if self._container[left] > self._container[ind]:
-                        self.swap(ind, left)
-                        ind = left
-                    else:
-                        break
-                else:
-                    if self._container[ind] > self._container[left] and self._container[ind] > self._container[right]:
-                        break
-                    else:
-                        if self._container[left] >= self._container[right]:
-                            tmp_ind = left
-                        else:
-                            tmp_ind = right
-                        self.swap(ind, tmp_ind)
-                        ind = tmp_ind
+        self._remove_at(ind)
 
     def find(self, value):
         """Find value in heap"""
@@ -182,6 +357,8 @@ class MaxHeap(Heap):
         """Find value in self"""
         if len(self) == 0:
             return -1
+        if self._positions is not None:
+            return self._lookup(value)
         if value > self._container[self._top]:
             return -1
         for index in range(1, self._bottom+1):
@@ -189,30 +366,16 @@ class MaxHeap(Heap):
                 return index
         return -1
 
+    def _precedes(self, value1, value2):
+        """The larger value is nearer to the top"""
+        return value1 > value2
+
 
 class MinHeap(Heap):
     """小顶堆"""
     def add(self, newValue):
         """Add newValue to heap"""
-        self.__add(newValue)
-
-    def __add(self, newValue):
-        """Add newValue"""
-        self._container.append(newValue)
-        self._size += 1
-
-        if len(self) == 1:
-            self._top = 1  # 重置堆顶
-            self._bottom = 1
-        else:
-            self._bottom += 1
-            ind = self._bottom
-            while ind != self._top:
-                if self._container[ind] < self._container[ind // 2]:
-                    self._container[ind], self._container[ind // 2] = self._container[ind // 2], self._container[ind]
-                    ind = ind // 2
-                else:
-                    break
+        self._append(newValue)
 
     def delete(self, target):
         """Delete specific node from heap"""
@@ -223,43 +386,7 @@ class MinHeap(Heap):
         ind = self.find(target)
         if ind == -1:
             raise ValueError('Not Found!')
-        if ind == self._top and self._bottom == self._top:
-            self._container.pop()
-            self._size = 0
-            self._top = None
-            self._bottom = None
-        elif ind == self._bottom:
-            self._container.pop()
-            self._size -= 1
-            self._bottom -= 1
-        else:
-            # 将最后一个节点与待删值交换，删除最后一个节点，更新状态，并通过交换值的方式向下修复堆的性质
-            self.swap(ind, self._bottom)
-            self._container.pop()
-            self._size -= 1
-            self._bottom -= 1
-
-            # 删除后修复堆
-            while True:
-                left, right = ind * 2, ind * 2 + 1
-                if left > self._bottom:
-                    break
-                elif right > self._bottom:
-                    if self._container[left] < self._container[ind]:
-                        self.swap(ind, left)
-                        ind = left
-                    else:
-                        break
-                else:
-                    if self._container[ind] < self._container[left] and self._container[ind] < self._container[right]:
-                        break
-                    else:
-                        if self._container[left] < self._container[right]:
-                            tmp_ind = left
-                        else:
-                            tmp_ind = right
-                        self.swap(ind, tmp_ind)
-                        ind = tmp_ind
+        self._remove_at(ind)
 
     def find(self, value):
         """Find value in heap"""
@@ -269,13 +396,19 @@ class MinHeap(Heap):
         """Find value in self"""
         if len(self) == 0:
             return -1
-        if value > self._container[self._top]:
+        if self._positions is not None:
+            return self._lookup(value)
+        if value < self._container[self._top]:
             return -1
         for index in range(1, self._bottom+1):
             if self._container[index] == value:
                 return index
         return -1
 
+    def _precedes(self, value1, value2):
+        """The smaller value is nearer to the top"""
+        return value1 < value2
+
 
 if __name__ == '__main__':
     test_list = [3, 7, 1, 4, 5, 6, 2, 8, 9, 10, 11, 12]
@@ -288,6 +421,10 @@ if __name__ == '__main__':
     min_heap.draw()
     print(min_heap)
 
+    print(min_heap.pushpop(0), min_heap.replace(13), min_heap.pop(), min_heap.peek())
+    min_heap.extend([0, 20])
+    print(min_heap)
+
     heap = MinHeap()
     heap.draw()
     print(heap)
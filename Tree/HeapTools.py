@@ -0,0 +1,61 @@
+"""
+@Date: 2026/10/17
+@Author: Chen Zhang
+@Brief: 基于堆的流式工具
+
+    （1）top_k(stream, k, key=None)：用一个最多 k 个节点的小顶堆保存目前最大的 k 个元素，新元素只有大于堆顶时才替换
+        堆顶。内存 O(k)，时间 O(n log k)，读完 stream 后按从大到小的顺序产出这 k 个元素；
+    （2）merge_sorted(*iterables, key=None)：k 路归并。小顶堆中每个输入只有一个节点，即其当前元素；弹出堆顶后从同一
+        输入读取下一个元素替换它。内存 O(k)，时间 O(n log k)，边读边产出。
+两者都只按需从迭代器中读取元素，因此可以直接处理逐行读取的文件等数据流。
+节点是 (键, 序号, 元素) 元组，序号保证相等的键按输入顺序排列，且元素本身从不参与比较。
+"""
+from Heap import MinHeap
+
+
+def top_k(stream, k, key=None):
+    """Yield the k largest items of stream, largest first; items of equal keys come in the order of stream"""
+    if k <= 0:
+        return
+    heap = MinHeap()
+    for index, item in enumerate(stream):
+        # 序号取负：键相等时，先出现的元素排在堆中更靠后的位置，因而被保留
+        node = (item if key is None else key(item), -index, item)
+        if len(heap) < k:
+            heap.add(node)
+        else:
+            heap.pushpop(node)
+    result = [heap.pop()[2] for _ in range(len(heap))]
+    yield from reversed(result)
+
+
+def merge_sorted(*iterables, key=None):
+    """Yield the items of iterables, each sorted by key, in one sorted sequence; ties come in the order of iterables"""
+    iterators = []
+    nodes = []
+    for iterator in map(iter, iterables):
+        for item in iterator:
+            nodes.append((item if key is None else key(item), len(iterators), item))
+            iterators.append(iterator)
+            break
+    heap = MinHeap(nodes)
+    while not heap.is_Empty():
+        _, index, item = heap.peek()
+        yield item
+        for following in iterators[index]:
+            heap.replace((following if key is None else key(following), index, following))
+            break
+        else:
+            heap.pop()
+
+
+if __name__ == '__main__':
+    import random
+
+    numbers = (random.randrange(100) for _ in range(1000))
+    print(list(top_k(numbers, 5)))
+    words = ['pear', 'fig', 'banana', 'kiwi', 'apple', 'plum', 'cherry']
+    print(list(top_k(words, 3, key=len)))
+
+    print(list(merge_sorted([1, 4, 7], iter([2, 5, 8]), (n for n in (0, 3, 6, 9)), [])))
+    print(list(merge_sorted(['b', 'dd'], ['a', 'ccc'], key=len)))
@@ -0,0 +1,184 @@
+"""
+@Date: 2026/10/17
+@Author: Chen Zhang
+@Brief: 索引堆 的实现
+
+索引堆：
+    堆中的每个节点是一个 [priority, handle] 对，按 priority 排列；另有一个字典记录每个 handle 所在的下标。
+    于是不必线性查找就能定位一个节点：
+        （1）contains(handle)、priority(handle)：O(1)；
+        （2）update_priority(handle, priority)：改写节点后向上或向下修复，O(log n)；
+        （3）remove(handle)：与最后一个节点交换后删除并修复，O(log n)。
+    字典在 swap() 中随节点一起更新，因此向上、向下修复直接复用 Heap 的 _sift_up、_sift_down。
+    适用于 Dijkstra 等需要调整已入堆元素优先级的场景。
+"""
+from Heap import Heap, MaxHeap, MinHeap
+
+
+class IndexedHeap(Heap):
+    """索引堆的基类，与 MinHeap 或 MaxHeap 组合使用，由后者决定优先级的顺序"""
+    def __init__(self, sourceCollection=None, arity=2):
+        """
+        sourceCollection is a mapping of handle to priority, or an iterable of (handle, priority) pairs.
+        arity is the number of children of each node.
+        """
+        self._position = {}  # handle -> 节点下标
+        super().__init__(arity=arity)
+
+        if sourceCollection:
+            self.extend(sourceCollection)
+
+    def __contains__(self, handle):
+        """Return whether handle is in self"""
+        return handle in self._position
+
+    def __iter__(self):
+        """Iterate over the (handle, priority) pairs of self, in heap order"""
+        for priority, handle in self._container[1:]:
+            yield handle, priority
+
+    def add(self, handle, priority):
+        """Add handle with priority to heap"""
+        if handle in self._position:
+            raise KeyError('Handle %r is already in heap!' % (handle,))
+        self._position[handle] = self._size + 1
+        self._append([priority, handle])
+
+    def extend(self, pairs):
+        """Add every (handle, priority) pair in pairs, or every item of a mapping of handle to priority, to heap"""
+        if hasattr(pairs, 'items'):
+            pairs = pairs.items()
+        nodes = []
+        position = {}
+        for handle, priority in pairs:
+            if handle in self._position or handle in position:
+                raise KeyError('Handle %r is already in heap!' % (handle,))
+            position[handle] = self._size + len(nodes) + 1
+            nodes.append([priority, handle])
+        self._position.update(position)
+        super().extend(nodes)
+
+    def pushpop(self, handle, priority):
+        """Add handle with priority, then remove and return the (handle, priority) pair at the top of heap"""
+        if handle in self._position:
+            raise KeyError('Handle %r is already in heap!' % (handle,))
+        priority, handle = super().pushpop([priority, handle])
+        return handle, priority
+
+    def replace(self, handle, priority):
+        """Remove and return the (handle, priority) pair at the top of heap, then add handle with priority"""
+        if handle in self._position:
+            raise KeyError('Handle %r is already in heap!' % (handle,))
+        priority, handle = super().replace([priority, handle])
+        return handle, priority
+
+    def delete(self, target):
+        """Delete the node of handle target from heap"""
+        self.remove(target)
+
+    def remove(self, handle):
+        """Remove handle from heap and return its priority"""
+        priority, _ = self._remove_at(self._index(handle))
+        del self._position[handle]
+        return priority
+
+    def find(self, value):
+        """Return the index of the node of handle value, or -1 if it is not in heap"""
+        return self._position.get(value, -1)
+
+    def priority(self, handle):
+        """Return the priority of handle"""
+        return self._container[self._index(handle)][0]
+
+    def update_priority(self, handle, priority):
+        """Change the priority of handle, and move its node up or down to restore the heap"""
+        ind = self._index(handle)
+        self._container[ind][0] = priority
+        self._sift_down(self._sift_up(ind))
+
+    def peek(self):
+        """Return the (handle, priority) pair at the top of heap"""
+        if self.is_Empty():
+            raise ValueError('Heap is empty!')
+        priority, handle = self._container[self._top]
+        return handle, priority
+
+    def pop(self):
+        """Remove and return the (handle, priority) pair at the top of heap"""
+        if self.is_Empty():
+            raise ValueError('Heap is empty!')
+        priority, handle = self._remove_at(self._top)
+        del self._position[handle]
+        return handle, priority
+
+    def clear(self):
+        """Reset self"""
+        super().clear()
+        self._position = {}
+
+    def swap(self, ind1, ind2):
+        """Swap two nodes and record their new indexes"""
+        super().swap(ind1, ind2)
+        self._position[self._container[ind1][1]] = ind1
+        self._position[self._container[ind2][1]] = ind2
+
+    def _heapify(self):
+        """Heapify, then record the index of every node, since the nodes were moved without swap()"""
+        super()._heapify()
+        container = self._container
+        self._position = {container[ind][1]: ind for ind in range(1, self._size + 1)}
+
+    def _replace_top(self, newValue):
+        """Put the node newValue at the top of heap, and drop the handle of the node it replaced"""
+        del self._position[self._container[self._top][1]]
+        self._position[newValue[1]] = self._top
+        return super()._replace_top(newValue)
+
+    def _precedes(self, value1, value2):
+        """Compare two nodes by their priorities, in the order of the heap combined with self"""
+        return super()._precedes(value1[0], value2[0])
+
+    def _index(self, handle):
+        """Return the index of the node of handle"""
+        try:
+            return self._position[handle]
+        except KeyError:
+            raise KeyError('Handle %r is not in heap!' % (handle,)) from None
+
+
+class IndexedMinHeap(IndexedHeap, MinHeap):
+    """小顶索引堆"""
+    pass
+
+
+class IndexedMaxHeap(IndexedHeap, MaxHeap):
+    """大顶索引堆"""
+    pass
+
+
+if __name__ == '__main__':
+    heap = IndexedMinHeap({'a': 5, 'b': 3, 'c': 8, 'd': 1})
+    heap.draw()
+    heap.update_priority('c', 0)
+    heap.update_priority('d', 9)
+    print(heap.peek(), 'b' in heap, heap.remove('b'), 'b' in heap)
+    print([heap.pop() for _ in range(len(heap))])
+
+    # Dijkstra
+    graph = {'s': {'a': 7, 'b': 2}, 'a': {'t': 1}, 'b': {'a': 3, 't': 8}, 't': {}}
+    distance = {}
+    frontier = IndexedMinHeap({'s': 0})
+    while not frontier.is_Empty():
+        vertex, dist = frontier.pop()
+        distance[vertex] = dist
+        for neighbor, weight in graph[vertex].items():
+            if neighbor in distance:
+                continue
+            if neighbor not in frontier:
+                frontier.add(neighbor, dist + weight)
+            elif dist + weight < frontier.priority(neighbor):
+                frontier.update_priority(neighbor, dist + weight)
+    print(distance)
+
+    heap = IndexedMaxHeap([('x', 1), ('y', 4), ('z', 2)])
+    print(heap)
@@ -0,0 +1,119 @@
+"""
+@Date: 2026/10/17
+@Author: Chen Zhang
+@Brief: 基于红黑树的区间树
+
+区间树概述：
+    1、结构：
+        以闭区间(low, high)为值的红黑树，按(low, high)排序。每个节点额外记录以其为根的子树中区间右端点的最大值high，
+        插入、删除时沿路径、旋转时对两个旋转的节点由IntervalNode.update()重新计算，与子树节点数size一起维护。
+
+    2、查询：
+        overlap(low, high)中序遍历与[low, high]相交的区间：子树的high小于low时整棵子树都不相交，直接跳过；
+        遇到第一个左端点大于high的区间即停止，其后的区间左端点都更大。访问的节点都在通往某个结果的路径上，
+        耗时O(log n + k·log(n/k))，结果集中在一起时接近O(log n + k)。stab(point)即overlap(point, point)。
+
+    3、批量构建：
+        from_sorted由按(low, high)排序的区间以O(n)构建，构建时自底向上计算high。
+"""
+from RedBlackTree import RBNode, RBTree
+
+
+class IntervalNode(RBNode):
+    __slots__ = ('high',)
+
+    def __init__(self, value, left=None, right=None, father=None, color=0, payload=None):
+        """
+        区间树节点
+        :param value: 闭区间(low, high)
+        其余参数同RBNode。子树中区间右端点的最大值high由树维护。
+        """
+        RBNode.__init__(self, value, left, right, father, color, payload)
+        self.high = value[1]
+
+    def update(self):
+        """重新计算子树节点数与子树中区间右端点的最大值"""
+        left, right = self.left, self.right
+        self.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+        high = self.val[1]
+        if left and left.high > high:
+            high = left.high
+        if right and right.high > high:
+            high = right.high
+        self.high = high
+
+
+class IntervalTree(RBTree):
+    """区间树，值为闭区间(low, high)，映射模式下可为每个区间保存一个值"""
+    _node_class = IntervalNode
+
+    @classmethod
+    def from_sorted(cls, sortedCollection, payloads=None):
+        """
+        由按(low, high)排序的区间批量构建区间树，耗时O(n)
+        :param sortedCollection: 非递减的区间序列
+        :param payloads: 映射模式下与各区间一一对应的值序列，默认为空
+        """
+        return super().from_sorted([_interval(item) for item in sortedCollection], payloads)
+
+    def add(self, newValue, payload=None):
+        """
+        插入闭区间newValue
+        :param newValue: (low, high)，要求low <= high
+        :param payload: 映射模式下该区间对应的值
+        """
+        super().add(_interval(newValue), payload)
+
+    def overlap(self, low, high):
+        """惰性地按序生成与闭区间[low, high]相交的区间"""
+        for node in self._overlap_nodes(low, high):
+            yield node.val
+
+    def overlap_items(self, low, high):
+        """惰性地按序生成与闭区间[low, high]相交的(区间, 值)对"""
+        for node in self._overlap_nodes(low, high):
+            yield node.val, node.payload
+
+    def stab(self, point):
+        """惰性地按序生成包含point的区间"""
+        return self.overlap(point, point)
+
+    def _overlap_nodes(self, low, high):
+        """
+        惰性中序遍历与[low, high]相交的节点：
+            下行时跳过右端点最大值小于low的子树，遇到第一个左端点大于high的节点即停止；
+            栈中只保存通往下一个节点的路径。
+        """
+        stack = []
+        node = self.root.left
+        while True:
+            while node is not None and node.high >= low:  # 右端点最大值小于low的子树中没有相交的区间
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.val[0] > high:
+                return  # 其后区间的左端点均大于high
+            if node.val[1] >= low:
+                yield node
+            node = node.right
+
+
+def _interval(item):
+    """将item转换为区间元组，检查左右端点"""
+    low, high = item
+    if high < low:
+        raise ValueError('Interval (%r, %r) ends before it starts!' % (low, high))
+    return low, high
+
+
+if __name__ == '__main__':
+    tree = IntervalTree([(15, 20), (10, 30), (17, 19), (5, 20), (12, 15), (30, 40)])
+    tree.printTree()
+    print(list(tree.overlap(14, 16)), list(tree.stab(30)), list(tree.overlap(41, 50)))
+
+    meetings = IntervalTree.from_sorted([(9, 10), (9, 12), (11, 13), (14, 15)], ['standup', 'review', 'lunch', 'demo'])
+    print(list(meetings.overlap_items(10, 11)))
+    meetings.delete((9, 12))
+    print(list(meetings.stab(11)))
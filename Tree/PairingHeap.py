@@ -0,0 +1,250 @@
+"""
+@Date: 2026/10/17
+@Author: Chen Zhang
+@Brief: 配对堆 的实现
+
+配对堆：
+    一棵多叉树，每个节点都不排在其子节点之后。节点的子节点以链表相连：child 指向第一个子节点，sibling 指向下一个
+    兄弟节点，prev 指向前一个兄弟节点（第一个子节点的 prev 指向父节点），因此任一节点都能在 O(1) 内从树上剪下。
+    基本操作是 link：比较两棵树的根，把排在后面的根作为另一个根的第一个子节点，O(1)。
+        （1）add、meld（合并两个堆）：link，O(1)；
+        （2）pop：删除根，再把根的子树两两 link（从左到右一趟，再从右到左一趟），均摊 O(log n)；
+        （3）decrease_key：把节点剪下、修改值后与根 link，均摊不超过 O(log n)；
+        （4）remove(node)：把节点剪下，按 pop 的方式合并其子树后与根 link，均摊 O(log n)。
+    add 返回新节点，作为之后 decrease_key、remove 的句柄。
+"""
+from Heap import Heap, MaxHeap, MinHeap
+
+
+class PairingNode:
+    __slots__ = ('value', 'child', 'sibling', 'prev')
+
+    def __init__(self, value, child=None, sibling=None, prev=None):
+        """
+        :param value: 节点的值
+        :param child: 第一个子节点
+        :param sibling: 下一个兄弟节点
+        :param prev: 前一个兄弟节点，第一个子节点的 prev 为父节点
+        """
+        self.value = value
+        self.child = child
+        self.sibling = sibling
+        self.prev = prev
+
+    def __str__(self):
+        return str(self.value)
+
+
+class PairingHeap(Heap):
+    """配对堆的基类，与 MinHeap 或 MaxHeap 组合使用，由后者决定值的顺序；top 为根节点"""
+    def __init__(self, sourceCollection=None):
+        super().__init__()
+
+        if sourceCollection:
+            self.extend(sourceCollection)
+
+    def __iter__(self):
+        """Iterate over the values of self, in preorder"""
+        stack = [self._top] if self._top else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.sibling:
+                stack.append(node.sibling)
+            if node.child:
+                stack.append(node.child)
+
+    def __str__(self):
+        """Return string of self"""
+        if self.is_Empty():
+            return '[]'
+        return 'Contents of Heap: [' + ', '.join(map(str, self)) + ']' + '\n'
+
+    def draw(self):
+        """Print the tree of self, a child indented under its father"""
+        if self.is_Empty():
+            print('Heap is empty!')
+            print()
+            return
+        print('=' * 50)
+        print('PairingHeap')
+        stack = [(self._top, 0)]
+        while stack:
+            node, height = stack.pop()
+            print('    ' * height + str(node.value))
+            if node.sibling:
+                stack.append((node.sibling, height))
+            if node.child:
+                stack.append((node.child, height + 1))
+        print('=' * 50)
+
+    def add(self, newValue):
+        """Add newValue to heap, and return its node"""
+        node = PairingNode(newValue)
+        self._top = self._link(self._top, node)
+        self._size += 1
+        return node
+
+    def extend(self, values):
+        """Add every value in values to heap"""
+        for value in values:
+            self.add(value)
+
+    def meld(self, other):
+        """Move every node of other, a heap of the same order, into self in O(1); other becomes empty"""
+        if type(other) is not type(self):
+            raise TypeError('Can only meld a %s into a %s!' % (type(self).__name__, type(self).__name__))
+        if other is self:
+            return
+        self._top = self._link(self._top, other._top)
+        self._size += other._size
+        other.clear()
+
+    def delete(self, target):
+        """Delete a node of value target from heap"""
+        node = self.find(target)
+        if node is None:
+            raise ValueError('Not Found!')
+        self.remove(node)
+
+    def find(self, value):
+        """Return a node of value, or None if it is not in heap"""
+        if self.is_Empty() or self._precedes(value, self._top.value):
+            return None
+        stack = [self._top]
+        while stack:
+            node = stack.pop()
+            if node.value == value:
+                return node
+            if node.sibling:
+                stack.append(node.sibling)
+            # 子节点都不排在 node 之前，若 value 排在 node 之前则不必进入其子树
+            if node.child and not self._precedes(value, node.value):
+                stack.append(node.child)
+        return None
+
+    def peek(self):
+        """Return the value at the top of heap"""
+        if self.is_Empty():
+            raise ValueError('Heap is empty!')
+        return self._top.value
+
+    def pop(self):
+        """Remove and return the value at the top of heap"""
+        if self.is_Empty():
+            raise ValueError('Heap is empty!')
+        root = self._top
+        self._top = self._merge_pairs(root.child)
+        self._size -= 1
+        root.child = None
+        return root.value
+
+    def pushpop(self, newValue):
+        """Add newValue, then remove and return the top value"""
+        if self.is_Empty() or not self._precedes(self._top.value, newValue):
+            return newValue
+        value = self.pop()
+        self.add(newValue)
+        return value
+
+    def replace(self, newValue):
+        """Remove and return the top value, then add newValue"""
+        value = self.pop()
+        self.add(newValue)
+        return value
+
+    def decrease_key(self, node, newValue):
+        """Change the value of node to newValue, which must not come after its old value in the order of heap"""
+        if self._precedes(node.value, newValue):
+            raise ValueError('New value %r comes after old value %r!' % (newValue, node.value))
+        node.value = newValue
+        if node is not self._top:
+            self._cut(node)
+            self._top = self._link(self._top, node)
+
+    def remove(self, node):
+        """Remove node from heap, and return its value"""
+        if node is self._top:
+            return self.pop()
+        self._cut(node)
+        self._top = self._link(self._top, self._merge_pairs(node.child))
+        self._size -= 1
+        node.child = None
+        return node.value
+
+    def clear(self):
+        """Reset self"""
+        super().clear()
+        self._top = None
+
+    def _link(self, root1, root2):
+        """Link two detached trees, making the root that comes later the first child of the other; return the root"""
+        if root1 is None:
+            return root2
+        if root2 is None:
+            return root1
+        if self._precedes(root2.value, root1.value):
+            root1, root2 = root2, root1
+        root2.prev = root1
+        root2.sibling = root1.child
+        if root1.child:
+            root1.child.prev = root2
+        root1.child = root2
+        return root1
+
+    def _merge_pairs(self, first):
+        """
+        Link the sibling list starting at first into one tree: pair them from left to right, then link the pairs from
+        right to left. Return the root
+        """
+        pairs = []
+        while first:
+            second = first.sibling
+            following = second.sibling if second else None
+            first.prev = first.sibling = None
+            if second:
+                second.prev = second.sibling = None
+            pairs.append(self._link(first, second))
+            first = following
+        root = None
+        while pairs:
+            root = self._link(pairs.pop(), root)
+        return root
+
+    def _cut(self, node):
+        """Detach the subtree of node, which is not the root, from its father and siblings"""
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling:
+            node.sibling.prev = node.prev
+        node.prev = node.sibling = None
+
+
+class PairingMinHeap(PairingHeap, MinHeap):
+    """小顶配对堆"""
+    pass
+
+
+class PairingMaxHeap(PairingHeap, MaxHeap):
+    """大顶配对堆"""
+    pass
+
+
+if __name__ == '__main__':
+    test_list = [3, 7, 1, 4, 5, 6, 2, 8, 9, 10, 11, 12]
+
+    heap = PairingMinHeap(test_list)
+    heap.draw()
+    print(heap)
+
+    shard = PairingMinHeap([0, 13])
+    node = shard.add(20)
+    heap.meld(shard)
+    heap.decrease_key(node, -1)
+    heap.delete(7)
+    print(len(heap), len(shard), [heap.pop() for _ in range(len(heap))])
+
+    heap = PairingMaxHeap(test_list)
+    print(heap.pop(), heap.pushpop(0), heap.replace(13), heap.peek())
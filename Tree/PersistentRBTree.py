@@ -0,0 +1,299 @@
+"""
+@Date: 2026/10/17
+@Author: Chen Zhang
+@Brief: 持久化（写时复制）红黑树
+
+持久化红黑树概述：
+    1、路径复制：
+        插入、删除与修改值时不改动任何已有节点，而是复制自根节点到目标位置路径上的节点（以及修复时涉及的兄弟节点），
+        新旧两个版本共享其余的子树，每次更新只新建O(log n)个节点。
+
+    2、快照：
+        snapshot()只复制对根节点的引用，耗时O(1)。树中的节点一经创建便不再改变，因此读者可以在不加锁的情况下遍历快照，
+        写者同时更新原树也不会影响快照的内容。节点没有父节点指针，旧版本中不再被任何快照引用的节点随引用计数归零而释放。
+
+    3、实现：
+        插入为Okasaki的函数式插入，删除为Kahrs的函数式删除，二者均以balance消除相邻的红色节点；
+        join沿较高树的边缘复制节点下行到黑高相同处，接入红色的中间节点后同样以balance修复，耗时O(log n)；
+        split沿分裂键复制路径，将路径两侧挂下的子树逐个join到左右两棵树中，耗时O(log n)；
+        查询（find、range、floor、select、rank等）直接沿用RBTree的实现。
+"""
+from RedBlackTree import RBNode, RBTree, _black_height
+
+RED, BLACK = 0, 1
+
+
+class PersistentRBTree(RBTree):
+    """路径复制的持久化红黑树，节点创建后不再修改，father恒为空"""
+
+    @classmethod
+    def from_sorted(cls, sortedCollection, payloads=None):
+        """由有序序列批量构建，耗时O(n)；构建后去掉父节点指针，以免新旧版本的节点互相引用"""
+        tree = super().from_sorted(sortedCollection, payloads)
+        stack = [tree.root.left] if tree.root.left else []
+        while stack:
+            node = stack.pop()
+            node.father = None
+            stack.extend(child for child in (node.left, node.right) if child)
+        return tree
+
+    def snapshot(self):
+        """返回当前版本的只读视图，耗时O(1)；对快照的修改同样以路径复制进行，不会影响self"""
+        view = type(self)()
+        view.root.left = self.root.left
+        view._size = self._size
+        return view
+
+    def add(self, newValue, payload=None):
+        """插入newValue，只复制插入路径上的节点"""
+        self.__publish(_blacken(_insert(self.root.left, newValue, payload)))
+        self._size += 1
+
+    def delete(self, value):
+        """删除一个值为value的节点，只复制删除路径上的节点与修复涉及的兄弟节点"""
+        if self.find(value) == -1:
+            raise ValueError('Not Found!')
+        self.__publish(_blacken(_delete(self.root.left, value)))
+        self._size -= 1
+
+    def __setitem__(self, key, value):
+        if self.find(key) == -1:
+            self.add(key, value)
+        else:
+            self.__publish(_assign(self.root.left, key, value))
+
+    def join(self, other):
+        """
+        将other中的值全部并入self，耗时O(log n)，other随后为空；两棵树的旧快照均不受影响
+        :param other: PersistentRBTree，其中的值均不小于self中的值
+        """
+        if not isinstance(other, PersistentRBTree):
+            raise TypeError('Can only join a PersistentRBTree!')
+        if other is self or not other.root.left:
+            return
+        if self.root.left and other.min() < self.max():
+            raise ValueError('Values of other must not be below values of self!')
+        # 取出other的最小值作为连接两棵树的中间节点
+        middle = other.root.left
+        while middle.left:
+            middle = middle.left
+        right = _blacken(_delete(other.root.left, middle.val))
+        left = self.root.left
+        root = _join(left, _black_height(left), middle, right, _black_height(right))[0]
+        self.__publish(root)
+        self._size = root.size
+        other.__publish(None)
+        other._size = 0
+
+    def split(self, key):
+        """
+        将self分裂为小于key与不小于key的两棵树并返回，耗时O(log n)，self随后为空
+        两棵新树与self的旧快照共享节点。
+        """
+        node = self.root.left
+        left, right = type(self)(), type(self)()
+        for tree, root in zip((left, right), _split(node, _black_height(node), key)[::2]):
+            tree.__publish(root)
+            tree._size = root.size if root else 0
+        self.__publish(None)
+        self._size = 0
+        return left, right
+
+    def __publish(self, node):
+        """以node为根节点发布新版本；只替换head的引用，不设置node的父节点"""
+        self.root.left = node
+
+
+def _red(node):
+    return node is not None and node.color == RED
+
+
+def _make(color, left, source, right):
+    """以source的值新建节点，left与right为其子节点"""
+    node = RBNode(source.val, left, right, color=color, payload=source.payload)
+    node.update()
+    return node
+
+
+def _blacken(node):
+    """根节点染黑"""
+    if node is None or node.color == BLACK:
+        return node
+    return _make(BLACK, node.left, node, node.right)
+
+
+def _balance(left, source, right):
+    """以source的值连接left与right；若存在相邻的红色节点，则旋转为红色根节点与两个黑色子节点"""
+    if _red(left) and _red(right):
+        return _make(RED, _make(BLACK, left.left, left, left.right), source,
+                     _make(BLACK, right.left, right, right.right))
+    if _red(left):
+        if _red(left.left):
+            return _make(RED, _make(BLACK, left.left.left, left.left, left.left.right), left,
+                         _make(BLACK, left.right, source, right))
+        if _red(left.right):
+            return _make(RED, _make(BLACK, left.left, left, left.right.left), left.right,
+                         _make(BLACK, left.right.right, source, right))
+    if _red(right):
+        if _red(right.right):
+            return _make(RED, _make(BLACK, left, source, right.left), right,
+                         _make(BLACK, right.right.left, right.right, right.right.right))
+        if _red(right.left):
+            return _make(RED, _make(BLACK, left, source, right.left.left), right.left,
+                         _make(BLACK, right.left.right, right, right.right))
+    return _make(BLACK, left, source, right)
+
+
+def _insert(node, value, payload):
+    """返回插入value后的子树，值相等时插入左子树，与RBTree.add一致"""
+    if node is None:
+        return RBNode(value, payload=payload)
+    if node.color == BLACK:
+        if node.val >= value:
+            return _balance(_insert(node.left, value, payload), node, node.right)
+        return _balance(node.left, node, _insert(node.right, value, payload))
+    if node.val >= value:
+        return _make(RED, _insert(node.left, value, payload), node, node.right)
+    return _make(RED, node.left, node, _insert(node.right, value, payload))
+
+
+def _assign(node, key, payload):
+    """返回将key对应的值改为payload后的子树，只复制查找路径上的节点"""
+    if key == node.val:
+        copy = _make(node.color, node.left, node, node.right)
+        copy.payload = payload
+        return copy
+    if key < node.val:
+        return _make(node.color, _assign(node.left, key, payload), node, node.right)
+    return _make(node.color, node.left, node, _assign(node.right, key, payload))
+
+
+def _delete(node, value):
+    """
+    返回删除value后的子树，value必须在子树中
+    若node为黑色，则返回的子树黑高减一（根节点可能为红色）。
+    """
+    if value < node.val:
+        if node.left.color == BLACK:
+            return _balance_left(_delete(node.left, value), node, node.right)
+        return _make(RED, _delete(node.left, value), node, node.right)
+    if node.val < value:
+        if node.right.color == BLACK:
+            return _balance_right(node.left, node, _delete(node.right, value))
+        return _make(RED, node.left, node, _delete(node.right, value))
+    return _append(node.left, node.right)
+
+
+def _balance_left(left, source, right):
+    """左子树的黑高比右子树少一，修复后返回"""
+    if _red(left):
+        return _make(RED, _make(BLACK, left.left, left, left.right), source, right)
+    if right.color == BLACK:
+        return _balance(left, source, _make(RED, right.left, right, right.right))
+    # 右子树为红色，其左子节点为黑色
+    return _make(RED, _make(BLACK, left, source, right.left.left), right.left,
+                 _balance(right.left.right, right, _red_copy(right.right)))
+
+
+def _balance_right(left, source, right):
+    """右子树的黑高比左子树少一，修复后返回"""
+    if _red(right):
+        return _make(RED, left, source, _make(BLACK, right.left, right, right.right))
+    if left.color == BLACK:
+        return _balance(_make(RED, left.left, left, left.right), source, right)
+    # 左子树为红色，其右子节点为黑色
+    return _make(RED, _balance(_red_copy(left.left), left, left.right.left), left.right,
+                 _make(BLACK, left.right.right, source, right))
+
+
+def _join(left, left_height, source, right, right_height):
+    """
+    以source的值连接两棵子树（left中的值均不大于source，right中的值均不小于source），返回(黑色根节点, 黑高)
+    两棵子树的根节点先染黑，连接处只可能出现balance可以消除的相邻红色节点。
+    """
+    if _red(left):
+        left, left_height = _blacken(left), left_height + 1
+    if _red(right):
+        right, right_height = _blacken(right), right_height + 1
+    if left_height >= right_height:
+        node = _join_right(left, left_height, source, right, right_height)
+    else:
+        node = _join_left(left, left_height, source, right, right_height)
+    height = max(left_height, right_height)
+    if node.color == RED:
+        return _blacken(node), height + 1
+    return node, height
+
+
+def _join_right(left, height, source, right, right_height):
+    """沿left的右边缘下行到黑高为right_height的黑色节点，以红色的source连接该节点与right"""
+    if height == right_height and not _red(left):
+        return _make(RED, left, source, right)
+    if left.color == RED:
+        return _make(RED, left.left, left, _join_right(left.right, height, source, right, right_height))
+    return _balance(left.left, left, _join_right(left.right, height - 1, source, right, right_height))
+
+
+def _join_left(left, left_height, source, right, height):
+    """沿right的左边缘下行到黑高为left_height的黑色节点，以红色的source连接left与该节点"""
+    if height == left_height and not _red(right):
+        return _make(RED, left, source, right)
+    if right.color == RED:
+        return _make(RED, _join_left(left, left_height, source, right.left, height), right, right.right)
+    return _balance(_join_left(left, left_height, source, right.left, height - 1), right, right.right)
+
+
+def _split(node, height, key):
+    """返回(小于key的子树, 其黑高, 不小于key的子树, 其黑高)，height为node的黑高"""
+    if node is None:
+        return None, 0, None, 0
+    child_height = height - node.color
+    if node.val < key:  # 该节点及其左子树归入左树，继续分裂右子树
+        left, left_height, right, right_height = _split(node.right, child_height, key)
+        left, left_height = _join(node.left, child_height, node, left, left_height)
+        return left, left_height, right, right_height
+    left, left_height, right, right_height = _split(node.left, child_height, key)
+    right, right_height = _join(right, right_height, node, node.right, child_height)
+    return left, left_height, right, right_height
+
+
+def _red_copy(node):
+    """返回黑色节点node染红后的副本"""
+    return _make(RED, node.left, node, node.right)
+
+
+def _append(left, right):
+    """连接两棵黑高相同的子树（left中的值均不大于right中的值），返回连接后的子树"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.color == RED and right.color == RED:
+        middle = _append(left.right, right.left)
+        if _red(middle):
+            return _make(RED, _make(RED, left.left, left, middle.left), middle,
+                         _make(RED, middle.right, right, right.right))
+        return _make(RED, left.left, left, _make(RED, middle, right, right.right))
+    if left.color == BLACK and right.color == BLACK:
+        middle = _append(left.right, right.left)
+        if _red(middle):
+            return _make(RED, _make(BLACK, left.left, left, middle.left), middle,
+                         _make(BLACK, middle.right, right, right.right))
+        return _balance_left(left.left, left, _make(BLACK, middle, right, right.right))
+    if right.color == RED:
+        return _make(RED, _append(left, right.left), right, right.right)
+    return _make(RED, left.left, left, _append(left.right, right))
+
+
+if __name__ == '__main__':
+    tree = PersistentRBTree(list(range(1, 9)))
+    before = tree.snapshot()
+    tree.delete(4)
+    tree.add(10)
+    tree[2] = 'two'
+    print(list(before), list(tree), before.get(2), tree.get(2))
+    low, high = tree.split(5)
+    low.join(high)
+    print(list(low), list(before))
+    before.printTree()
+    tree.printTree()
@@ -21,80 +21,53 @@
     3、红黑树修复常用操作：
         （1）颜色转变；
         （2）子树旋转
+
+    4、顺序统计：
+        每个节点记录以其为根的子树的节点数size，插入、删除时沿路径、旋转时对两个旋转的节点调用RBNode.update()重新计算，
+        因此select(k)（第k小的值）、rank(x)（小于x的值的个数）与count_range(lo, hi)均只需自根向下走一条路径，耗时O(log n)。
+
+    5、批量构建、合并与分裂：
+        （1）from_sorted：以有序序列的中点为根递归构建，除最后一层（不满的一层）的节点为红色外均为黑色，耗时O(n)；
+        （2）join：以一个中间节点连接黑高不同的两棵树，沿较高树的边缘下行到黑高相同的黑色节点处，接入红色的中间节点后
+            按插入修复，耗时O(log n)；
+        （3）split：自根向下沿分裂键走一条路径，路径两侧挂下的子树自下而上逐个join到左右两棵树中，耗时O(log n)。
 """
 
 
 class RBNode:
+    __slots__ = ('val', 'left', 'right', 'father', 'color', 'payload', 'size')
 
-    def __init__(self, value, left=None, right=None, father=None, color=0):
+    def __init__(self, value, left=None, right=None, father=None, color=0, payload=None):
         """
         红黑节点对象构造函数
+        各字段均为普通属性，直接读写，不经过property。
+        :param value: 节点的值，即排序键。
         :param left: BRNode, 左子节点。默认为空。
         :param right: BRNode, 右子节点。默认为空。
         :param father: BRNode，父节点。默认为空。
         :param color: 0或1。0代表红色，1代表黑色。默认为红色。
+        :param payload: 映射模式下键对应的值。默认为空。
+        子树节点数size由树维护，新节点为1。
         """
-        if left:
-            assert isinstance(left, RBNode)
-        if right:
-            assert isinstance(right, RBNode)
-        if father:
-            assert isinstance(father, RBNode)
-        if color:
-            assert (color == 0 or color == 1)
-        self.__value = value
-        self.__left = left
-        self.__right = right
-        self.__father = father
-        self.__color = color
-
-    @property
-    def val(self):
-        return self.__value
-
-    @val.setter
-    def val(self, value):
-        self.__value = value
-
-    @property
-    def left(self):
-        return self.__left
-
-    @left.setter
-    def left(self, node):
-        if node is not None:
-            assert isinstance(node, RBNode)
-        self.__left = node
-
-    @property
-    def right(self):
-        return self.__right
-
-    @right.setter
-    def right(self, node):
-        if node is not None:
-            assert isinstance(node, RBNode)
-        self.__right = node
-
-    @property
-    def father(self):
-        return self.__father
-
-    @father.setter
-    def father(self, node):
-        if node:
-            assert isinstance(node, RBNode)
-        self.__father = node
-
-    @property
-    def color(self):
-        return self.__color
+        self.val = value
+        self.left = left
+        self.right = right
+        self.father = father
+        self.color = color
+        self.payload = payload
+        self.size = 1
+
+    def update(self):
+        """子节点改变后（如旋转后）重新计算以该节点为根的子树的附加信息，即子树节点数"""
+        left, right = self.left, self.right
+        self.size = 1 + (left.size if left else 0) + (right.size if right else 0)
 
     def change_color(self):
-        self.__color = 1 - self.__color
+        self.color = 1 - self.color
 
 
 class RBTree:
+    _node_class = RBNode  # 节点类型，子类可换成带有其他附加信息的RBNode子类
 
     def __init__(self, sourceCollection=None):
         """
@@ -102,13 +75,51 @@ class RBTree:
         :param sourceCollection: 初始参数集，默认为空
         """
         self.__root = RBNode('head', color=1)  # 在根节点前面加一个黑色的head节点，为了在根节点发生旋转时不丢失对根节点的引用
-        self.__size = 0
+        self._size = 0
 
         if sourceCollection:
             assert isinstance(sourceCollection, list)
             for item in sourceCollection:
                 self.add(item)
 
+    @classmethod
+    def from_sorted(cls, sortedCollection, payloads=None):
+        """
+        由有序序列批量构建红黑树，耗时O(n)，不做逐个插入的修复操作
+        :param sortedCollection: 非递减的值序列
+        :param payloads: 映射模式下与各值一一对应的值序列，默认为空
+        """
+        values = list(sortedCollection)
+        payloads = [None] * len(values) if payloads is None else list(payloads)
+        if len(payloads) != len(values):
+            raise ValueError('Payloads do not match values!')
+        for index in range(1, len(values)):
+            if values[index] < values[index - 1]:
+                raise ValueError('Values are not sorted!')
+
+        tree = cls()
+        if values:
+            red_depth = (len(values) + 1).bit_length() - 1  # 前red_depth层是满的，更深一层的节点为红色
+            tree.root = cls.__build(values, payloads, 0, len(values), 0, red_depth)
+            tree._size = len(values)
+        return tree
+
+    @classmethod
+    def __build(cls, values, payloads, lo, hi, depth, red_depth):
+        """以values[lo:hi]的中点为根构建子树，返回其根节点"""
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = cls._node_class(values[mid], color=0 if depth == red_depth else 1, payload=payloads[mid])
+        node.left = cls.__build(values, payloads, lo, mid, depth + 1, red_depth)
+        node.right = cls.__build(values, payloads, mid + 1, hi, depth + 1, red_depth)
+        if node.left:
+            node.left.father = node
+        if node.right:
+            node.right.father = node
+        node.update()
+        return node
+
     def printTree(self):
         """直观打印二叉树"""
         if not self.root.left:
@@ -134,42 +145,37 @@ class RBTree:
         print(" " * height * length + res)
         self.__printInorder(root.left, height + 1, '^', length)
 
-    def __iter__(self):
-        """中序遍历"""
-        def recurse(node):
-            if node.left:
-                recurse(node.left)
-            yield node
-            if node.right:
-                recurse(node.right)
+    def __len__(self):
+        return self._size
 
-        if self.root.left:
-            recurse(self.root.left)
+    def __iter__(self):
+        """中序遍历，惰性地依次生成各节点的值"""
+        return self.range()
 
     def __contains__(self, item):
         return not (self.find(item) == -1)
 
     def find(self, item):
+        """返回值为item的节点，不存在时返回-1"""
         if self.root.left is None:
-            pass
-        else:
-            cursor = self.root.left
-            assert isinstance(item, type(cursor.val)), 'Different type!'
-            while True:
-                if item == cursor.val:
-                    return cursor
-                elif item < cursor.val:
-                    if cursor.left:
-                        cursor = cursor.left
-                    else:
-                        return -1
+            return -1
+        cursor = self.root.left
+        assert isinstance(item, type(cursor.val)), 'Different type!'
+        while True:
+            if item == cursor.val:
+                return cursor
+            elif item < cursor.val:
+                if cursor.left:
+                    cursor = cursor.left
                 else:
-                    if cursor.right:
-                        cursor = cursor.right
-                    else:
-                        return -1
+                    return -1
+            else:
+                if cursor.right:
+                    cursor = cursor.right
+                else:
+                    return -1
 
-    def add(self, newValue):
+    def add(self, newValue, payload=None):
         """
         红黑树插入：
             每个新插入的节点都是红色。
@@ -197,195 +203,203 @@ class RBTree:
                         i.以新插入节点为基准，右旋（顺时针）以新插入节点的父节点为根节点的子树
                         ii.再应用右右的情况
 
-        :param newValue: RBNode，新插入的值
+        :param newValue: 新插入的值
+        :param payload: 映射模式下newValue对应的值
         """
         # 构造红黑树节点
-        newNode = RBNode(newValue)
-
-        # 红黑树为空
-        if not self.root.left:
-            self.root.left = newNode
-            self.root.left.father = self.root
-        # 红黑树不为空
-        else:
-            cursor = self.root.left  # 辅助指针
-            # 插入操作
-            while True:
-                if cursor.val >= newNode.val:  # 搜索左子树
-                    if not cursor.left:
-                        cursor.left = newNode
-                        newNode.father = cursor
-                        cursor = cursor.left
-                        break
-                    cursor = cursor.left
-                else:
-                    if not cursor.right:
-                        cursor.right = newNode
-                        newNode.father = cursor
-                        cursor = cursor.right
-                        break
-                    cursor = cursor.right
-            # 修复操作
-            while cursor.father != self.root and cursor.father.father != self.root:  # 修复节点不是根节点，也不是根节点的子节点
-                self.AddReBalance(cursor)
-                cursor = cursor.father
-            if self.root.left.color == 0:
-                self.root.left.change_color()
-        self.__size += 1
+        newNode = self._node_class(newValue, payload=payload)
+
+        # 自head节点向下搜索插入位置，值相等时插入左子树
+        cursor = self.root
+        while True:
+            if cursor is self.root or cursor.val >= newValue:
+                if not cursor.left:
+                    cursor.left = newNode
+                    break
+                cursor = cursor.left
+            else:
+                if not cursor.right:
+                    cursor.right = newNode
+                    break
+                cursor = cursor.right
+        newNode.father = cursor
+        self.__update_path(cursor)
+        self.AddReBalance(newNode)
+        self._size += 1
 
     def delete(self, value):
         """
         红黑树删除：
-            （1）被删除节点无子节点时：
-                1） 若被删除节点是红色，则直接删除即可，不会影响黑色节点数量；
-                2） 若被删除节点是黑色，则删除后需要分为9种情况进行修复：
-                    父亲为红色：
-                    情况1 父亲为红色，兄弟为黑色且有两个子节点
-                        - 左旋父节点
-                        - 将父节点、兄弟节点、兄弟的右子节点变色
-                    情况2 父亲为红色，兄弟为黑色且只有一个左子节点
-                        - 右旋兄弟节点
-                        - 将兄弟节点与兄弟的左子节点变色
-                        - 左旋父节点
-                    情况3 父亲为红色，兄弟为黑色且只有一个右子节点
-                        - 左旋父节点
-                    情况4 父亲为红色，兄弟为黑色且没有子节点
-                        - 将父亲节点与兄弟节点变色。
-
-                    父亲为黑色：
-                    情况5 父亲为黑色，兄弟为红色且有两个黑色子节点
-                        - 左旋父节点
-                        - 将兄弟节点与兄弟节点的左子节点变色
-                    情况6 父亲为黑色，兄弟为黑色且有两个子节点
-                        - 左旋父节点
-                        - 将兄弟节点的右子节点变色
-                    情况7 父亲为黑色，兄弟为黑色且只有一个左子节点
-                        - 右旋兄弟节点
-                        - 左旋父节点
-                        - 将兄弟节点的左子节点变色
-                    情况8 父亲为黑色，兄弟为黑色且只有一个右子节点
-                        - 左旋父节点
-                        - 将兄弟节点的右子节点变色
-                    情况9 父亲为黑色，兄弟为黑色且没有子节点
-                        - 将兄弟节点、父节点的兄弟节点变色
+            （1）被删除节点有两个子节点时：
+                将被删节点与其后继节点的值互换，转化为删除其后继节点，即只有一个子节点或没有子节点的情况
 
             （2）被删除节点有一个子节点时：
-                将被删节点与其子节点的值互换，转化为删除其子节点，即没有子节点的节点的情况
+                该子节点必为红色叶子节点，将被删节点与其子节点的值互换，转化为删除其子节点，即没有子节点的情况
 
-            （3）被删除节点有两个子节点时：
-                将被删节点与其后继节点的值互换，转化为删除其后继节点，即只有一个子节点或没有子节点的情况
+            （3）被删除节点无子节点时：
+                1） 若被删除节点是红色或根节点，则直接删除即可，不会影响黑色节点数量；
+                2） 若被删除节点是黑色，则删除后其所在位置缺少一个黑色节点，由DeleteReBalance修复
 
         :param value: 待删的值
-        :return:
         """
         node = self.find(value)
         if node == -1:
             raise ValueError('Not Found!')
+        self.__remove(node)
 
+    def __remove(self, node):
+        """删除节点node所在位置的值"""
         # 待删节点有两个子节点，则与后继节点互换值，并取后继节点为新的待删节点
         if node.left and node.right:
             cursor = node.right
             while cursor.left:
                 cursor = cursor.left
-            node.val, cursor.val = cursor.val, node.val
+            self.__swap(node, cursor)
             node = cursor
 
         # 待删节点有一个子节点，则与子节点互换值，并取子节点为新的待删节点
         if node.left or node.right:
-            if node.left:
-                node.val, node.left.val = node.left.val, node.val
-                node = node.left
-            else:
-                node.val, node.right.val = node.right.val, node.val
-                node = node.right
-
-        # 待删节点无子节点
-        # 若为根节点，则直接释放
-        if node == self.root.left:
-            self.root.left.father = None
-            self.root.left = None
+            child = node.left if node.left else node.right
+            self.__swap(node, child)
+            node = child
+
+        # 待删节点无子节点，直接删除
+        father = node.father
+        if node == father.left:
+            father.left = None
+        else:
+            father.right = None
+        node.father = None
+        self.__update_path(father)
 
-        # 若待删除节点为红色，则直接删除
-        elif node.color == 0:
-            if node == node.father.left:
-                node.father.left = node.father = None
-            else:
-                node.father.right = node.father = None
+        # 若删除的是黑色的非根节点，则修复其所在位置
+        if node.color == 1 and father != self.root:
+            self.DeleteReBalance(father)
 
-        # 若待删除节点为黑色
-        else:
-            target = RBTools(node)  # 搭建工作平台
+        self._size -= 1
 
-            # 直接删除待删节点
-            if target.me == target.father.left:
-                target.me.father = target.father.left = None
-            else:
-                target.me.father = target.father.right = None
-
-            # 父节点为红色
-            if target.father.color == 0:
-                # 情况1：父红，兄黑，兄双子（红）
-                if target.brother is not None and target.brother.left and target.brother.right:
-                    father_target = RBTools(target.father)
-                    father_target.rotate_l()
-                    target.father.change_color()
-                    target.brother.change_color()
-                    target.brother.right.change_color()
-                elif target.brother is not None and (target.brother.left or target.brother.right):
-                    # 情况2：父红，兄黑，兄左子红
-                    if target.brother.left:
-                        brother_target = RBTools(target.brother)
-                        brother_target.rotate_r()
-                        target.brother.change_color()
-                        target.brother.father.change_color()  # 原兄弟节点的左子节点变色
-                        father_target = RBTools(target.father)
-                        father_target.rotate_l()
-                    # 情况3：父红，兄黑，兄右子红
-                    else:
-                        father_target = RBTools(target.father)
-                        father_target.rotate_l()
-                # 情况4：父红，兄黑，兄无子
-                else:
-                    target.father.change_color()
-                    target.brother.change_color()
-            # 父节点为黑色
+    def join(self, other):
+        """
+        将other中的值全部并入self，耗时O(log n)，other随后为空
+        也可写作RBTree.join(t1, t2)。
+        :param other: RBTree，其中的值均不小于self中的值
+        """
+        if other is self or not other.root.left:
+            return
+        if self.root.left and other.min() < self.max():
+            raise ValueError('Values of other must not be below values of self!')
+        # 取出other的最小值作为连接两棵树的中间节点
+        cursor = other.root.left
+        while cursor.left:
+            cursor = cursor.left
+        middle = self._node_class(cursor.val, payload=cursor.payload)
+        other.__remove(cursor)
+        left, right = self.__detach(), other.__detach()
+        self.__join(left, _black_height(left), middle, right, _black_height(right))
+
+    def split(self, key):
+        """
+        将self分裂为小于key与不小于key的两棵树并返回，耗时O(log n)，self随后为空
+        也可写作RBTree.split(tree, key)。
+        """
+        # 自根向下沿key走一条路径，记录路径上的节点、挂在路径外侧的子树及其黑高
+        path = []
+        node = self.root.left
+        height = _black_height(node)
+        while node is not None:
+            if node.val < key:  # 该节点及其左子树归入左树，继续搜索右子树
+                side, subtree, following = 0, node.left, node.right
+            else:  # 该节点及其右子树归入右树，继续搜索左子树
+                side, subtree, following = 1, node.right, node.left
+            height -= node.color  # 子节点的黑高
+            subtree_height = height
+            if subtree is not None:
+                subtree.father = None
+                if subtree.color == 0:  # 子树根节点染黑，黑高加一
+                    subtree.color = 1
+                    subtree_height += 1
+            path.append((node, side, subtree, subtree_height))
+            node = following
+        self.__detach()
+
+        # 自下而上将路径上的节点连同其子树逐个连接到左右两棵树中
+        left, right = type(self)(), type(self)()
+        left_height = right_height = 0
+        for node, side, subtree, subtree_height in reversed(path):
+            node.left = node.right = node.father = None
+            if side == 0:
+                left_height = left.__join(subtree, subtree_height, node, left.__detach(), left_height)
             else:
-                # 情况5：父黑，兄红（兄双子黑）
-                if target.brother and target.brother.color == 0:
-                    father_target = RBTools(target.father)
-                    father_target.rotate_l()
-                    target.brother.change_color()
-                    target.father.right.change_color()
-                # 情况6：父黑，兄黑，兄双子（红）
-                elif target.brother and target.brother.color == 1 and target.brother.left and target.brother.right:
-                    father_target = RBTools(target.father)
-                    father_target.rotate_l()
-                    target.brother.right.change_color()
-                elif target.brother and target.brother.color == 1 and (target.brother.left or target.brother.right):
-                    # 情况7：父黑，兄黑，兄左子（红）
-                    if target.brother.left:
-                        brother_target = RBTools(target.brother)
-                        brother_target.rotate_r()
-                        father_target = RBTools(target.father)
-                        father_target.rotate_l()
-                        target.father.father.change_color()
-                    # 情况8：父黑，兄黑，兄右子（红）
-                    else:
-                        father_target = RBTools(target.father)
-                        father_target.rotate_l()
-                        target.brother.right.change_color()
-                # 情况9：父黑，兄黑，兄无子
-                else:
-                    target.brother.change_color()
-                    # 父亲的兄弟节点变色
-                    if target.father == target.grandfather.left and target.grandfather.right:
-                        target.grandfather.right.change_color()
-                    elif target.father == target.grandfather.right and target.grandfather.left:
-                        target.grandfather.left.change_color()
-                    else:
-                        pass
+                right_height = right.__join(right.__detach(), right_height, node, subtree, subtree_height)
+        return left, right
+
+    def __detach(self):
+        """取下并返回根节点，self随后为空"""
+        node = self.root.left
+        self.root.left = None
+        self._size = 0
+        if node is not None:
+            node.father = None
+        return node
 
-        self.__size -= 1
+    def __join(self, left, left_height, middle, right, right_height):
+        """
+        以middle连接两棵子树作为self的树，返回其黑高
+        :param left: 左子树的黑色根节点或None，其中的值均不大于middle
+        :param left_height: 左子树的黑高
+        :param middle: 不在任何树中的节点
+        :param right: 右子树的黑色根节点或None，其中的值均不小于middle
+        :param right_height: 右子树的黑高
+        """
+        middle.color = 0
+        if left_height == right_height:  # 黑高相同：middle作为黑色的根节点
+            middle.left, middle.right = left, right
+            if left:
+                left.father = middle
+            if right:
+                right.father = middle
+            middle.update()
+            self.root = middle
+            middle.color = 1
+            self._size = middle.size
+            return left_height + 1
+
+        # 沿较高的树靠近另一棵树的边缘下行，直到黑高与较矮的树相同的黑色节点（或空位）
+        high = left_height > right_height
+        cursor, father = (left, None) if high else (right, None)
+        height, low_height = max(left_height, right_height), min(left_height, right_height)
+        while cursor is not None and (cursor.color == 0 or height > low_height):
+            height -= cursor.color
+            father, cursor = cursor, (cursor.right if high else cursor.left)
+
+        # 以红色的middle代替该节点，该节点与较矮的树作为middle的子树
+        self.root = left if high else right
+        middle.left, middle.right = (cursor, right) if high else (left, cursor)
+        for child in (middle.left, middle.right):
+            if child:
+                child.father = middle
+        middle.update()
+        if high:
+            father.right = middle
+        else:
+            father.left = middle
+        middle.father = father
+        self.__update_path(father)
+        grown = self.AddReBalance(middle)
+        self._size = self.root.left.size
+        return max(left_height, right_height) + grown
+
+    def __update_path(self, node):
+        """自node向上至根节点，重新计算路径上各子树的附加信息"""
+        while node != self.root:
+            node.update()
+            node = node.father
+
+    @staticmethod
+    def __swap(node, other):
+        """互换两个节点的值"""
+        node.val, other.val = other.val, node.val
+        node.payload, other.payload = other.payload, node.payload
 
     @property
     def root(self):
@@ -395,77 +409,331 @@ class RBTree:
     def root(self, node):
         assert isinstance(node, RBNode)
         self.__root.left = node
-        node.father = self.__root.left
+        node.father = self.__root
 
     @property
     def size(self):
-        return self.__size
+        return self._size
+
+    def AddReBalance(self, node):
+        """添加元素后的修复操作：自新节点向上修复相邻的红色节点，返回树的黑高是否因根节点染黑而加一"""
+        while node.father.color == 0:  # 父节点为红色，则父节点不是根节点，祖父节点存在
+            father = node.father
+            grandfather = father.father
+            uncle = grandfather.right if father == grandfather.left else grandfather.left
+
+            # 叔叔节点为红色：父节点，叔叔节点，祖父节点变色，继续修复祖父节点
+            if uncle is not None and uncle.color == 0:
+                father.change_color()
+                uncle.change_color()
+                grandfather.change_color()
+                node = grandfather
 
-    @classmethod
-    def AddReBalance(cls, base_node):
-        """添加元素后的修复操作"""
-        target = RBTools(base_node)  # 搭建工作平台
+            # 叔叔节点为黑色
+            elif father == grandfather.left:
+                # 左右：以父节点为基准左旋，转化为左左
+                if node == father.right:
+                    _rotate_left(father)
+                    node, father = father, node
+                # 左左：以祖父节点为基准右旋，原父节点、原祖父节点变色
+                _rotate_right(grandfather)
+                father.change_color()
+                grandfather.change_color()
+            else:
+                # 右左：以父节点为基准右旋，转化为右右
+                if node == father.left:
+                    _rotate_right(father)
+                    node, father = father, node
+                # 右右：以祖父节点为基准左旋，原父节点、原祖父节点变色
+                _rotate_left(grandfather)
+                father.change_color()
+                grandfather.change_color()
+
+        # 根节点始终为黑色
+        if self.root.left.color == 0:
+            self.root.left.color = 1
+            return True
+        return False
+
+    def DeleteReBalance(self, father, node=None):
+        """
+        删除元素后的修复操作：father的子节点node（删除后为空）所在的路径上缺少一个黑色节点
+            情况1 兄弟为红色
+                - 兄弟与父节点变色，左旋父节点，转化为兄弟为黑色的情况
+            情况2 兄弟为黑色，且兄弟的两个子节点均为黑色
+                - 兄弟变为红色，父节点所在路径缺少一个黑色节点，继续修复父节点
+            情况3 兄弟为黑色，兄弟的左子节点为红色，右子节点为黑色
+                - 兄弟与其左子节点变色，右旋兄弟节点，转化为情况4
+            情况4 兄弟为黑色，兄弟的右子节点为红色
+                - 兄弟取父节点的颜色，父节点与兄弟的右子节点变为黑色，左旋父节点，修复完成
+            node为右子节点时，左右互换。
+        """
+        while father != self.root and (node is None or node.color == 1):
+            if node == father.left:
+                brother = father.right
+                # 情况1
+                if brother.color == 0:
+                    brother.change_color()
+                    father.change_color()
+                    _rotate_left(father)
+                    brother = father.right
+                # 情况2
+                if _is_black(brother.left) and _is_black(brother.right):
+                    brother.color = 0
+                    node, father = father, father.father
+                    continue
+                # 情况3
+                if _is_black(brother.right):
+                    brother.left.color = 1
+                    brother.color = 0
+                    _rotate_right(brother)
+                    brother = father.right
+                # 情况4
+                brother.color = father.color
+                father.color = 1
+                brother.right.color = 1
+                _rotate_left(father)
+            else:
+                brother = father.left
+                if brother.color == 0:
+                    brother.change_color()
+                    father.change_color()
+                    _rotate_right(father)
+                    brother = father.left
+                if _is_black(brother.left) and _is_black(brother.right):
+                    brother.color = 0
+                    node, father = father, father.father
+                    continue
+                if _is_black(brother.left):
+                    brother.right.color = 1
+                    brother.color = 0
+                    _rotate_left(brother)
+                    brother = father.left
+                brother.color = father.color
+                father.color = 1
+                brother.left.color = 1
+                _rotate_right(father)
+            node = self.root.left
+            break
 
-        if target.me.color == 0 and target.father.color == 0:
+        if node is not None:
+            node.color = 1
+
+    # 有序查询
+    def min(self):
+        """返回最小值，树为空时抛出ValueError"""
+        node = self.root.left
+        if node is None:
+            raise ValueError('Tree is empty!')
+        while node.left:
+            node = node.left
+        return node.val
+
+    def max(self):
+        """返回最大值，树为空时抛出ValueError"""
+        node = self.root.left
+        if node is None:
+            raise ValueError('Tree is empty!')
+        while node.right:
+            node = node.right
+        return node.val
+
+    def floor(self, item):
+        """返回不大于item的最大值，不存在时返回None"""
+        node = self._below(item, True)
+        return None if node is None else node.val
+
+    def ceiling(self, item):
+        """返回不小于item的最小值，不存在时返回None"""
+        node = self._above(item, True)
+        return None if node is None else node.val
+
+    def predecessor(self, item):
+        """返回小于item的最大值，不存在时返回None，item不必在树中"""
+        node = self._below(item, False)
+        return None if node is None else node.val
+
+    def successor(self, item):
+        """返回大于item的最小值，不存在时返回None，item不必在树中"""
+        node = self._above(item, False)
+        return None if node is None else node.val
+
+    def select(self, k):
+        """返回第k小（自0起计）的值，k为负数时自最大值倒数；越界时抛出IndexError"""
+        node = self.root.left
+        size = node.size if node else 0
+        if k < 0:
+            k += size
+        if not 0 <= k < size:
+            raise IndexError('Index out of range!')
+        while True:
+            left = node.left.size if node.left else 0
+            if k < left:
+                node = node.left
+            elif k == left:
+                return node.val
+            else:
+                k -= left + 1  # 跳过左子树与该节点
+                node = node.right
 
-            # 叔叔节点为黑色
-            if target.uncle is None or target.uncle.color == 1:
-                # 左左
-                if target.father == target.grandfather.left and target.me == target.father.left:
-                    # 以祖父节点为基准右旋
-                    grandfather_target = RBTools(target.grandfather)
-                    grandfather_target.rotate_r()
-                    # 右旋后插入节点、原父节点，原祖父节点变色
-                    # target.me.change_color()
-                    target.father.change_color()
-                    target.grandfather.change_color()
-
-                # 左右
-                elif target.me.father == target.grandfather.left and target.me == target.me.father.right:
-                    # 以父节点为基准左旋，再以原祖父节点为基准右旋
-                    father_target = RBTools(target.father)
-                    father_target.rotate_l()
-                    grandfather_target = RBTools(target.grandfather)
-                    grandfather_target.rotate_r()
-                    # 原插入节点与原祖父节点变色
-                    target.me.change_color()
-                    target.grandfather.change_color()
-
-                # 右右
-                elif target.me.father == target.grandfather.right and target.me == target.me.father.right:
-                    # 以祖父节点为基准左旋
-                    grandfather_target = RBTools(target.grandfather)
-                    grandfather_target.rotate_l()
-                    # 左旋后插入节点、原父节点、原祖父节点变色
-                    # target.me.change_color()
-                    target.father.change_color()
-                    target.grandfather.change_color()
-
-                # 右左
-                else:
-                    # 以父节点为基准右旋，再以原祖父节点为基准左旋
-                    father_target = RBTools(target.father)
-                    father_target.rotate_r()
-                    grandfather_target = RBTools(target.grandfather)
-                    grandfather_target.rotate_l()
-                    # 原插入节点与原祖父节点变色
-                    target.me.change_color()
-                    target.grandfather.change_color()
-
-            # 叔叔节点为红色
+    def rank(self, item):
+        """返回树中小于item的值的个数，item不必在树中"""
+        count = 0
+        node = self.root.left
+        while node is not None:
+            if node.val < item:
+                count += 1 + (node.left.size if node.left else 0)  # 左子树与该节点均小于item
+                node = node.right
             else:
-                # self.ColorReBalance(target.me)
+                node = node.left
+        return count
+
+    def count_range(self, lo=None, hi=None):
+        """返回[lo, hi)内的值的个数，边界为None时该侧不设限"""
+        count = self.rank(hi) if hi is not None else self._size
+        if lo is not None:
+            count -= self.rank(lo)
+        return max(count, 0)
+
+    def range(self, lo=None, hi=None):
+        """惰性地中序生成[lo, hi)内的值，边界为None时该侧不设限"""
+        for node in self._nodes(lo, hi):
+            yield node.val
+
+    def _below(self, item, inclusive):
+        """返回小于item（inclusive时可等于）的最大值所在的节点，不存在时返回None"""
+        found = None
+        node = self.root.left
+        while node is not None:
+            if node.val < item or inclusive and node.val == item:
+                found = node  # 候选节点，继续在右子树中找更大的
+                node = node.right
+            else:
+                node = node.left
+        return found
+
+    def _above(self, item, inclusive):
+        """返回大于item（inclusive时可等于）的最小值所在的节点，不存在时返回None"""
+        found = None
+        node = self.root.left
+        while node is not None:
+            if item < node.val or inclusive and node.val == item:
+                found = node  # 候选节点，继续在左子树中找更小的
+                node = node.left
+            else:
+                node = node.right
+        return found
 
-                # 父节点，叔叔节点，祖父节点变色
-                target.father.change_color()
-                if target.uncle:
-                    target.uncle.change_color()
-                if target.grandfather:
-                    target.grandfather.change_color()
+    def _nodes(self, lo=None, hi=None):
+        """
+        惰性中序遍历值在[lo, hi)内的节点：
+            下行时跳过小于lo的子树，遇到第一个不小于hi的值即停止，共耗时O(log n + k)；
+            栈中只保存通往下一个节点的路径，占用O(log n)内存。
+        """
+        stack = []
+        node = self.root.left
+        while True:
+            while node is not None:
+                if lo is not None and node.val < lo:
+                    node = node.right  # 该节点及其左子树均小于lo
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and not node.val < hi:
+                return
+            yield node
+            node = node.right
 
-        # 节点与其父节点不同时为红色
+    # 映射模式：键为节点的值，值保存在节点的payload中
+    def __getitem__(self, key):
+        node = self.find(key)
+        if node == -1:
+            raise KeyError(key)
+        return node.payload
+
+    def __setitem__(self, key, value):
+        node = self.find(key)
+        if node == -1:
+            self.add(key, value)
         else:
-            pass
+            node.payload = value
+
+    def __delitem__(self, key):
+        if self.find(key) == -1:
+            raise KeyError(key)
+        self.delete(key)
+
+    def get(self, key, default=None):
+        """返回key对应的值，key不存在时返回default"""
+        node = self.find(key)
+        return default if node == -1 else node.payload
+
+    def keys(self):
+        """惰性地按序生成各键"""
+        return self.range()
+
+    def values(self):
+        """惰性地按键的顺序生成各值"""
+        for node in self._nodes():
+            yield node.payload
+
+    def items(self, lo=None, hi=None):
+        """惰性地按序生成键在[lo, hi)内的(键, 值)对"""
+        for node in self._nodes(lo, hi):
+            yield node.val, node.payload
+
+
+def _is_black(node):
+    """空节点视为黑色"""
+    return node is None or node.color == 1
+
+
+def _black_height(node):
+    """返回以node为根的子树中每条路径上的黑色节点数，空树为0"""
+    height = 0
+    while node is not None:
+        height += node.color
+        node = node.left
+    return height
+
+
+def _rotate_left(node):
+    """以node为基准左旋，node的右子节点pivot取代node的位置，随后重新计算二者的子树信息"""
+    pivot, father = node.right, node.father
+    node.right = pivot.left
+    if pivot.left:
+        pivot.left.father = node
+    pivot.left = node
+    node.father = pivot
+    pivot.father = father
+    if father:
+        if father.left is node:
+            father.left = pivot
+        else:
+            father.right = pivot
+    node.update()
+    pivot.update()
+
+
+def _rotate_right(node):
+    """以node为基准右旋，node的左子节点pivot取代node的位置，随后重新计算二者的子树信息"""
+    pivot, father = node.left, node.father
+    node.left = pivot.right
+    if pivot.right:
+        pivot.right.father = node
+    pivot.right = node
+    node.father = pivot
+    pivot.father = father
+    if father:
+        if father.left is node:
+            father.left = pivot
+        else:
+            father.right = pivot
+    node.update()
+    pivot.update()
 
 
 class RBTools:
@@ -522,48 +790,13 @@ class RBTools:
         """左旋操作"""
         if not self.me.right:
             raise TypeError('必须拥有右子树才可以进行左旋操作!')
-
-        # 若目标存在父节点，则先转移父节点归属
-        if self.me.father:
-            father = self.me.father
-            if self.me == self.me.father.left:
-                father.left = self.me.right
-            else:
-                father.right = self.me.right
-            self.me.right.father = father
-
-        tmp = None
-        if self.me.right.left:
-            tmp = self.me.right.left
-        self.me.father = self.me.right
-        self.me.father.left = self.me
-        self.me.right = tmp
-        if tmp:
-            tmp.father = self.me
+        _rotate_left(self.me)
 
     def rotate_r(self):
         """右旋操作"""
         if not self.me.left:
             raise TypeError('必须拥有左子树才可以进行右旋操作!')
-
-        # 若目标存在父节点，则先转移父节点归属
-        if self.me.father:
-            father = self.me.father
-            if self.me == self.me.father.left:
-                father.left = self.me.left
-            else:
-                father.right = self.me.left
-            self.me.left.father = father
-
-        tmp = None
-        if self.me.left.right:
-            tmp = self.me.left.right
-        self.me.father = self.me.left
-        self.me.father.right = self.me
-        self.me.left = None
-        self.me.left = tmp
-        if tmp:
-            tmp.father = self.me
+        _rotate_right(self.me)
 
 
 if __name__ == '__main__':
@@ -582,4 +815,22 @@ if __name__ == '__main__':
     RedBlackTree.delete(3)
     RedBlackTree.printTree()
     print()
+
+    # 有序查询与映射模式
+    print(list(RedBlackTree), RedBlackTree.min(), RedBlackTree.max(), RedBlackTree.floor(9), RedBlackTree.ceiling(0),
+          RedBlackTree.predecessor(6), RedBlackTree.successor(6), list(RedBlackTree.range(5, 8)))
+    prices = RBTree()
+    for name, price in (('pear', 3), ('apple', 5), ('fig', 8), ('apple', 4)):
+        prices[name] = price
+    del prices['pear']
+    print(len(prices), prices['apple'], prices.get('kiwi', 0), list(prices.items()))
+    print(RedBlackTree.select(0), RedBlackTree.select(-1), RedBlackTree.rank(6), RedBlackTree.count_range(5, 8))
+
+    # 批量构建、分裂与合并
+    bulk = RBTree.from_sorted(range(1, 11))
+    small, large = bulk.split(6)
+    print(list(small), list(large))
+    small.join(large)
+    small.printTree()
+    print()
     RedBlackTree.delete(100)
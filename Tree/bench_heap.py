@@ -0,0 +1,200 @@
+"""
+@Date: 2026/10/17
+@Author: Chen Zhang
+@Brief: 堆 的性能测试
+
+构建：逐个 add 与 Floyd 自底向上建堆（构造函数）的耗时对比，heapq.heapify 作为参照；
+替换堆顶：pushpop/replace 与 add + pop 的耗时对比；
+位置索引：带索引与不带索引的堆上 delete 的耗时，以及索引的内存开销；
+d叉堆：二叉堆、4叉堆、8叉堆（列表或类型化存储）与 heapq 在以入堆为主、以出堆为主、混合三种负载下的耗时；
+合并：把多个分片堆合并为一个堆的耗时，MinHeap 逐个 add 或 extend，PairingMinHeap 用 meld。
+"""
+import heapq
+import random
+import time
+import tracemalloc
+
+from Heap import MaxHeap, MinHeap
+from PairingHeap import PairingMinHeap
+
+
+def timed(function, *args):
+    """Return the seconds function(*args) takes"""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def add_each(heapType, values):
+    heap = heapType()
+    for value in values:
+        heap.add(value)
+
+
+def add_pop(heap, values):
+    for value in values:
+        heap.add(value)
+        heap.pop()
+
+
+def pushpop(heap, values):
+    for value in values:
+        heap.pushpop(value)
+
+
+def bench_build(sizes=(10 ** 4, 10 ** 5, 10 ** 6)):
+    """Print the seconds each way of building a heap of n random values takes"""
+    print('%-8s %10s %12s %12s %14s' % ('heap', 'n', 'add each', 'heapify', 'heapq.heapify'))
+    for name, heapType in (('MaxHeap', MaxHeap), ('MinHeap', MinHeap)):
+        for n in sizes:
+            values = [random.random() for _ in range(n)]
+            print('%-8s %10d %12.3f %12.3f %14.3f' % (name, n, timed(add_each, heapType, values),
+                                                    timed(heapType, values), timed(heapq.heapify, list(values))))
+
+
+def bench_pushpop(n=10 ** 5, operations=10 ** 5):
+    """Print the seconds of operations add + pop pairs against as many pushpop calls on a heap of n values"""
+    values = [random.random() for _ in range(n)]
+    stream = [random.random() for _ in range(operations)]
+    print('%-8s %10s %12s %12s' % ('heap', 'n', 'add + pop', 'pushpop'))
+    for name, heapType in (('MaxHeap', MaxHeap), ('MinHeap', MinHeap)):
+        print('%-8s %10d %12.3f %12.3f' % (name, n, timed(add_pop, heapType(values), stream),
+                                           timed(pushpop, heapType(values), stream)))
+
+
+def delete_each(heap, targets):
+    for target in targets:
+        heap.delete(target)
+
+
+def traced_size(function, *args):
+    """Return the bytes still allocated by the result of function(*args)"""
+    tracemalloc.start()
+    result = function(*args)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def bench_index(n=10 ** 5, deletes=10 ** 3, distinct=(None, 10 ** 3)):
+    """
+    Print the seconds of deletes deletions from a heap of n values, with and without the position index, and the
+    bytes per value the heap takes. distinct bounds the number of different values, None for mostly unique values.
+    """
+    print('%-8s %10s %8s %8s %12s %14s' % ('heap', 'n', 'distinct', 'indexed', 'delete s', 'bytes per value'))
+    for name, heapType in (('MaxHeap', MaxHeap), ('MinHeap', MinHeap)):
+        for bound in distinct:
+            values = [random.randrange(bound or n * 10) for _ in range(n)]
+            targets = random.sample(values, deletes)
+            for indexed in (False, True):
+                seconds = timed(delete_each, heapType(values, indexed=indexed), targets)
+                size = traced_size(heapType, values, indexed)
+                print('%-8s %10d %8s %8s %12.3f %14.1f' % (name, n, bound or 'unique', indexed, seconds, size / n))
+
+
+def push_heavy(push, pop, values):
+    """Push every value, popping one value after every ten pushes"""
+    for count, value in enumerate(values):
+        push(value)
+        if count % 10 == 9:
+            pop()
+
+
+def pop_heavy(push, pop, values):
+    """Pop until the heap is empty, pushing one value after every ten pops"""
+    values = iter(values)
+    count = 0
+    try:
+        while True:
+            pop()
+            count += 1
+            if count % 10 == 0:
+                push(next(values))
+    except (ValueError, IndexError, StopIteration):
+        pass
+
+
+def mixed(push, pop, values):
+    """Push or pop at random, half and half"""
+    for value in values:
+        if value < 0.5:
+            push(value)
+        else:
+            pop()
+
+
+def bench_arity(n=10 ** 5):
+    """Print the seconds of each workload on heaps of n random values"""
+    def heapq_case(values):
+        heap = list(values)
+        heapq.heapify(heap)
+        return lambda value: heapq.heappush(heap, value), lambda: heapq.heappop(heap)
+
+    def heap_case(arity, typecode):
+        def build(values):
+            heap = MinHeap(values, arity=arity, typecode=typecode)
+            return heap.add, heap.pop
+        return build
+
+    cases = [('heapq', heapq_case)]
+    for arity in (2, 4, 8):
+        for typecode in (None, 'd'):
+            cases.append(('d=%d %s' % (arity, typecode or 'list'), heap_case(arity, typecode)))
+    workloads = (('push-heavy', push_heavy, 0), ('pop-heavy', pop_heavy, n), ('mixed', mixed, n // 2))
+    print('%-12s %12s %12s %12s' % ('heap', *(name for name, _, _ in workloads)))
+    for name, build in cases:
+        row = []
+        for _, workload, initial in workloads:
+            push, pop = build([random.random() for _ in range(initial)])
+            row.append(timed(workload, push, pop, [random.random() for _ in range(n)]))
+        print('%-12s %12.3f %12.3f %12.3f' % (name, *row))
+
+
+def bench_meld(shards=100, per_shard=10 ** 3):
+    """Print the seconds of merging shards heaps of per_shard values each into one, and of popping it empty"""
+    values = [[random.random() for _ in range(per_shard)] for _ in range(shards)]
+
+    def add_each_shard(heaps):
+        merged = MinHeap()
+        for heap in heaps:
+            for value in heap.container[1:]:
+                merged.add(value)
+        return merged
+
+    def extend_shards(heaps):
+        merged = MinHeap()
+        for heap in heaps:
+            merged.extend(heap.container[1:])
+        return merged
+
+    def meld_shards(heaps):
+        merged = PairingMinHeap()
+        for heap in heaps:
+            merged.meld(heap)
+        return merged
+
+    def pop_all(heap):
+        for _ in range(len(heap)):
+            heap.pop()
+
+    print('%-22s %8s %10s %12s %10s' % ('merge', 'shards', 'per shard', 'merge s', 'pop all s'))
+    for name, heapType, merge in (('MinHeap add', MinHeap, add_each_shard), ('MinHeap extend', MinHeap, extend_shards),
+                                  ('PairingMinHeap meld', PairingMinHeap, meld_shards)):
+        heaps = [heapType(shard) for shard in values]
+        start = time.perf_counter()
+        merged = merge(heaps)
+        seconds = time.perf_counter() - start
+        print('%-22s %8d %10d %12.4f %10.3f' % (name, shards, per_shard, seconds, timed(pop_all, merged)))
+
+
+if __name__ == '__main__':
+    bench_build()
+    print()
+    bench_pushpop()
+    print()
+    bench_index()
+    print()
+    bench_arity()
+    print()
+    bench_meld()
@@ -0,0 +1,156 @@
+"""
+@Date: 2026/10/17
+@Author: Chen Zhang
+@Brief: 红黑树 的性能测试
+
+构建：由有序数据逐个 add 与 from_sorted 批量构建的耗时对比；
+分裂与合并：在随机键处 split 再 join 回原树的平均耗时，与用 from_sorted 重建两棵树的耗时对比，
+    前者随 n 的增长只按 log n 增长；
+节点内存：tracemalloc 统计的每个节点的字节数，以及随机顺序 add 与 find 的吞吐量；
+快照：PersistentRBTree 路径复制的 add/delete 与 RBTree 原地修改的吞吐量对比，以及 snapshot() 与完整复制一棵树的耗时对比；
+区间树：IntervalTree 由有序区间 from_sorted 构建的耗时，以及 overlap 查询与线性扫描全部区间的耗时对比。
+"""
+import random
+import time
+import tracemalloc
+
+from IntervalTree import IntervalTree
+from PersistentRBTree import PersistentRBTree
+from RedBlackTree import RBTree
+
+
+def timed(function, *args):
+    """Return the seconds function(*args) takes"""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def add_each(values):
+    tree = RBTree()
+    for value in values:
+        tree.add(value)
+
+
+def bench_build(sizes=(10 ** 4, 10 ** 5, 10 ** 6)):
+    """Print the seconds of building a tree of n sorted values by add and by from_sorted"""
+    print('%10s %12s %12s' % ('n', 'add each', 'from_sorted'))
+    for n in sizes:
+        values = list(range(n))
+        print('%10d %12.3f %12.3f' % (n, timed(add_each, values), timed(RBTree.from_sorted, values)))
+
+
+def split_join(tree, keys):
+    for key in keys:
+        left, right = tree.split(key)
+        left.join(right)
+        tree = left
+
+
+def rebuild(values, keys):
+    for key in keys:
+        RBTree.from_sorted(value for value in values if value < key)
+        RBTree.from_sorted(value for value in values if value >= key)
+
+
+def bench_split(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), rounds=100, rebuild_limit=10 ** 5):
+    """Print the average milliseconds of a split at a random key plus the join back, against rebuilding both parts"""
+    print('%10s %14s %14s' % ('n', 'split + join', 'rebuild'))
+    for n in sizes:
+        values = list(range(n))
+        keys = [random.randrange(n) for _ in range(rounds)]
+        tree = RBTree.from_sorted(values)
+        split_ms = timed(split_join, tree, keys) * 1000 / rounds
+        if n > rebuild_limit:
+            print('%10d %14.3f %14s' % (n, split_ms, '-'))
+        else:
+            print('%10d %14.3f %14.3f' % (n, split_ms, timed(rebuild, values, keys[:10]) * 1000 / 10))
+
+
+def find_each(tree, keys):
+    for key in keys:
+        tree.find(key)
+
+
+def traced_size(function, *args):
+    """Return the bytes still allocated by the result of function(*args)"""
+    tracemalloc.start()
+    result = function(*args)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def bench_memory(n=10 ** 5):
+    """Print the bytes per node of a tree of n random keys, and the add and find operations per second"""
+    keys = random.sample(range(n), n)
+    tree = RBTree()
+    add_seconds = timed(lambda: [tree.add(key) for key in keys])
+    find_seconds = timed(find_each, tree, keys)
+    print('%10s %14s %14s %14s' % ('n', 'bytes/node', 'add/s', 'find/s'))
+    print('%10d %14.1f %14.0f %14.0f' % (n, traced_size(RBTree, keys) / n, n / add_seconds,
+                                         n / find_seconds))
+
+
+def update_each(tree, keys):
+    for key in keys:
+        tree.delete(key)
+        tree.add(key)
+
+
+def bench_snapshot(sizes=(10 ** 4, 10 ** 5, 10 ** 6), updates=10 ** 4, rounds=100):
+    """Print the delete + add pairs per second of each tree, and the microseconds of a snapshot against a full copy"""
+    print('%10s %14s %14s %14s %14s' % ('n', 'RBTree upd/s', 'persistent/s', 'snapshot us', 'copy us'))
+    for n in sizes:
+        keys = [random.randrange(n) for _ in range(updates)]
+        mutable, persistent = RBTree.from_sorted(range(n)), PersistentRBTree.from_sorted(range(n))
+        mutable_seconds, persistent_seconds = timed(update_each, mutable, keys), timed(update_each, persistent, keys)
+        snapshot_us = timed(lambda: [persistent.snapshot() for _ in range(rounds)]) * 10 ** 6 / rounds
+        copy_us = timed(lambda: RBTree.from_sorted(list(mutable.keys()), list(mutable.values()))) * 10 ** 6
+        print('%10d %14.0f %14.0f %14.2f %14.0f' % (n, updates / mutable_seconds, updates / persistent_seconds,
+                                                    snapshot_us, copy_us))
+
+
+def overlap_each(tree, windows):
+    for low, high in windows:
+        for _ in tree.overlap(low, high):
+            pass
+
+
+def scan_each(intervals, windows):
+    for low, high in windows:
+        for interval in intervals:
+            if interval[0] <= high and interval[1] >= low:
+                pass
+
+
+def bench_interval(sizes=(10 ** 4, 10 ** 5, 10 ** 6), queries=100, span=10 ** 3, scan_limit=10 ** 5):
+    """Print the seconds of building n intervals of length below span, and the milliseconds per overlap query"""
+    print('%10s %12s %10s %12s %12s' % ('n', 'from_sorted', 'hits', 'overlap ms', 'scan ms'))
+    for n in sizes:
+        starts = sorted(random.randrange(n * 10) for _ in range(n))
+        intervals = [(start, start + random.randrange(span)) for start in starts]
+        intervals.sort()
+        build_seconds = timed(IntervalTree.from_sorted, intervals)
+        tree = IntervalTree.from_sorted(intervals)
+        windows = [(low, low + span) for low in (random.randrange(n * 10) for _ in range(queries))]
+        hits = sum(len(list(tree.overlap(low, high))) for low, high in windows) / queries
+        overlap_ms = timed(overlap_each, tree, windows) * 1000 / queries
+        if n > scan_limit:
+            print('%10d %12.3f %10.1f %12.3f %12s' % (n, build_seconds, hits, overlap_ms, '-'))
+        else:
+            scan_ms = timed(scan_each, intervals, windows) * 1000 / queries
+            print('%10d %12.3f %10.1f %12.3f %12.3f' % (n, build_seconds, hits, overlap_ms, scan_ms))
+
+
+if __name__ == '__main__':
+    bench_build()
+    print()
+    bench_split()
+    print()
+    bench_memory()
+    print()
+    bench_snapshot()
+    print()
+    bench_interval()
@@ -0,0 +1,101 @@
+"""
+@Date: 2026/10/17
+@Author: Chen Zhang
+@Brief: 索引堆的测试程序
+
+以随机的 add、extend、pop、pushpop、replace、update_priority 与按句柄 remove 驱动 IndexedMinHeap 与 IndexedMaxHeap，
+每步之后检查：堆序、handle -> 下标字典与节点的实际位置一致，以及弹出的优先级与按 handle -> priority 字典排序的结果一致。
+"""
+import random
+
+from IndexedHeap import IndexedMaxHeap, IndexedMinHeap
+
+
+def check_heap(heap):
+    """检查 heap 的堆序与下标字典，不满足时抛出 AssertionError"""
+    container, arity = heap._container, heap.arity
+    assert len(heap._position) == len(heap), 'Wrong number of handles'
+    for ind in range(1, len(heap) + 1):
+        assert heap._position[container[ind][1]] == ind, 'Stale position of %r' % (container[ind][1],)
+        if ind > 1:
+            father = (ind - 2) // arity + 1
+            assert not heap._precedes(container[ind], container[father]), 'Out of order at %d' % ind
+
+
+def best(ref, heaptype):
+    """返回 ref 中最先弹出的优先级"""
+    return (min if heaptype is IndexedMinHeap else max)(ref.values())
+
+
+def random_operations(heaptype, arity, trials=100, bound=50):
+    """随机操作，与 handle -> priority 字典比较；返回 True"""
+    for _ in range(trials):
+        heap, ref, handle = heaptype(arity=arity), {}, 0
+        for _ in range(random.randrange(1, 150)):
+            choice = random.random()
+            if choice < 0.3 or not ref:
+                heap.add(handle, random.randrange(bound))
+                ref[handle] = heap.priority(handle)
+                handle += 1
+            elif choice < 0.4:
+                pairs = {handle + index: random.randrange(bound) for index in range(random.randrange(5))}
+                heap.extend(pairs)
+                ref.update(pairs)
+                handle += len(pairs)
+            elif choice < 0.55:
+                top, priority = heap.pop()
+                assert priority == best(ref, heaptype) == ref.pop(top)
+            elif choice < 0.6:
+                priority = random.randrange(bound)
+                ref[handle] = priority
+                top, popped = heap.pushpop(handle, priority)
+                assert popped == best(ref, heaptype) == ref.pop(top)
+                handle += 1
+            elif choice < 0.65:
+                expected = best(ref, heaptype)
+                top, popped = heap.replace(handle, random.randrange(bound))
+                assert popped == expected == ref.pop(top)
+                ref[handle] = heap.priority(handle)
+                handle += 1
+            elif choice < 0.85:
+                target = random.choice(list(ref))
+                ref[target] = random.randrange(bound)
+                heap.update_priority(target, ref[target])
+            else:
+                target = random.choice(list(ref))
+                assert heap.remove(target) == ref.pop(target)
+                assert target not in heap
+            check_heap(heap)
+            assert len(heap) == len(ref) and all(heap.priority(key) == ref[key] for key in ref)
+            assert sorted(heap) == sorted(ref.items())
+        order = [heap.pop()[1] for _ in range(len(heap))]
+        assert order == sorted(ref.values(), reverse=heaptype is IndexedMaxHeap)
+    return True
+
+
+def test(heaptype):
+    """Expects an indexed heap type as an argument and runs some tests on objects of that type"""
+    print(heaptype.__name__)
+    heap = heaptype({'a': 5, 'b': 3, 'c': 8, 'd': 1})
+    heap.update_priority('c', 0)
+    heap.update_priority('d', 9)
+    print("Expect True 3 False 3:", 'b' in heap, heap.remove('b'), 'b' in heap, len(heap))
+    expected = [('c', 0), ('a', 5), ('d', 9)]
+    print("Expect %s:" % (expected if heaptype is IndexedMinHeap else expected[::-1]),
+          [heap.pop() for _ in range(len(heap))])
+    for arity in (2, 3, 4):
+        print("Expect True (arity %d):" % arity, random_operations(heaptype, arity))
+    try:
+        heap.add('x', 1)
+        heap.add('x', 2)
+    except KeyError as error:
+        print("Expect KeyError:", error)
+    try:
+        heap.update_priority('y', 1)
+    except KeyError as error:
+        print("Expect KeyError:", error)
+
+
+if __name__ == '__main__':
+    test(IndexedMinHeap)
+    test(IndexedMaxHeap)
@@ -0,0 +1,128 @@
+"""
+@Date: 2026/10/17
+@Author: Chen Zhang
+@Brief: 配对堆的测试程序
+
+以随机的 add、pop、pushpop、replace、meld、decrease_key、按节点 remove 与按值 delete 驱动 PairingMinHeap 与 PairingMaxHeap，
+每步之后检查：堆序、child/sibling/prev 链接一致、add 返回的节点仍在树中且值正确，以及弹出的值与排序后的朴素实现一致。
+"""
+import random
+
+from PairingHeap import PairingMaxHeap, PairingMinHeap
+
+
+def check_heap(heap):
+    """检查 heap 的堆序与链接，返回树中节点的集合；不满足时抛出 AssertionError"""
+    nodes = set()
+    root = heap._top
+    if root is None:
+        assert len(heap) == 0, 'Wrong length'
+        return nodes
+    assert root.prev is None and root.sibling is None, 'Root has a father or siblings'
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        nodes.add(node)
+        previous = node
+        child = node.child
+        while child is not None:
+            assert child.prev is previous, 'Broken prev of %r' % (child.value,)
+            assert not heap._precedes(child.value, node.value), '%r under %r' % (child.value, node.value)
+            stack.append(child)
+            previous, child = child, child.sibling
+    assert len(nodes) == len(heap), 'Wrong length'
+    return nodes
+
+
+def random_operations(heaptype, trials=200, bound=100):
+    """随机操作，与值的列表比较；handles 记录 add 返回的节点及其值。返回 True"""
+    first = min if heaptype is PairingMinHeap else max
+    for _ in range(trials):
+        heap, values, handles = heaptype(), [], {}
+        for _ in range(random.randrange(1, 150)):
+            choice = random.random()
+            if choice < 0.3 or not values:
+                value = random.randrange(bound)
+                handles[heap.add(value)] = value
+                values.append(value)
+            elif choice < 0.45:
+                top = heap._top
+                assert heap.pop() == first(values)
+                values.remove(top.value)
+                handles.pop(top, None)
+            elif choice < 0.55:  # pushpop 或 replace：原堆顶节点若被弹出，便不再在树中
+                value, top = random.randrange(bound), heap._top
+                if choice < 0.5:
+                    expected = first(values + [value])
+                    assert heap.pushpop(value) == expected
+                else:
+                    expected = first(values)
+                    assert heap.replace(value) == expected
+                values.append(value)
+                values.remove(expected)
+                if top not in check_heap(heap):
+                    handles.pop(top, None)
+            elif choice < 0.65:
+                other = heaptype()
+                more = [random.randrange(bound) for _ in range(random.randrange(6))]
+                for value in more:
+                    handles[other.add(value)] = value
+                heap.meld(other)
+                values.extend(more)
+                assert len(other) == 0 and other._top is None
+            elif choice < 0.85 and handles:
+                node = random.choice(list(handles))
+                shift = random.randrange(bound // 2)
+                value = node.value - shift if heaptype is PairingMinHeap else node.value + shift
+                heap.decrease_key(node, value)
+                values.remove(handles[node])
+                values.append(value)
+                handles[node] = value
+            elif choice < 0.95 and handles:
+                node = random.choice(list(handles))
+                assert heap.remove(node) == handles.pop(node)
+                values.remove(node.value)
+            else:
+                value = random.choice(values)
+                node = heap.find(value)
+                heap.delete(value)
+                values.remove(value)
+                handles.pop(node, None)
+            nodes = check_heap(heap)
+            assert sorted(heap) == sorted(values)
+            for node, value in handles.items():
+                assert node in nodes and node.value == value, 'Lost the node of %r' % (value,)
+        assert [heap.pop() for _ in range(len(heap))] == sorted(values, reverse=heaptype is PairingMaxHeap)
+    return True
+
+
+def test(heaptype):
+    """Expects a pairing heap type as an argument and runs some tests on objects of that type"""
+    print(heaptype.__name__)
+    heap = heaptype([3, 7, 1, 4, 5])
+    shard = heaptype([0, 13])
+    node = shard.add(6)
+    heap.meld(shard)
+    print("Expect 8 0:", len(heap), len(shard))
+    try:
+        heap.decrease_key(node, 20 if heaptype is PairingMinHeap else -20)
+    except ValueError as error:
+        print("Expect ValueError:", error)
+    heap.decrease_key(node, -1 if heaptype is PairingMinHeap else 20)
+    print("Expect %d:" % (-1 if heaptype is PairingMinHeap else 20), heap.peek())
+    heap.delete(7)
+    print("Expect 5 6:", heap.remove(heap.find(5)), len(heap))
+    print("Expect True:", random_operations(heaptype))
+    try:
+        heap.meld(PairingMaxHeap() if heaptype is PairingMinHeap else PairingMinHeap())
+    except TypeError as error:
+        print("Expect TypeError:", error)
+    try:
+        heap.delete(100)
+    except ValueError as error:
+        print("Expect ValueError:", error)
+
+
+if __name__ == '__main__':
+    test(PairingMinHeap)
+    test(PairingMaxHeap)
@@ -0,0 +1,250 @@
+"""
+@Date: 2026/10/17
+@Author: Chen Zhang
+@Brief: 红黑树的测试程序
+
+以随机的插入、删除、批量构建、分裂与合并操作驱动RBTree与PersistentRBTree，每步之后检查：
+    红黑性质（根节点为黑色、无相邻的红色节点、各路径黑高相同）、父节点指针、子树节点数size，
+    以及有序遍历、floor/ceiling、range、select/rank/count_range与映射模式与朴素实现的结果一致；
+    PersistentRBTree的各个快照在此后的修改中保持不变；
+    IntervalTree每个节点的子树右端点最大值high正确，overlap与stab与线性扫描的结果一致。
+"""
+import bisect
+import random
+
+from IntervalTree import IntervalTree
+from PersistentRBTree import PersistentRBTree
+from RedBlackTree import RBTree
+
+
+def check_tree(tree, fathers=True):
+    """检查tree的红黑性质与子树节点数（区间树还有子树右端点最大值），不满足时抛出AssertionError"""
+    def check(node):
+        """返回以node为根的子树的黑高"""
+        if node is None:
+            return 0
+        for child in (node.left, node.right):
+            if child is not None:
+                assert not fathers or child.father is node, 'Broken father of %r' % (child.val,)
+                assert node.color == 1 or child.color == 1, 'Red %r under red %r' % (child.val, node.val)
+        height = check(node.left)
+        assert height == check(node.right), 'Unequal black heights under %r' % (node.val,)
+        size = 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+        assert node.size == size, 'Wrong size of %r' % (node.val,)
+        if isinstance(tree, IntervalTree):
+            high = max([node.val[1]] + [child.high for child in (node.left, node.right) if child])
+            assert node.high == high, 'Wrong high of %r' % (node.val,)
+        return height + node.color
+
+    root = tree.root.left
+    assert root is None or root.color == 1, 'Red root'
+    assert not fathers or root is None or root.father is tree.root, 'Broken father of root'
+    check(root)
+    values = list(tree)
+    assert len(tree) == len(values) == (root.size if root else 0), 'Wrong length'
+    assert values == sorted(values), 'Not sorted'
+
+
+def check_queries(tree, ref, bound):
+    """将tree的有序查询与有序列表ref逐一比较，查询的值取自[-2, bound + 2)"""
+    assert list(tree) == ref
+    for k in range(-len(ref), len(ref)):
+        assert tree.select(k) == ref[k]
+    for k in (len(ref), -len(ref) - 1):
+        try:
+            tree.select(k)
+        except IndexError:
+            pass
+        else:
+            raise AssertionError('select(%d) of %d values' % (k, len(ref)))
+    for x in range(-2, bound + 2):
+        i, j = bisect.bisect_right(ref, x), bisect.bisect_left(ref, x)
+        assert tree.rank(x) == j
+        assert tree.floor(x) == (ref[i - 1] if i else None)
+        assert tree.ceiling(x) == (ref[j] if j < len(ref) else None)
+        assert tree.predecessor(x) == (ref[j - 1] if j else None)
+        assert tree.successor(x) == (ref[i] if i < len(ref) else None)
+    for _ in range(10):
+        lo, hi = random.randrange(-2, bound + 2), random.randrange(-2, bound + 2)
+        expected = [value for value in ref if lo <= value < hi]
+        assert list(tree.range(lo, hi)) == expected
+        assert tree.count_range(lo, hi) == len(expected)
+        assert list(tree.range(lo)) == [value for value in ref if lo <= value]
+        assert tree.count_range(lo) == len(ref) - bisect.bisect_left(ref, lo)
+        assert tree.count_range(hi=hi) == bisect.bisect_left(ref, hi)
+    if ref:
+        assert tree.min() == ref[0] and tree.max() == ref[-1]
+
+
+def random_updates(treetype, trials=200, bound=60):
+    """随机插入与删除（含重复值），每步检查旋转与变色后的不变式；返回True"""
+    for _ in range(trials):
+        tree, ref = treetype(), []
+        for _ in range(random.randrange(1, 150)):
+            if random.random() < 0.6 or not ref:
+                value = random.randrange(bound)
+                tree.add(value)
+                ref.append(value)
+            else:
+                value = random.choice(ref)
+                tree.delete(value)
+                ref.remove(value)
+            check_tree(tree, treetype is RBTree)
+        check_queries(tree, sorted(ref), bound)
+    return True
+
+
+def random_mapping(treetype, trials=100, bound=60):
+    """随机读写映射，与dict比较；返回True"""
+    for _ in range(trials):
+        tree, ref = treetype(), {}
+        for _ in range(random.randrange(1, 100)):
+            key = random.randrange(bound)
+            if random.random() < 0.6 or not ref:
+                tree[key] = ref[key] = str(key) * random.randrange(1, 3)
+            else:
+                key = random.choice(list(ref))
+                del tree[key]
+                del ref[key]
+        check_tree(tree, treetype is RBTree)
+        keys = sorted(ref)
+        assert list(tree.items()) == [(key, ref[key]) for key in keys]
+        assert list(tree.values()) == [ref[key] for key in keys]
+        assert all(tree.get(key) == ref.get(key) for key in range(bound))
+        copy = treetype.from_sorted(keys, [ref[key] for key in keys])
+        check_tree(copy, treetype is RBTree)
+        assert list(copy.items()) == list(tree.items())
+    return True
+
+
+def random_split_join(treetype, trials=500, bound=30):
+    """在随机键处分裂，再与另一棵树依次合并，检查两侧的值与不变式；返回True"""
+    for _ in range(trials):
+        ref = sorted(random.randrange(bound) for _ in range(random.randrange(60)))
+        tree = treetype.from_sorted(ref) if random.random() < 0.5 else treetype(list(ref) or None)
+        check_tree(tree, treetype is RBTree)
+        before = tree.snapshot() if treetype is PersistentRBTree else None
+        key = random.randrange(-2, bound + 2)
+        left, right = tree.split(key)
+        for part in (left, right, tree):
+            check_tree(part, treetype is RBTree)
+        check_queries(left, [value for value in ref if value < key], bound)
+        check_queries(right, [value for value in ref if value >= key], bound)
+        assert len(tree) == 0
+
+        more = sorted(random.randrange(bound, 2 * bound) for _ in range(random.randrange(60)))
+        other = treetype.from_sorted(more) if random.random() < 0.5 else treetype(list(more) or None)
+        left.join(right)
+        left.join(other)
+        check_tree(left, treetype is RBTree)
+        assert list(left) == ref + more and len(right) == len(other) == 0
+        assert before is None or list(before) == ref
+    return True
+
+
+def random_snapshots(trials=100, bound=60):
+    """随机修改PersistentRBTree并不时取快照，检查每个快照始终保持取快照时的内容；返回True"""
+    for _ in range(trials):
+        tree, ref, snapshots = PersistentRBTree(), {}, []
+        for _ in range(random.randrange(1, 150)):
+            key, choice = random.randrange(bound), random.random()
+            if choice < 0.5 or not ref:
+                tree[key] = ref[key] = random.random()
+            elif choice < 0.8:
+                key = random.choice(list(ref))
+                del tree[key]
+                del ref[key]
+            else:
+                snapshots.append((tree.snapshot(), sorted(ref.items())))
+            check_tree(tree, False)
+        for snapshot, items in snapshots:
+            check_tree(snapshot, False)
+            assert list(snapshot.items()) == items
+            snapshot[-1] = None  # 修改快照同样不影响原树
+        assert list(tree.items()) == sorted(ref.items())
+    return True
+
+
+def random_intervals(trials=300, bound=50):
+    """随机插入、删除、分裂与合并区间，与线性扫描的overlap、stab结果比较；返回True"""
+    for _ in range(trials):
+        ref = []
+        for _ in range(random.randrange(60)):
+            low = random.randrange(bound)
+            ref.append((low, low + random.randrange(15)))
+        ref.sort()
+        tree = IntervalTree.from_sorted(ref) if random.random() < 0.5 else IntervalTree(list(ref) or None)
+        for _ in range(random.randrange(40)):
+            if random.random() < 0.5 or not ref:
+                low = random.randrange(bound)
+                interval = (low, low + random.randrange(15))
+                tree.add(interval)
+                ref.append(interval)
+            else:
+                interval = random.choice(ref)
+                tree.delete(interval)
+                ref.remove(interval)
+            check_tree(tree)
+        if random.random() < 0.3:
+            left, right = tree.split((random.randrange(bound), 0))
+            check_tree(left)
+            check_tree(right)
+            left.join(right)
+            tree = left
+            check_tree(tree)
+        ref.sort()
+        for _ in range(20):
+            low = random.randrange(-5, bound + 20)
+            high = low + random.randrange(10)
+            expected = [interval for interval in ref if interval[0] <= high and interval[1] >= low]
+            assert list(tree.overlap(low, high)) == expected
+            assert list(tree.stab(low)) == [interval for interval in ref if interval[0] <= low <= interval[1]]
+    return True
+
+
+def test(treetype):
+    """Expects a red black tree type as an argument and runs some tests on objects of that type"""
+    print(treetype.__name__)
+    tree = treetype.from_sorted(range(1, 9), 'abcdefgh')
+    print("Expect [1, 2, 3, 4, 5, 6, 7, 8]:", list(tree))
+    print("Expect 4 6 [3, 4] c:", tree.floor(4), tree.successor(5), list(tree.range(3, 5)), tree.get(3))
+    print("Expect 3 8 4 5:", tree.select(2), tree.select(-1), tree.rank(5), tree.count_range(2, 7))
+    left, right = tree.split(5)
+    print("Expect [1, 2, 3, 4] [5, 6, 7, 8]:", list(left), list(right))
+    left.join(right)
+    print("Expect 8 0:", len(left), len(right))
+    print("Expect True:", random_updates(treetype))
+    print("Expect True:", random_split_join(treetype))
+    print("Expect True:", random_mapping(treetype))
+    try:
+        treetype.from_sorted([2, 1])
+    except ValueError as error:
+        print("Expect ValueError:", error)
+    try:
+        left.join(treetype([0]))
+    except ValueError as error:
+        print("Expect ValueError:", error)
+    try:
+        left[100]
+    except KeyError as error:
+        print("Expect KeyError:", error)
+
+
+if __name__ == '__main__':
+    test(RBTree)
+    test(PersistentRBTree)
+    print("Expect True:", random_snapshots())
+    try:
+        PersistentRBTree([1]).join(RBTree([2]))
+    except TypeError as error:
+        print("Expect TypeError:", error)
+
+    print('IntervalTree')
+    meetings = IntervalTree.from_sorted([(9, 10), (9, 12), (11, 13), (14, 15)], ['standup', 'review', 'lunch', 'demo'])
+    print("Expect [(9, 12), (11, 13)]:", list(meetings.overlap(11, 11)))
+    print("Expect [((9, 10), 'standup'), ((9, 12), 'review')]:", list(meetings.overlap_items(8, 9)))
+    print("Expect True:", random_intervals())
+    try:
+        meetings.add((3, 1))
+    except ValueError as error:
+        print("Expect ValueError:", error)
@@ -4,35 +4,81 @@ File: arrays.py
 An Array is like a list, but the client can use only [], len, iter, and str.
 
 To instantiate, use
-<variable> = Array(<capacity>, <optional fill value>)
+<variable> = Array(<capacity>, <optional source collection>, <optional typecode>, <optional fill value>)
 
-The fill value is None by default
+The fill value is None by default. When a typecode (see the standard array module, e.g. 'i', 'q', 'd') is given,
+the items are stored in one contiguous machine-typed buffer instead of a list of boxed objects, and the fill value
+is 0 by default.
+
+Slicing an Array returns an ArrayView, which shares the storage of the Array instead of copying it. A typed Array or
+ArrayView exposes its buffer through memoryview(), so it can be handed to struct, socket or NumPy code without
+copying the items one by one.
+
+A GrowthPolicy decides when the containers built on Array (ArrayBag, ArraySortedBag, ArrayStack, ArrayQueue) grow or
+shrink their array, so that a run of n insertions costs O(n) copying in total.
 """
+from array import array
 
 
 class Array(object):
     """Represents an array"""
 
     # Constructor
-    def __init__(self, capacity, source_collection=None):
-        """Capacity is the static size of the array. fillValue is placed at each position"""
-        self._items = list()
-        self._size = 0
-        for item in source_collection:
-            if self._size < capacity:
-                self._items.append(item)
-                self._size += 1
-            else:
+    def __init__(self, capacity, source_collection=None, typecode=None, fill_value=None):
+        """
+        Capacity is the static size of the array. fill_value is placed at each position, and the items of
+        source_collection, if it's present, are copied into the leading positions.
+        """
+        self._typecode = typecode
+        if typecode is None:
+            self._items = [fill_value] * capacity
+        elif fill_value is None:
+            self._items = array(typecode, bytes(capacity * array(typecode).itemsize))  # 全0的连续缓冲区
+        else:
+            self._items = array(typecode, [fill_value]) * capacity
+        if source_collection is not None:
+            if not isinstance(source_collection, Array) or source_collection.typecode != typecode:
+                source_collection = list(source_collection) if typecode is None else array(typecode, source_collection)
+            if len(source_collection) > capacity:
                 raise OverflowError('Capacity is not enough!')
+            self[:len(source_collection)] = source_collection  # 整块复制
+
+    @property
+    def typecode(self):
+        """-> The typecode of the storage, or None if the items are boxed objects"""
+        return self._typecode
+
+    def memoryview(self):
+        """
+        Precondition: self is typed
+        Raise: TypeError if the items of self are boxed objects
+        Postcondition: A memoryview sharing the storage of self is returned
+        """
+        if self._typecode is None:
+            raise TypeError('Only a typed Array supports the buffer protocol')
+        return memoryview(self._items)
+
+    def __buffer__(self, flags):
+        """Supports the buffer protocol (Python 3.12+) when self is typed"""
+        return self.memoryview()
+
+    def resize(self, capacity, count=None):
+        """
+        Return an Array of the given capacity, with the same storage type, holding the leading count items of self.
+        count defaults to as many items as fit. The new positions hold the fill value of the storage type.
+        """
+        if count is None:
+            count = min(capacity, len(self))
+        return Array(capacity, self[:count], self._typecode)
 
     # Mutator
     def __len__(self):
         """-> The capacity of the array"""
         return len(self._items)
-    
+
     def __str__(self):
         """-> The string representation of the array"""
-        return str(self._items)
+        return str(list(self))
 
     # Accessor
     def __iter__(self):
@@ -40,9 +86,120 @@ class Array(object):
         return iter(self._items)
 
     def __getitem__(self, index):
-        """Subscript operator for access at index"""
+        """Subscript operator for access at index, a slice returns an ArrayView sharing the storage of self"""
+        if isinstance(index, slice):
+            return ArrayView(self._items, self._typecode, range(len(self._items))[index])
         return self._items[index]
 
     def __setitem__(self, index, newItem):
-        """Subscript operator for replacement at index"""
-        self._items[index] = newItem
+        """
+        Subscript operator for replacement at index. A slice is replaced as one block by the same number of items,
+        taken from an Array, a list or any sized iterable.
+        """
+        if isinstance(index, slice):
+            self[index].assign(newItem)
+        else:
+            self._items[index] = newItem
+
+
+class ArrayView(Array):
+    """
+    Represents a window on the items of an Array. The view shares the storage of the Array, so a change through
+    either of them is visible through the other, and creating the view copies nothing.
+    """
+
+    # Constructor
+    def __init__(self, items, typecode, positions):
+        """items is the storage of the viewed Array, positions is the range of indexes of items seen by self"""
+        self._items = items
+        self._typecode = typecode
+        self._positions = positions
+
+    def memoryview(self):
+        """
+        Precondition: self is typed
+        Raise: TypeError if the items of self are boxed objects
+        Postcondition: A memoryview sharing the storage of self is returned
+        """
+        return Array.memoryview(self)[self._slice()]
+
+    def assign(self, source):
+        """
+        Precondition: source holds as many items as self
+        Raise: ValueError if the lengths differ, since an Array can not change its capacity
+        Postcondition: The items of source are copied into the positions of self as one block
+        """
+        if len(source) != len(self):
+            raise ValueError('Can not replace %d items with %d items' % (len(self), len(source)))
+        if self._typecode is None:
+            if isinstance(source, ArrayView):
+                source = source._items[source._slice()]
+            elif not isinstance(source, list):
+                source = list(source)
+            self._items[self._slice()] = source
+        else:
+            if isinstance(source, Array) and source.typecode == self._typecode:
+                source = source.memoryview()
+            elif not isinstance(source, array) or source.typecode != self._typecode:
+                source = array(self._typecode, source)
+            self.memoryview()[:] = source
+
+    def _slice(self):
+        """Return the slice of the viewed storage seen by self"""
+        positions = self._positions
+        stop = positions.stop if positions.stop >= 0 else None  # range以-1表示倒序切片越过了首个元素
+        return slice(positions.start, stop, positions.step)
+
+    def __len__(self):
+        """-> The number of items seen by self"""
+        return len(self._positions)
+
+    def __iter__(self):
+        """Supports traversal with a for loop"""
+        return map(self._items.__getitem__, self._positions)
+
+    def __getitem__(self, index):
+        """Subscript operator for access at index, a slice returns a narrower view on the same storage"""
+        if isinstance(index, slice):
+            return ArrayView(self._items, self._typecode, self._positions[index])
+        return self._items[self._positions[index]]
+
+    def __setitem__(self, index, newItem):
+        """Subscript operator for replacement at index, a slice is replaced as one block"""
+        if isinstance(index, slice):
+            self[index].assign(newItem)
+        else:
+            self._items[self._positions[index]] = newItem
+
+
+class GrowthPolicy(object):
+    """
+    Represents a geometric growth and shrink strategy for a growable array.
+
+    A full array grows by factor. An array shrinks by factor once no more than shrink_at of it is in use, so a
+    shrunken array is still only 1/2 full (with the defaults) and alternating insertions and removals at the boundary
+    do not resize it every time. The capacity never shrinks below minimum.
+    """
+
+    # Constructor
+    def __init__(self, factor=2, shrink_at=0.25, minimum=10):
+        """factor must be greater than 1, and shrink_at must be less than 1 / factor to leave a margin"""
+        if factor <= 1:
+            raise ValueError('Growth factor must be greater than 1!')
+        if not 0 <= shrink_at < 1 / factor:
+            raise ValueError('Shrink threshold must be less than 1 / factor!')
+        self.factor = factor
+        self.shrink_at = shrink_at
+        self.minimum = minimum
+
+    def grow(self, capacity, size):
+        """Return the capacity to grow to when an array of capacity items holds size items and one more arrives"""
+        if size < capacity:
+            return capacity
+        return max(int(capacity * self.factor), size + 1, self.minimum)
+
+    def shrink(self, capacity, size):
+        """Return the capacity to shrink to when an array of capacity items holds size items"""
+        if capacity <= self.minimum or size > capacity * self.shrink_at:
+            return capacity
+        return max(int(capacity / self.factor), self.minimum)
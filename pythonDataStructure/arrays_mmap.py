@@ -0,0 +1,93 @@
+"""
+File: arrays_mmap.py
+Author: Chen Zhang
+
+A MappedArray is an Array whose items are fixed-width records of a file, mapped into memory with mmap. Only the
+pages that are touched are loaded, so the array can be much larger than RAM.
+
+To instantiate, use
+<variable> = MappedArray(<path>, <optional capacity>, <optional typecode>, <optional readonly>)
+
+An existing file is opened without reading it, and its capacity is the number of records it holds. A new file is
+created with the given capacity, filled with 0.
+"""
+import mmap
+import os
+from array import array
+
+from arrays import Array
+
+
+class MappedArray(Array):
+    """Represents an array stored in a memory-mapped file"""
+
+    # Constructor
+    def __init__(self, path, capacity=None, typecode='q', readonly=False):
+        """
+        Map the file at path as an array of typecode records. If capacity is larger than the file, the file is
+        grown to capacity records first.
+        Raise: ValueError if the file is empty and no capacity is given, or its size is not a whole number of records
+        """
+        self._typecode = typecode
+        self._itemsize = array(typecode).itemsize
+        self._readonly = readonly
+        if not os.path.exists(path):
+            if readonly:
+                raise FileNotFoundError(path)
+            if not capacity:
+                raise ValueError('Capacity of a new MappedArray must be positive!')
+            with open(path, 'wb') as file:
+                file.truncate(capacity * self._itemsize)
+        elif not readonly and capacity and os.path.getsize(path) < capacity * self._itemsize:
+            with open(path, 'r+b') as file:
+                file.truncate(capacity * self._itemsize)
+
+        size = os.path.getsize(path)
+        if not size:
+            raise ValueError('%s is empty, a capacity is needed to map it!' % path)
+        if size % self._itemsize:
+            raise ValueError('Size %d of %s is not a multiple of %d-byte records!' % (size, path, self._itemsize))
+
+        self._file = open(path, 'rb' if readonly else 'r+b')
+        self._map = None
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE)
+            self._items = memoryview(self._map).cast(typecode)
+        except BaseException:
+            if self._map is not None:
+                self._map.close()
+            self._file.close()
+            raise
+
+    @property
+    def readonly(self):
+        """-> True if self is mapped read-only"""
+        return self._readonly
+
+    def resize(self, capacity, count=None):
+        """
+        Grow or shrink the file in place to capacity records and return self. The records stay where they are, so
+        count is not needed. Views and memoryviews taken from self before resizing must have been released.
+        """
+        if self._readonly:
+            raise TypeError('Can not resize a read-only MappedArray')
+        if capacity <= 0:
+            raise ValueError('Capacity of a MappedArray must be positive!')
+        self._items.release()
+        try:
+            self._map.resize(capacity * self._itemsize)  # 同时扩展或截断底层文件，新的记录为0
+        finally:
+            self._items = memoryview(self._map).cast(self._typecode)
+        return self
+
+    def flush(self):
+        """Write the dirty pages of self back to the file"""
+        if not self._readonly:
+            self._map.flush()
+
+    def close(self):
+        """Flush self and unmap the file. self can not be used any more"""
+        self.flush()
+        self._items.release()
+        self._map.close()
+        self._file.close()
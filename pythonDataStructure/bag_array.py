@@ -2,7 +2,7 @@
 File: arraybag.py
 Author: Ken Lambert
 """
-from arrays import Array
+from arrays import Array, GrowthPolicy
 
 
 class ArrayBag(object):
@@ -10,11 +10,20 @@ class ArrayBag(object):
 
     # Class variable
     DEFAULT_CAPACITY = 10
+    POLICY = GrowthPolicy(minimum=DEFAULT_CAPACITY)  # 所有基于数组的包共享的扩容与缩容策略
 
     # Constructor
-    def __init__(self, sourceCollection=None):
-        """Sets the initial state of self, which includes the contents of sourceCollection, if it's present."""
-        self._items = Array(ArrayBag.DEFAULT_CAPACITY)
+    def __init__(self, sourceCollection=None, typecode=None, storage=None, policy=None):
+        """
+        Sets the initial state of self, which includes the contents of sourceCollection, if it's present.
+        If typecode is given, the items are stored in a compact machine-typed array.
+        If storage is given, it is used as the array of self, e.g. a MappedArray.
+        If policy is given, it replaces ArrayBag.POLICY to decide when the array grows or shrinks.
+        """
+        if storage is None:
+            storage = Array(ArrayBag.DEFAULT_CAPACITY, typecode=typecode)
+        self._items = storage
+        self._policy = policy or ArrayBag.POLICY
         self._size = 0
         if sourceCollection:
             for item in sourceCollection:
@@ -42,7 +51,7 @@ class ArrayBag(object):
 
     def __add__(self, other):
         """Returns a new bag containing the contents of self and others"""
-        result = ArrayBag(self)
+        result = ArrayBag(self, self._items.typecode, policy=self._policy)
         for item in other:
             result.add(item)
         return result
@@ -61,12 +70,13 @@ class ArrayBag(object):
     # Mutator methods
     def clear(self):
         """Makes self become empty"""
-        self._items = Array(ArrayBag.DEFAULT_CAPACITY)
+        self._items = self._items.resize(ArrayBag.DEFAULT_CAPACITY, 0)
         self._size = 0
 
     def add(self, item):
         """Add items to self"""
         # Check array memory here and increase it if necessary
+        self._grow()
         self._items[len(self)] = item
         self._size += 1
 
@@ -94,3 +104,12 @@ class ArrayBag(object):
         # Decrement logical size
         self._size -= 1
         # Check memory here and decrease it if necessary
+        capacity = self._policy.shrink(len(self._items), len(self))
+        if capacity != len(self._items):
+            self._items = self._items.resize(capacity, len(self))
+
+    def _grow(self):
+        """Increase the array memory by the growth policy if it is full"""
+        capacity = self._policy.grow(len(self._items), len(self))
+        if capacity != len(self._items):
+            self._items = self._items.resize(capacity, len(self))
@@ -9,9 +9,9 @@ class ArraySortedBag(ArrayBag):
     """An array-based sorted bag implementation"""
 
     # Constructor
-    def __init__(self, sourceCollection=None):
+    def __init__(self, sourceCollection=None, typecode=None, storage=None, policy=None):
         """Sets the initial state of self, which includes the contents of sourceCollection, if it's present."""
-        ArrayBag.__init__(self, sourceCollection)
+        ArrayBag.__init__(self, sourceCollection, typecode, storage, policy)
 
     # Accessor methods
     def __contains__(self, item):
@@ -36,6 +36,7 @@ class ArraySortedBag(ArrayBag):
             ArrayBag.add(self, item)
         else:
             # Raise the array if it is full here
+            self._grow()
             # Search for first item >= new item
             targetIndex = 0
             while item > self._items[targetIndex]:
@@ -0,0 +1,45 @@
+"""
+File: bench_arrays.py
+Author: Chen Zhang
+
+Memory and access-time benchmark for the boxed (list) and typed (array module) storage modes of Array
+"""
+import timeit
+import tracemalloc
+
+from arrays import Array
+
+
+def memory_of(factory):
+    """Return the number of bytes allocated by factory(), measured with tracemalloc"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = factory()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def bench(n=10 ** 6, typecodes=(None, 'q')):
+    """Print memory and access-time numbers of an Array with n items in each storage mode"""
+    print('%-8s %12s %14s %14s' % ('mode', 'MB', 'read (ns/op)', 'write (ns/op)'))
+    for typecode in typecodes:
+        nbytes = memory_of(lambda: Array(n, range(n), typecode))
+        array = Array(n, range(n), typecode)
+
+        def read():
+            for i in range(n):
+                array[i]
+
+        def write():
+            for i in range(n):
+                array[i] = i
+
+        read_time = min(timeit.repeat(read, number=1, repeat=3)) / n * 1e9
+        write_time = min(timeit.repeat(write, number=1, repeat=3)) / n * 1e9
+        print('%-8s %12.2f %14.1f %14.1f' % (typecode or 'boxed', nbytes / 2 ** 20, read_time, write_time))
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,62 @@
+"""
+File: bench_bstree.py
+Author: Chen Zhang
+
+Benchmark of AVLTree against LinkedBST: n keys added in sorted, reverse-sorted and random order, then every key found
+once. LinkedBST degrades to a linked list on sorted input, O(n^2) in all, so it is only run up to linked_limit keys in
+those orders.
+
+bench_memory reports the tracemalloc bytes per node of each tree, with its add and find operations per second on random
+keys.
+"""
+import random
+import time
+import tracemalloc
+
+from tree_bstree_avl import AVLTree
+from tree_bstree_linked import LinkedBST
+
+
+def run(tree_type, keys):
+    """Return the seconds of adding keys, of finding them all, and the height of the tree"""
+    tree = tree_type()
+    start = time.perf_counter()
+    for key in keys:
+        tree.add(key)
+    middle = time.perf_counter()
+    for key in keys:
+        tree.find(key)
+    end = time.perf_counter()
+    return middle - start, end - middle, tree.height()
+
+
+def bench(n=10 ** 6, linked_limit=2 * 10 ** 3):
+    """Print add and find seconds and the height for each tree and insert order"""
+    orders = (('sorted', lambda n: list(range(n))), ('reverse', lambda n: list(range(n - 1, -1, -1))),
+              ('random', lambda n: random.sample(range(n), n)))
+    print('%-10s %-8s %9s %10s %10s %8s' % ('tree', 'order', 'n', 'add s', 'find s', 'height'))
+    for name, tree_type in (('LinkedBST', LinkedBST), ('AVLTree', AVLTree)):
+        for order, make_keys in orders:
+            size = linked_limit if tree_type is LinkedBST and order != 'random' else n
+            add_seconds, find_seconds, height = run(tree_type, make_keys(size))
+            print('%-10s %-8s %9d %10.3f %10.3f %8d' % (name, order, size, add_seconds, find_seconds, height))
+
+
+def bench_memory(n=10 ** 5):
+    """Print the bytes per node of each tree of n random keys, and its add and find operations per second"""
+    keys = random.sample(range(n), n)
+    print('%-10s %9s %12s %12s %12s' % ('tree', 'n', 'bytes/node', 'add/s', 'find/s'))
+    for name, tree_type in (('LinkedBST', LinkedBST), ('AVLTree', AVLTree)):
+        add_seconds, find_seconds, _ = run(tree_type, keys)
+        tracemalloc.start()
+        tree = tree_type(keys)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del tree
+        print('%-10s %9d %12.1f %12.0f %12.0f' % (name, n, size / n, n / add_seconds, n / find_seconds))
+
+
+if __name__ == '__main__':
+    bench()
+    print()
+    bench_memory()
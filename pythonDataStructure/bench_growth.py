@@ -0,0 +1,53 @@
+"""
+File: bench_growth.py
+Author: Chen Zhang
+
+Benchmark of n pushes onto an ArrayStack with the geometric GrowthPolicy against the old growth by a fixed
+DEFAULTCAPACITY. The time per push stays flat with the geometric policy, and grows with n with the fixed increment.
+"""
+import time
+
+from arrays import GrowthPolicy
+from stack_array import ArrayStack
+
+
+class FixedIncrementPolicy(GrowthPolicy):
+    """The old strategy: grow by a fixed increment and never shrink"""
+
+    def __init__(self, increment=ArrayStack.DEFAULTCAPACITY):
+        GrowthPolicy.__init__(self, minimum=increment)
+        self.increment = increment
+
+    def grow(self, capacity, size):
+        if size < capacity:
+            return capacity
+        return capacity + self.increment
+
+    def shrink(self, capacity, size):
+        return capacity
+
+
+def time_pushes(n, policy, typecode=None):
+    """Return the seconds n pushes take"""
+    stack = ArrayStack(typecode=typecode, policy=policy)
+    start = time.perf_counter()
+    for i in range(n):
+        stack.push(i)
+    return time.perf_counter() - start
+
+
+def bench(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), fixed_limit=10 ** 4):
+    """Print the time per push for each n; the fixed increment is only run up to fixed_limit because it is O(n^2)"""
+    policies = (('geometric', GrowthPolicy()), ('fixed +10', FixedIncrementPolicy()))
+    print('%-10s %10s %12s %14s' % ('policy', 'n', 'seconds', 'ns per push'))
+    for name, policy in policies:
+        for n in sizes:
+            if policy.__class__ is FixedIncrementPolicy and n > fixed_limit:
+                print('%-10s %10d %12s %14s' % (name, n, 'skipped', '-'))
+                continue
+            seconds = time_pushes(n, policy)
+            print('%-10s %10d %12.3f %14.1f' % (name, n, seconds, seconds / n * 1e9))
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,46 @@
+"""
+File: bench_queue.py
+Author: Chen Zhang
+
+Throughput benchmark of ArrayQueue: single add/pop against batched add_many/pop_many, for boxed and typed storage
+"""
+import time
+
+from queue_array import ArrayQueue
+
+
+def single(queue, n):
+    """n adds followed by n pops, one item at a time"""
+    add, pop = queue.add, queue.pop
+    for i in range(n):
+        add(i)
+    for _ in range(n):
+        pop()
+
+
+def batched(queue, n, batch=4096):
+    """n adds followed by n pops, batch items at a time"""
+    block = list(range(batch))
+    for _ in range(n // batch):
+        queue.add_many(block)
+    for _ in range(n // batch):
+        queue.pop_many(batch)
+
+
+def bench(n=2 ** 20, rounds=3):
+    """Print the enqueue + dequeue operations per second of each mode"""
+    print('%-8s %-8s %16s' % ('storage', 'mode', 'Mops per second'))
+    for typecode in (None, 'q'):
+        for name, run in (('single', single), ('batched', batched)):
+            queue = ArrayQueue(typecode=typecode)
+            best = None
+            for _ in range(rounds):
+                start = time.perf_counter()
+                run(queue, n)
+                seconds = time.perf_counter() - start
+                best = seconds if best is None else min(best, seconds)
+            print('%-8s %-8s %16.1f' % (typecode or 'boxed', name, 2 * n / best / 1e6))
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,55 @@
+"""
+File: bench_queue_async.py
+Author: Chen Zhang
+
+Benchmark of AsyncQueue and AsyncPriorityQueue against asyncio.Queue and asyncio.PriorityQueue: tasks concurrent
+producer tasks put one item each through a bounded queue, and one consumer task drains it
+"""
+import asyncio
+import random
+import time
+
+from queue_async import AsyncPriorityQueue, AsyncQueue
+
+
+async def run(work_queue, tasks, batched):
+    """Return the seconds it takes to move one item from each of tasks producers through work_queue"""
+    keys = [random.random() for _ in range(tasks)]
+
+    async def produce(key):
+        await work_queue.put(key)
+
+    async def consume():
+        received = 0
+        while received < tasks:
+            if batched:
+                received += len(await work_queue.get_many(1024))
+            else:
+                await work_queue.get()
+                received += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(consume(), *(produce(key) for key in keys))
+    return time.perf_counter() - start
+
+
+def bench(tasks=10 ** 5, maxsize=100):
+    """Print the items per second of each queue"""
+    cases = (
+        ('asyncio.Queue', lambda: asyncio.Queue(maxsize), False),
+        ('AsyncQueue get', lambda: AsyncQueue(maxsize=maxsize), False),
+        ('AsyncQueue get_many', lambda: AsyncQueue(maxsize=maxsize), True),
+        ('asyncio.PriorityQueue', lambda: asyncio.PriorityQueue(maxsize), False),
+        ('AsyncPriorityQueue get', lambda: AsyncPriorityQueue(maxsize=maxsize), False),
+        ('AsyncPriorityQueue get_many', lambda: AsyncPriorityQueue(maxsize=maxsize), True),
+    )
+    print('%-28s %16s' % ('queue', 'k items/second'))
+    for name, factory, batched in cases:
+        async def main():
+            return await run(factory(), tasks, batched)
+        seconds = asyncio.run(main())
+        print('%-28s %16.1f' % (name, tasks / seconds / 1e3))
+
+
+if __name__ == '__main__':
+    bench()
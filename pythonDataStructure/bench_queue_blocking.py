@@ -0,0 +1,60 @@
+"""
+File: bench_queue_blocking.py
+Author: Chen Zhang
+
+Throughput benchmark of BlockingQueue against the standard queue.Queue, with 1, 4 and 16 producer threads feeding
+one consumer thread
+"""
+import queue
+import threading
+import time
+
+from queue_array import ArrayQueue
+from queue_blocking import BlockingQueue
+from queue_linked import LinkedQueue
+
+
+def run(work_queue, producers, n, batched):
+    """Move n items through work_queue and return the seconds it took"""
+    share = n // producers
+
+    def produce():
+        for i in range(share):
+            work_queue.put(i)
+
+    def consume():
+        received = 0
+        while received < share * producers:
+            if batched:
+                received += len(work_queue.get_many(1024))
+            else:
+                work_queue.get()
+                received += 1
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    threads.append(threading.Thread(target=consume))
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def bench(n=200000, maxsize=1024):
+    """Print the items per second of each queue for 1, 4 and 16 producers"""
+    cases = (
+        ('queue.Queue', lambda: queue.Queue(maxsize), False),
+        ('Blocking/Linked get', lambda: BlockingQueue(maxsize=maxsize, queue_type=LinkedQueue), False),
+        ('Blocking/Linked get_many', lambda: BlockingQueue(maxsize=maxsize, queue_type=LinkedQueue), True),
+        ('Blocking/Array get_many', lambda: BlockingQueue(maxsize=maxsize, queue_type=ArrayQueue), True),
+    )
+    print('%-26s %10s %16s' % ('queue', 'producers', 'k items/second'))
+    for name, factory, batched in cases:
+        for producers in (1, 4, 16):
+            seconds = run(factory(), producers, n, batched)
+            print('%-26s %10d %16.1f' % (name, producers, n / seconds / 1e3))
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,111 @@
+"""
+File: bench_queue_priority.py
+Author: Chen Zhang
+
+Benchmark of HeapPriorityQueue against LinkedPriorityQueue: n adds of random priorities followed by n pops, and a
+scheduler-like workload that keeps n jobs pending while adding and popping one job at a time. The linked queue is only
+run up to linked_limit items because its add is O(n).
+
+bench_monotone() compares RadixPriorityQueue and BucketPriorityQueue with HeapPriorityQueue on monotone integer
+workloads: every popped priority p is re-added as p + a random step below span, as in a timer wheel (small span) or
+Dijkstra (larger span). The bucket queue is only run up to bucket_limit, since it keeps one bucket per priority of span.
+"""
+import random
+import time
+
+from queue_priority_heap import HeapPriorityQueue
+from queue_priority_linked import Comparable, LinkedPriorityQueue
+from queue_priority_radix import BucketPriorityQueue, RadixPriorityQueue
+
+
+def fill_drain(queue, priorities):
+    """Add every priority, then pop them all"""
+    for priority in priorities:
+        queue.add(Comparable(priority, priority))
+    while not queue.isEmpty():
+        queue.pop()
+
+
+def steady(queue, priorities, rounds):
+    """Keep len(priorities) jobs pending while rounds jobs are popped and re-added with a later priority"""
+    for priority in priorities:
+        queue.add(Comparable(priority, priority))
+    for _ in range(rounds):
+        job = queue.pop()
+        queue.add(Comparable(job.getDate(), job.getPriority() + random.random()))
+
+
+class OrderedJob(object):
+    """A job that only defines ordering methods, so two jobs are equal only if they are the same job"""
+
+    def __init__(self, index, priority):
+        self.index = index
+        self.priority = priority
+
+    def __lt__(self, other):
+        return self.priority < other.priority
+
+    def __ge__(self, other):
+        return self.priority >= other.priority
+
+
+def check_order(queue_type):
+    """Return True if items of equal priority come out of queue_type in the order they were added"""
+    expected = sorted(range(30), key=lambda index: (index % 3, index))
+    queue = queue_type(Comparable(index, index % 3) for index in range(30))
+    if [queue.pop().getDate() for _ in range(30)] != expected:
+        return False
+    queue = queue_type(OrderedJob(index, index % 3) for index in range(30))  # 只定义了比较大小的方法
+    return [queue.pop().index for _ in range(30)] == expected
+
+
+def bench(sizes=(10 ** 3, 10 ** 4, 10 ** 5), linked_limit=10 ** 4, rounds=10 ** 4):
+    """Print the seconds of both workloads for each queue and size"""
+    print('FIFO among equal priorities: linked %s, heap %s' %
+          (check_order(LinkedPriorityQueue), check_order(HeapPriorityQueue)))
+    print('%-10s %8s %14s %14s' % ('queue', 'n', 'fill+drain s', 'steady s'))
+    for name, queue_type in (('linked', LinkedPriorityQueue), ('heap', HeapPriorityQueue)):
+        for n in sizes:
+            if queue_type is LinkedPriorityQueue and n > linked_limit:
+                print('%-10s %8d %14s %14s' % (name, n, 'skipped', 'skipped'))
+                continue
+            priorities = [random.random() for _ in range(n)]
+            start = time.perf_counter()
+            fill_drain(queue_type(), priorities)
+            middle = time.perf_counter()
+            steady(queue_type(), priorities, rounds)
+            end = time.perf_counter()
+            print('%-10s %8d %14.3f %14.3f' % (name, n, middle - start, end - middle))
+
+
+def monotone(queue, n, rounds, span):
+    """Keep n integer priorities pending while rounds are popped and re-added a random step below span later"""
+    randrange = random.randrange
+    for _ in range(n):
+        queue.add(randrange(span))
+    for _ in range(rounds):
+        queue.add(queue.pop() + randrange(span))
+    while not queue.isEmpty():
+        queue.pop()
+
+
+def bench_monotone(sizes=(10 ** 3, 10 ** 5), spans=(16, 1024, 2 ** 20), rounds=2 * 10 ** 5, bucket_limit=2 ** 16):
+    """Print the seconds of the monotone workload for each queue, size and span"""
+    print('%-10s %8s %10s %10s' % ('queue', 'pending', 'span', 'seconds'))
+    for n in sizes:
+        for span in spans:
+            for name, factory in (('heap', HeapPriorityQueue), ('radix', RadixPriorityQueue),
+                                  ('bucket', lambda: BucketPriorityQueue(span=span))):
+                if name == 'bucket' and span > bucket_limit:
+                    print('%-10s %8d %10d %10s' % (name, n, span, 'skipped'))
+                    continue
+                random.seed(n + span)
+                start = time.perf_counter()
+                monotone(factory(), n, rounds, span)
+                print('%-10s %8d %10d %10.3f' % (name, n, span, time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    bench()
+    print()
+    bench_monotone()
@@ -0,0 +1,85 @@
+"""
+File: bench_queue_shared.py
+Author: Chen Zhang
+
+Throughput benchmark of SharedQueue against multiprocessing.Queue, which pickles every item through a pipe, moving
+n items from producer processes to one consumer process
+"""
+import multiprocessing
+import queue
+import time
+
+from queue_shared import SharedQueue
+
+
+def produce(work_queue, n, batch):
+    """Put n items into work_queue, in batches of batch items if batch > 1"""
+    sent = 0
+    while sent < n:
+        try:
+            if batch > 1:
+                count = min(batch, n - sent)
+                work_queue.add_many(range(sent, sent + count))
+                sent += count
+            elif isinstance(work_queue, SharedQueue):
+                work_queue.add(sent)
+                sent += 1
+            else:
+                work_queue.put(sent)
+                sent += 1
+        except OverflowError:
+            time.sleep(0)
+
+
+def consume(work_queue, n, batch):
+    """Take n items out of work_queue"""
+    received = 0
+    while received < n:
+        try:
+            if batch > 1:
+                received += len(work_queue.pop_many(min(batch, len(work_queue))))
+            elif isinstance(work_queue, SharedQueue):
+                work_queue.pop()
+                received += 1
+            else:
+                work_queue.get()
+                received += 1
+        except (ValueError, queue.Empty):
+            time.sleep(0)
+
+
+def run(work_queue, producers, n, batch):
+    """Move n items through work_queue and return the seconds it took"""
+    share = n // producers
+    processes = [multiprocessing.Process(target=produce, args=(work_queue, share, batch)) for _ in range(producers)]
+    processes.append(multiprocessing.Process(target=consume, args=(work_queue, share * producers, batch)))
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return time.perf_counter() - start
+
+
+def bench(n=200000, capacity=1024):
+    """Print the items per second of each queue for 1 and 4 producers"""
+    cases = (
+        ('multiprocessing.Queue', lambda producers: multiprocessing.Queue(capacity), 1),
+        ('SharedQueue typed', lambda producers: SharedQueue(capacity=capacity, multi=producers > 1), 1),
+        ('SharedQueue typed x256', lambda producers: SharedQueue(capacity=capacity, multi=producers > 1), 256),
+        ('SharedQueue pickled', lambda producers: SharedQueue(capacity=capacity, slot_size=32,
+                                                              multi=producers > 1), 1),
+    )
+    print('%-24s %10s %16s' % ('queue', 'producers', 'k items/second'))
+    for name, factory, batch in cases:
+        for producers in (1, 4):
+            work_queue = factory(producers)
+            seconds = run(work_queue, producers, n, batch)
+            print('%-24s %10d %16.1f' % (name, producers, n / seconds / 1e3))
+            if isinstance(work_queue, SharedQueue):
+                work_queue.close()
+                work_queue.unlink()
+
+
+if __name__ == '__main__':
+    bench()
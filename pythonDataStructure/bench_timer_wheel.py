@@ -0,0 +1,62 @@
+"""
+File: bench_timer_wheel.py
+Author: Chen Zhang
+
+Benchmark of TimingWheel against a timer queue on HeapPriorityQueue with Comparable(priority=deadline): n timers with
+random delays are scheduled, half of them are cancelled, and the clock runs until all the others expire. The heap has
+no O(1) cancel either, so cancelled timers are marked and skipped when they come out, as the wheel does.
+"""
+import random
+import time
+
+from queue_priority_heap import HeapPriorityQueue
+from queue_priority_linked import Comparable
+from timer_wheel import TimingWheel
+
+
+def run_wheel(delays):
+    """Schedule, cancel every other timer, then expire the rest; return the number of expired items"""
+    wheel = TimingWheel()
+    timers = [wheel.schedule(index, delay) for index, delay in enumerate(delays)]
+    for timer in timers[::2]:
+        timer.cancel()
+    expired = 0
+    while not wheel.isEmpty():
+        expired += len(wheel.advance(64))
+    return expired
+
+
+def run_heap(delays):
+    """The same workload on a priority queue of deadlines"""
+    queue = HeapPriorityQueue()
+    timers = []
+    for index, delay in enumerate(delays):
+        timer = Comparable([index, True], delay)  # 数据为 [item, pending]
+        queue.add(timer)
+        timers.append(timer)
+    for timer in timers[::2]:
+        timer.getDate()[1] = False
+    expired = 0
+    now = 0
+    while not queue.isEmpty():
+        now += 64
+        while not queue.isEmpty() and queue.peek().getPriority() < now:
+            if queue.pop().getDate()[1]:
+                expired += 1
+    return expired
+
+
+def bench(sizes=(10 ** 4, 10 ** 5, 10 ** 6), horizon=10 ** 5):
+    """Print the seconds of the workload for n timers with delays below horizon ticks"""
+    print('%-12s %10s %10s' % ('timers', 'n', 'seconds'))
+    for n in sizes:
+        delays = [random.randrange(horizon) for _ in range(n)]
+        for name, run in (('TimingWheel', run_wheel), ('heap', run_heap)):
+            start = time.perf_counter()
+            expired = run(delays)
+            print('%-12s %10d %10.3f' % (name, n, time.perf_counter() - start))
+            assert expired == n // 2
+
+
+if __name__ == '__main__':
+    bench()
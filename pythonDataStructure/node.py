@@ -6,6 +6,7 @@ Author: Ken Lambert
 
 class Node(object):
     """Represent a singly linked node"""
+    __slots__ = ('data', 'next')
 
     # Constructor
     def __init__(self, data, next=None):
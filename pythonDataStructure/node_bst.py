@@ -7,9 +7,20 @@ Author: Kim Lambert
 
 
 class BSTNode:
+    __slots__ = ('data', 'left', 'right', 'payload')
 
-    def __init__(self, data, left=None, right=None):
+    def __init__(self, data, left=None, right=None, payload=None):
         """Instantiate a BST node with default left and right of None."""
-        self.data = data  # 数据
+        self.data = data  # 数据（排序键）
         self.left = left  # 左节点
         self.right = right  # 右节点
+        self.payload = payload  # 映射模式下键对应的值
+
+
+class AVLNode(BSTNode):
+    __slots__ = ('height',)
+
+    def __init__(self, data, left=None, right=None, height=1, payload=None):
+        """Instantiate an AVL tree node, the root of a subtree of height levels."""
+        BSTNode.__init__(self, data, left, right, payload)
+        self.height = height  # 以该节点为根的子树的高度
@@ -3,27 +3,46 @@ File: queue_array.py
 Author: Chen Zhang
 
 Queue implement based on array
+
+The array is used as a ring buffer whose capacity is always a power of two, so an index wraps around with
+"index & self._mask" instead of a comparison. The items occupy the positions front, front + 1, ..., front + size - 1,
+taken modulo the capacity.
 """
-from arrays import Array
+from arrays import Array, GrowthPolicy
+
+
+def power_of_two(capacity):
+    """Return the smallest power of two that is not less than capacity"""
+    return 1 << max(capacity - 1, 0).bit_length()
 
 
 class ArrayQueue(object):
     """An array-based queue implement"""
 
-    default_capacity = 10
+    default_capacity = 16
+    policy = GrowthPolicy(minimum=default_capacity)
 
     # Constructor
-    def __init__(self, source_collection=None):
-        """Set the initial state of self, witch includes the contents of sourceCollection, if it's present"""
-        self._capacity = ArrayQueue.default_capacity
-        self._items = Array(self._capacity)
+    def __init__(self, source_collection=None, typecode=None, storage=None, policy=None):
+        """
+        Set the initial state of self, witch includes the contents of sourceCollection, if it's present.
+        If typecode is given, the items are stored in a compact machine-typed array.
+        If storage is given, it is used as the array of self, e.g. a MappedArray.
+        If policy is given, it replaces ArrayQueue.policy to decide when the array grows or shrinks. Capacities are
+        rounded up to a power of two.
+        """
+        if storage is None:
+            storage = Array(ArrayQueue.default_capacity, typecode=typecode)
+        elif len(storage) != power_of_two(len(storage)):
+            storage = storage.resize(power_of_two(len(storage)), 0)
+        self._policy = policy or ArrayQueue.policy
+        self._items = storage
+        self._set_capacity(len(storage))
         self._size = 0
-        self._front = None
-        self._rear = None
+        self._front = 0
 
         if source_collection is not None:
-            for item in source_collection:
-                self.add(item)
+            self.add_many(source_collection)
 
     # Mutator
     def isEmpty(self):
@@ -40,17 +59,9 @@ class ArrayQueue(object):
 
     def __iter__(self):
         """Supports iteration over a view of self"""
-        cursor = self._front
-        if self._front <= self._rear:
-            while cursor <= self._rear:
-                yield self._items[cursor]
-                cursor += 1
-        else:
-            # self._front > self._rear
-            for i in range(cursor, self._capacity):
-                yield self._items[i]
-            for j in range(0, self._rear + 1):
-                yield self._items[j]
+        items, mask, front = self._items, self._mask, self._front
+        for offset in range(self._size):
+            yield items[(front + offset) & mask]
 
     def __contains__(self, target):
         """Return True if item is in self, or False otherwise"""
@@ -73,17 +84,16 @@ class ArrayQueue(object):
 
     def __add__(self, other):
         """Return a new queue containing self and other"""
-        result = ArrayQueue(self)
-        for item in other:
-            result.add(item)
+        result = ArrayQueue(self, self._items.typecode, policy=self._policy)
+        result.add_many(other)
         return result
 
     def clear(self):
         """Make self become empty"""
-        self._items = Array(self._capacity)
+        self._items = self._items.resize(power_of_two(self._policy.minimum), 0)
+        self._set_capacity(len(self._items))
         self._size = 0
-        self._front = None
-        self._rear = None
+        self._front = 0
 
     # Accessor
     def peek(self):
@@ -92,30 +102,29 @@ class ArrayQueue(object):
         Raise: ValueError if self if empty
         Postcondition: Head item in self is returned
         """
-        if len(self) == 0:
+        if self._size == 0:
             raise ValueError('Queue is empty!')
-        item = self._items[self._front]
-        return item
+        return self._items[self._front]
 
     def add(self, item):
-        """
-        If self._rear == self.capacity - 1 and self._size < self._capacity, reset self._rear as 0;
-        if self._rear == self.capacity - 1 and self._size == self._capacity, capacity needs to be expanded.
-        """
-        if self.isEmpty():
-            self._front = 0
-        if self._rear == self._capacity - 1 and self._size < self._capacity:
-            self._rear = 0
-            self._items[self._rear] = item
-            self._size += 1
-        else:
-            if self._size == self._capacity:
-                self._capacity += ArrayQueue.default_capacity
-                new_items = Array(self._capacity, source_collection=self._items)  # construct a new larger array
-                self._items = new_items
-            self._rear += 1
-            self._items[self._rear] = item
-            self._size += 1
+        """Add item to the rear of self, doubling the ring buffer first if it is full."""
+        if self._size > self._mask:
+            self._grow(self._size + 1)
+        self._items[(self._front + self._size) & self._mask] = item
+        self._size += 1
+
+    def add_many(self, items):
+        """Add the items to the rear of self in order, with at most two block copies into the ring buffer."""
+        if not isinstance(items, (Array, list)):
+            items = list(items)
+        count = len(items)
+        if self._size + count > self._mask + 1:
+            self._grow(self._size + count)
+        rear = (self._front + self._size) & self._mask
+        first = min(count, self._mask + 1 - rear)  # 写到数组末尾为止的数量，其余的绕回数组开头
+        self._items[rear:rear + first] = items[:first]
+        self._items[:count - first] = items[first:]
+        self._size += count
 
     def pop(self):
         """
@@ -123,11 +132,71 @@ class ArrayQueue(object):
         Raise: ValueError if self if empty
         Postcondition: Head item in self is returned
         """
-        if len(self) == 0:
+        if self._size == 0:
             raise ValueError('Queue is empty!')
         item = self._items[self._front]
-        if self._front == self._capacity - 1:
-            self._front = 0
-        else:
-            self._front += 1
+        self._front = (self._front + 1) & self._mask
+        self._size -= 1
+        if self._size < self._shrink_below:
+            self._shrink()
         return item
+
+    def pop_many(self, count):
+        """
+        Precondition: 0 <= count <= len(self)
+        Raise: ValueError if self holds less than count items
+        Postcondition: An Array of the count head items in self is returned, copied out in at most two blocks
+        """
+        if not 0 <= count <= self._size:
+            raise ValueError('Queue holds %d items, can not pop %d!' % (self._size, count))
+        result = Array(count, typecode=self._items.typecode)
+        first = min(count, self._mask + 1 - self._front)
+        result[:first] = self._items[self._front:self._front + first]
+        result[first:] = self._items[:count - first]
+        self._front = (self._front + count) & self._mask
+        self._size -= count
+        if self._size < self._shrink_below:
+            self._shrink()
+        return result
+
+    def _grow(self, size):
+        """
+        Grow the ring buffer to hold size items, and unwrap it: the resized array keeps every item at its old
+        position, and the wrapped head part (positions 0 .. rear - 1) is moved right after the old end.
+        """
+        capacity = self._mask + 1
+        new_capacity = capacity
+        while new_capacity < size:
+            new_capacity = power_of_two(self._policy.grow(new_capacity, new_capacity))
+        self._items = self._items.resize(new_capacity, capacity)
+        wrapped = self._front + self._size - capacity
+        if wrapped > 0:
+            self._items[capacity:capacity + wrapped] = self._items[:wrapped]
+        self._set_capacity(new_capacity)
+
+    def _shrink(self):
+        """Shrink the ring buffer by the growth policy, moving the items to the start of the array first."""
+        capacity = self._mask + 1
+        new_capacity = self._policy.shrink(capacity, self._size)
+        if new_capacity >= capacity:
+            return
+        new_capacity = min(power_of_two(new_capacity), capacity // 2)
+        front, size = self._front, self._size
+        if front + size <= capacity:
+            self._items[:size] = self._items[front:front + size]
+        else:
+            head = capacity - front  # 数组末尾部分的元素数量
+            wrapped = Array(size - head, self._items[:size - head], self._items.typecode)
+            self._items[:head] = self._items[front:]
+            self._items[head:size] = wrapped
+        self._items = self._items.resize(new_capacity, size)
+        self._set_capacity(new_capacity)
+        self._front = 0
+
+    def _set_capacity(self, capacity):
+        """Record the mask of a ring buffer of capacity positions and the size below which it shrinks"""
+        self._mask = capacity - 1
+        if capacity > self._policy.minimum:
+            self._shrink_below = int(capacity * self._policy.shrink_at) + 1
+        else:
+            self._shrink_below = 0
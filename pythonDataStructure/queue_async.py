@@ -0,0 +1,226 @@
+"""
+File: queue_async.py
+Author: Chen Zhang
+
+asyncio front-ends for LinkedQueue and HeapPriorityQueue.
+
+put() and get() are coroutines: a task that has to wait parks a future of the running loop, and the task on the
+other side resolves it, so no thread hop is needed. maxsize bounds the queue, which makes producers wait (back
+pressure). "async for batch in queue" drains the queue in lists of items until it is closed and empty.
+"""
+import asyncio
+from collections import deque
+
+from queue_blocking import QueueClosed
+from queue_linked import LinkedQueue
+from queue_priority_heap import HeapPriorityQueue
+
+
+class AsyncQueue(object):
+    """An asyncio queue implement"""
+
+    queue_type = LinkedQueue
+
+    # Constructor
+    def __init__(self, source_collection=None, maxsize=0, queue_type=None):
+        """
+        Set the initial state of self, witch includes the contents of source_collection, if it's present.
+        maxsize is the most items self holds, or 0 for no bound. queue_type is the queue class that stores the items.
+        """
+        self._queue = (queue_type or self.queue_type)()
+        self._maxsize = maxsize
+        self._closed = False
+        self._getters = deque()  # 等待元素的消费者的future
+        self._putters = deque()  # 等待空位的生产者的future
+
+        if source_collection is not None:
+            for item in source_collection:
+                self.put_nowait(item)
+
+    @property
+    def maxsize(self):
+        """The most items self holds, or 0 for no bound"""
+        return self._maxsize
+
+    @property
+    def closed(self):
+        """True once close() has been called"""
+        return self._closed
+
+    def isEmpty(self):
+        """Return True if len(self)==0, or False otherwise"""
+        return len(self) == 0
+
+    def isFull(self):
+        """Return True if self holds maxsize items, or False otherwise"""
+        return 0 < self._maxsize <= len(self)
+
+    def __len__(self):
+        """Return the number of items in self"""
+        return len(self._queue)
+
+    def __str__(self):
+        """Return the string representation of self"""
+        return str(self._queue)
+
+    def __iter__(self):
+        """Supports iteration over a view of self"""
+        return iter(self._queue)
+
+    def __contains__(self, item):
+        """Return True if item is in self, or False otherwise"""
+        return item in self._queue
+
+    def clear(self):
+        """Make self become empty"""
+        self._queue.clear()
+        self._wakeup_all(self._putters)
+
+    # Accessor
+    def peek(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Head item in self is returned
+        """
+        return self._queue.peek()
+
+    def add(self, item):
+        """Add item to tail of self without waiting, see put_nowait()"""
+        self.put_nowait(item)
+
+    def pop(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Head item in self is returned
+        """
+        item = self._queue.pop()
+        self._wakeup_next(self._putters)
+        return item
+
+    def put_nowait(self, item):
+        """
+        Add item to tail of self.
+        Raise: asyncio.QueueFull if self is full
+        Raise: QueueClosed if self is closed
+        """
+        if self._closed:
+            raise QueueClosed('Queue is closed!')
+        if self.isFull():
+            raise asyncio.QueueFull
+        self._queue.add(item)
+        self._wakeup_next(self._getters)
+
+    async def put(self, item):
+        """
+        Add item to tail of self, waiting for a free slot while self is full.
+        Raise: QueueClosed if self is closed
+        """
+        while self.isFull() and not self._closed:
+            await self._park(self._putters, lambda: not self.isFull())
+        self.put_nowait(item)
+
+    def get_nowait(self):
+        """
+        Remove and return the head item of self.
+        Raise: asyncio.QueueEmpty if self is empty
+        Raise: QueueClosed if self is closed and empty
+        """
+        if self.isEmpty():
+            if self._closed:
+                raise QueueClosed('Queue is closed!')
+            raise asyncio.QueueEmpty
+        return self.pop()
+
+    async def get(self):
+        """
+        Remove and return the head item of self, waiting for an item while self is empty.
+        Raise: QueueClosed if self is closed and empty
+        """
+        while self.isEmpty() and not self._closed:
+            await self._park(self._getters, lambda: not self.isEmpty())
+        return self.get_nowait()
+
+    async def get_many(self, max_items=None):
+        """
+        Remove and return a list of up to max_items head items of self (all of them by default), waiting only while
+        self is empty.
+        Precondition: max_items is None or max_items >= 1
+        Raise: ValueError if max_items is less than 1
+        Raise: QueueClosed if self is closed and empty
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError('Can not get %d items!' % max_items)
+        items = [await self.get()]
+        count = len(self) if max_items is None else min(max_items - 1, len(self))
+        pop = self._queue.pop
+        items.extend(pop() for _ in range(count))
+        for _ in range(count):
+            self._wakeup_next(self._putters)
+        return items
+
+    async def batches(self, max_items=None):
+        """Yield lists of up to max_items items, as get_many() takes them, until self is closed and empty"""
+        while True:
+            try:
+                yield await self.get_many(max_items)
+            except QueueClosed:
+                return
+
+    def __aiter__(self):
+        """Supports "async for batch in self", see batches()"""
+        return self.batches()
+
+    def close(self):
+        """Stop accepting items, and wake up every waiting task"""
+        self._closed = True
+        self._wakeup_all(self._getters)
+        self._wakeup_all(self._putters)
+
+    def drain(self):
+        """Remove and return a list of every item left in self"""
+        pop = self._queue.pop
+        items = [pop() for _ in range(len(self))]
+        self._wakeup_all(self._putters)
+        return items
+
+    async def _park(self, waiters, ready):
+        """Wait on a new future in waiters until another task resolves it"""
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            # 若本任务已被唤醒后又被取消，则将唤醒传递给下一个等待者
+            if ready() and not waiter.cancelled():
+                self._wakeup_next(waiters)
+            raise
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        """Resolve the oldest future in waiters that is still pending"""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    @staticmethod
+    def _wakeup_all(waiters):
+        """Resolve every pending future in waiters"""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+class AsyncPriorityQueue(AsyncQueue):
+    """An asyncio priority queue implement, items come out in the order of HeapPriorityQueue"""
+
+    queue_type = HeapPriorityQueue
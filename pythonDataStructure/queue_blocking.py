@@ -0,0 +1,213 @@
+"""
+File: queue_blocking.py
+Author: Chen Zhang
+
+A thread-safe, bounded, blocking queue for producer and consumer threads, built on LinkedQueue or ArrayQueue.
+
+It has the methods of interface/queue_interface.py, plus put/get with timeouts, get_many for batched draining and a
+close/drain shutdown protocol:
+    1) close() stops producers: put() raises QueueClosed from then on;
+    2) consumers keep getting the items left in the queue, and get() raises QueueClosed once it is empty;
+    3) drain() takes every item left at once, e.g. to hand them over to another queue.
+Waiting threads are woken up by condition variables, nothing polls.
+"""
+import threading
+import time
+from queue import Empty, Full
+
+from queue_linked import LinkedQueue
+
+
+class QueueClosed(Exception):
+    """Raised by put() after close(), and by get() after close() once the queue is empty"""
+    pass
+
+
+class BlockingQueue(object):
+    """A bounded blocking queue implement"""
+
+    # Constructor
+    def __init__(self, source_collection=None, maxsize=0, queue_type=LinkedQueue):
+        """
+        Set the initial state of self, witch includes the contents of source_collection, if it's present.
+        maxsize is the most items self holds, or 0 for no bound. queue_type is the queue class that stores the items,
+        LinkedQueue or ArrayQueue.
+        """
+        self._queue = queue_type()
+        self._maxsize = maxsize
+        self._closed = False
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)  # 通知消费者：队列非空或已关闭
+        self._not_full = threading.Condition(self._lock)  # 通知生产者：队列未满或已关闭
+
+        if source_collection is not None:
+            for item in source_collection:
+                self.put(item, block=False)
+
+    @property
+    def maxsize(self):
+        """The most items self holds, or 0 for no bound"""
+        return self._maxsize
+
+    @property
+    def closed(self):
+        """True once close() has been called"""
+        return self._closed
+
+    def isEmpty(self):
+        """Return True if len(self)==0, or False otherwise"""
+        return len(self) == 0
+
+    def isFull(self):
+        """Return True if self holds maxsize items, or False otherwise"""
+        return 0 < self._maxsize <= len(self)
+
+    def __len__(self):
+        """Return the number of items in self"""
+        return len(self._queue)
+
+    def __str__(self):
+        """Return the string representation of self"""
+        return '{' + ', '.join(map(str, self)) + '}'
+
+    def __iter__(self):
+        """Supports iteration over a snapshot of self, taken under the lock"""
+        with self._lock:
+            items = list(self._queue)
+        return iter(items)
+
+    def __contains__(self, item):
+        """Return True if item is in self, or False otherwise"""
+        with self._lock:
+            return item in self._queue
+
+    def __eq__(self, other):
+        """Return True if self equals other, or False otherwise"""
+        if self is other:
+            return True
+        if type(self) != type(other):
+            return False
+        return list(self) == list(other)
+
+    def __add__(self, other):
+        """Return a new queue containing self and other, bounded by maxsize or by the combined length"""
+        items = list(self) + list(other)
+        maxsize = self._maxsize and max(self._maxsize, len(items))
+        return BlockingQueue(items, maxsize, type(self._queue))
+
+    def clear(self):
+        """Make self become empty"""
+        with self._lock:
+            self._queue.clear()
+            self._not_full.notify_all()
+
+    # Accessor
+    def peek(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Head item in self is returned
+        """
+        with self._lock:
+            return self._queue.peek()
+
+    def add(self, item):
+        """Add item to tail of self, waiting for a free slot if self is full"""
+        self.put(item)
+
+    def pop(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Head item in self is returned
+        """
+        with self._lock:
+            item = self._queue.pop()
+            self._not_full.notify()
+            return item
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Add item to tail of self. If self is full, wait until a slot is free, for at most timeout seconds.
+        Raise: Full if no slot got free in time, or at once if block is False
+        Raise: QueueClosed if self is closed
+        """
+        with self._not_full:
+            if self._maxsize > 0:
+                self._wait(self._not_full, lambda: len(self._queue) < self._maxsize, block, timeout, Full)
+            if self._closed:
+                raise QueueClosed('Queue is closed!')
+            self._queue.add(item)
+            self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """
+        Remove and return the head item of self. If self is empty, wait for an item, for at most timeout seconds.
+        Raise: Empty if no item arrived in time, or at once if block is False
+        Raise: QueueClosed if self is closed and empty
+        """
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: len(self._queue), block, timeout, Empty)
+            if not len(self._queue):
+                raise QueueClosed('Queue is closed!')
+            item = self._queue.pop()
+            self._not_full.notify()
+            return item
+
+    def get_many(self, max_items=None, block=True, timeout=None):
+        """
+        Remove and return a list of up to max_items head items of self (all of them by default), taken under one
+        lock. Waits like get() only while self is empty.
+        Raise: Empty if no item arrived in time, or at once if block is False
+        Raise: QueueClosed if self is closed and empty
+        """
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: len(self._queue), block, timeout, Empty)
+            if not len(self._queue):
+                raise QueueClosed('Queue is closed!')
+            items = self._take(len(self._queue) if max_items is None else min(max_items, len(self._queue)))
+            self._not_full.notify(len(items))
+            return items
+
+    def close(self):
+        """Stop accepting items, and wake up every waiting thread"""
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def drain(self):
+        """Remove and return a list of every item left in self"""
+        with self._lock:
+            items = self._take(len(self._queue))
+            self._not_full.notify_all()
+            return items
+
+    def _take(self, count):
+        """Pop count items from the underlying queue, as one batch if it supports pop_many. The lock must be held."""
+        if hasattr(self._queue, 'pop_many'):
+            return list(self._queue.pop_many(count))
+        pop = self._queue.pop
+        return [pop() for _ in range(count)]
+
+    def _wait(self, condition, ready, block, timeout, error):
+        """
+        Wait on condition until ready() is true or self is closed. The lock of condition must be held.
+        Raise: error if block is False, or timeout seconds pass first
+        """
+        if ready() or self._closed:
+            return
+        if not block:
+            raise error
+        if timeout is None:
+            while not ready() and not self._closed:
+                condition.wait()
+        else:
+            if timeout < 0:
+                raise ValueError('timeout must be a non-negative number')
+            deadline = time.monotonic() + timeout
+            while not ready() and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise error
+                condition.wait(remaining)
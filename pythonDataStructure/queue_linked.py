@@ -38,14 +38,14 @@ class LinkedQueue(object):
     def __iter__(self):
         """Supports iteration over a view of self"""
         cursor = self._front
-        while cursor.data is not None:
+        for _ in range(self._size):
             yield cursor.data
             cursor = cursor.next
 
     def __contains__(self, item):
         """Return True if item is in self, or False otherwise"""
         for cursor in iter(self):
-            if cursor.data == item:
+            if cursor == item:
                 return True
         return False
 
@@ -89,7 +89,7 @@ class LinkedQueue(object):
     def add(self, newItem):
         """Add newItem to the rear of the queue."""
         newNode = Node(newItem, None)
-        if self.isEmpty:
+        if self.isEmpty():
             self._front = newNode
         else:
             self._rear.next = newNode
@@ -0,0 +1,113 @@
+"""
+File: queue_priority_heap.py
+Author: Chen Zhang
+
+Priority queue implement based on a binary heap, a drop-in replacement for LinkedPriorityQueue.
+
+Items come out smallest first, and items of equal priority come out in the order they were added, as in
+LinkedPriorityQueue. The heap is a list of _Entry(item, sequence) ordered by heapq, where sequence counts the adds:
+it breaks ties between items neither of which is < the other, so add and pop are O(log n) instead of the O(n) walk of
+the linked list. Entries compare items with < only, so items need not define __eq__ consistently with their order.
+"""
+from heapq import heapify, heappop, heappush
+from itertools import count
+
+
+class _Entry(object):
+    """A heap entry: an item and its add sequence number"""
+    __slots__ = ('item', 'sequence')
+
+    def __init__(self, item, sequence):
+        self.item = item
+        self.sequence = sequence
+
+    def __lt__(self, other):
+        """Order by item, then by sequence among items neither of which is < the other"""
+        return self.item < other.item or (not other.item < self.item and self.sequence < other.sequence)
+
+
+class HeapPriorityQueue(object):
+    """A heap-based priority queue implement"""
+
+    # Constructor
+    def __init__(self, source_collection=None):
+        """Set the initial state of self, which includes the contents of source_collection, if it's present"""
+        self._heap = []
+        self._counter = count()  # 入队序号，保证同优先级元素先进先出
+
+        if source_collection is not None:
+            self._heap = [_Entry(item, sequence) for item, sequence in zip(source_collection, self._counter)]
+            heapify(self._heap)
+
+    # Mutator
+    def isEmpty(self):
+        """Return True if len(self)==0, or False otherwise"""
+        return len(self) == 0
+
+    def __len__(self):
+        """Return the number of items in self"""
+        return len(self._heap)
+
+    def __str__(self):
+        """Return the string representation of self"""
+        return '{' + ', '.join(map(str, self)) + '}'
+
+    def __iter__(self):
+        """Supports iteration over a view of self, in the order pop() would return the items"""
+        for entry in sorted(self._heap):
+            yield entry.item
+
+    def __contains__(self, target):
+        """Return True if item is in self, or False otherwise"""
+        for entry in self._heap:
+            if entry.item == target:
+                return True
+        return False
+
+    def __eq__(self, other):
+        """Return True if self equals other, or False otherwise"""
+        if type(self) != type(other):
+            return False
+        elif len(self) == len(other):
+            for item in other:
+                if item not in self:
+                    return False
+        else:
+            return False
+        return True
+
+    def __add__(self, other):
+        """Return a new priority queue containing self and other"""
+        result = HeapPriorityQueue(self)
+        for item in other:
+            result.add(item)
+        return result
+
+    def clear(self):
+        """Make self become empty"""
+        self._heap = []
+
+    # Accessor
+    def peek(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Item of highest priority in self is returned
+        """
+        if not self._heap:
+            raise ValueError('Queue is empty')
+        return self._heap[0].item
+
+    def add(self, newItem):
+        """Inserts newItem after items of higher or equal priority and ahead of items of lower priority"""
+        heappush(self._heap, _Entry(newItem, next(self._counter)))
+
+    def pop(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Item of highest priority in self is removed and returned
+        """
+        if not self._heap:
+            raise ValueError('Queue is empty')
+        return heappop(self._heap).item
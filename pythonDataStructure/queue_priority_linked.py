@@ -16,12 +16,12 @@ class LinkedPriorityQueue(LinkedQueue):
 
     def add(self, newItem):
         """Inserts newItem after items of greater or equal priority or ahead of items of lesser priority"""
-        global trailer
         if self.isEmpty() or newItem >= self._rear.data:
             # New item goes at rear
             LinkedQueue.add(self, newItem)
         else:
             # Search for a  position where it's less
+            trailer = None
             probe = self._front
             while newItem >= probe.data:
                 trailer = probe
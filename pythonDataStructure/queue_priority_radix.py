@@ -0,0 +1,239 @@
+"""
+File: queue_priority_radix.py
+Author: Chen Zhang
+
+Priority queue implement based on a radix heap, for non-negative integer priorities that never go below the last
+popped one (a monotone workload, e.g. tick deadlines and hop counts).
+
+Bucket i holds the items whose priority differs from the last popped priority in bit i - 1 at the highest, so bucket 0
+holds the items of exactly the last popped priority. pop() takes from bucket 0; when it is empty, the first non-empty
+bucket is emptied into the lower buckets around its smallest priority. An item only ever moves to a lower bucket, so
+each item is moved at most once per bit of the priorities: O(1) amortized per operation for bounded priorities.
+Items of equal priority come out in the order they were added, as in LinkedPriorityQueue.
+
+BucketPriorityQueue is the simpler bucket queue for priorities that stay within span of the last popped one: one
+bucket per priority in a ring of span buckets, so add is a single append and pop moves a cursor over the empty buckets.
+"""
+from collections import deque
+from operator import itemgetter
+
+
+class RadixPriorityQueue(object):
+    """A radix-heap-based priority queue implement"""
+
+    # Constructor
+    def __init__(self, source_collection=None, key=None):
+        """
+        Set the initial state of self, which includes the contents of source_collection, if it's present.
+        key returns the priority of an item, a non-negative int; the item itself by default. For Comparable items
+        use key=Comparable.getPriority.
+        """
+        self._key = key
+        self.clear()
+
+        if source_collection is not None:
+            for item in source_collection:
+                self.add(item)
+
+    # Mutator
+    def isEmpty(self):
+        """Return True if len(self)==0, or False otherwise"""
+        return len(self) == 0
+
+    def __len__(self):
+        """Return the number of items in self"""
+        return self._size
+
+    def __str__(self):
+        """Return the string representation of self"""
+        return '{' + ', '.join(map(str, self)) + '}'
+
+    def __iter__(self):
+        """Supports iteration over a view of self, in the order pop() would return the items"""
+        for bucket in self._buckets:
+            for _, item in sorted(bucket, key=itemgetter(0)):
+                yield item
+
+    def __contains__(self, target):
+        """Return True if item is in self, or False otherwise"""
+        for bucket in self._buckets:
+            for _, item in bucket:
+                if item == target:
+                    return True
+        return False
+
+    def __eq__(self, other):
+        """Return True if self equals other, or False otherwise"""
+        if type(self) != type(other):
+            return False
+        elif len(self) == len(other):
+            for item in other:
+                if item not in self:
+                    return False
+        else:
+            return False
+        return True
+
+    def __add__(self, other):
+        """Return a new priority queue containing self and other"""
+        result = RadixPriorityQueue(key=self._key)
+        result._last = self._last  # 先确定基准，再按基准放入各元素
+        for item in self:
+            result.add(item)
+        for item in other:
+            result.add(item)
+        return result
+
+    def clear(self):
+        """Make self become empty, and accept any non-negative priority again"""
+        self._buckets = [deque()]  # 桶中是 (priority, item)，0 号桶为队列，其余桶只追加、整体重新分配
+        self._last = 0  # 最后一次弹出的优先级
+        self._size = 0
+
+    # Accessor
+    def peek(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Item of highest priority in self is returned
+        """
+        if self._size == 0:
+            raise ValueError('Queue is empty')
+        buckets = self._buckets
+        if buckets[0]:
+            return buckets[0][0][1]
+        # 不重新分配，以免提高 add 检查的最后弹出优先级；最小优先级中最先加入的元素即 pop 将返回的元素
+        index = 1
+        while not buckets[index]:
+            index += 1
+        return min(buckets[index], key=itemgetter(0))[1]
+
+    def add(self, newItem):
+        """
+        Inserts newItem after items of higher or equal priority and ahead of items of lower priority.
+        Raise: ValueError if the priority of newItem is below the last popped priority
+        """
+        priority = newItem if self._key is None else self._key(newItem)
+        last = self._last
+        if priority < last:
+            raise ValueError('Priority %r is below the last popped priority %r!' % (priority, last))
+        index = (priority ^ last).bit_length()
+        buckets = self._buckets
+        while index >= len(buckets):
+            buckets.append([])
+        buckets[index].append((priority, newItem))
+        self._size += 1
+
+    def pop(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Item of highest priority in self is removed and returned
+        """
+        if self._size == 0:
+            raise ValueError('Queue is empty')
+        bucket = self._buckets[0]
+        if not bucket:
+            self._redistribute()
+        self._size -= 1
+        return bucket.popleft()[1]
+
+    def _redistribute(self):
+        """Empty the first non-empty bucket into the lower buckets, around its smallest priority"""
+        buckets = self._buckets
+        index = 1
+        while not buckets[index]:
+            index += 1
+        entries = buckets[index]
+        buckets[index] = []
+        last = self._last = min(map(itemgetter(0), entries))
+        for entry in entries:
+            buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+
+class BucketPriorityQueue(RadixPriorityQueue):
+    """A bucket-queue-based priority queue implement, for priorities below the last popped priority + span"""
+
+    # Constructor
+    def __init__(self, source_collection=None, key=None, span=1024):
+        """
+        Set the initial state of self, which includes the contents of source_collection, if it's present.
+        key returns the priority of an item, a non-negative int; the item itself by default. Every pending priority
+        must be below the last popped priority + span.
+        """
+        self._span = span
+        RadixPriorityQueue.__init__(self, source_collection, key)
+
+    def __iter__(self):
+        """Supports iteration over a view of self, in the order pop() would return the items"""
+        for priority in range(self._last, self._last + self._span):
+            yield from self._buckets[priority % self._span]
+
+    def __contains__(self, target):
+        """Return True if item is in self, or False otherwise"""
+        for bucket in self._buckets:
+            if target in bucket:
+                return True
+        return False
+
+    def __add__(self, other):
+        """Return a new priority queue containing self and other"""
+        result = BucketPriorityQueue(key=self._key, span=self._span)
+        result._last = result._floor = self._floor  # 先确定范围，再放入各元素
+        for item in self:
+            result.add(item)
+        for item in other:
+            result.add(item)
+        return result
+
+    def clear(self):
+        """Make self become empty, and accept any priority below span again"""
+        self._buckets = [deque() for _ in range(self._span)]  # 环形桶数组，优先级 p 的元素在 p % span 号桶
+        self._floor = 0  # 最后一次弹出的优先级，add 的下限
+        self._last = 0  # 游标，不大于任何待弹出的优先级
+        self._size = 0
+
+    # Accessor
+    def peek(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Item of highest priority in self is returned
+        """
+        if self._size == 0:
+            raise ValueError('Queue is empty')
+        return self._advance()[0]
+
+    def add(self, newItem):
+        """
+        Inserts newItem after items of higher or equal priority and ahead of items of lower priority.
+        Raise: ValueError if the priority of newItem is not within span of the last popped priority
+        """
+        priority = newItem if self._key is None else self._key(newItem)
+        if not self._floor <= priority < self._floor + self._span:
+            raise ValueError('Priority %r is out of [%r, %r)!' % (priority, self._floor, self._floor + self._span))
+        self._buckets[priority % self._span].append(newItem)
+        if priority < self._last:
+            self._last = priority  # peek 后游标可能已越过该优先级
+        self._size += 1
+
+    def pop(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Item of highest priority in self is removed and returned
+        """
+        if self._size == 0:
+            raise ValueError('Queue is empty')
+        self._size -= 1
+        bucket = self._advance()
+        self._floor = self._last
+        return bucket.popleft()
+
+    def _advance(self):
+        """Move the cursor to the first non-empty bucket, and return it"""
+        buckets, span, last = self._buckets, self._span, self._last
+        while not buckets[last % span]:
+            last += 1
+        self._last = last
+        return buckets[last % span]
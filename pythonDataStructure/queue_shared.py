@@ -0,0 +1,271 @@
+"""
+File: queue_shared.py
+Author: Chen Zhang
+
+A queue shared between processes, stored in multiprocessing.shared_memory instead of being pickled through a pipe.
+
+It uses the ring-buffer logic of ArrayQueue: a power-of-two number of fixed-size slots, indexed by masking. Its
+state is kept in the shared block as two ever-increasing counters, head (items popped) and tail (items added), so
+len(self) == tail - head. Only the producer side writes tail and only the consumer side writes head. Each counter is
+one aligned 8-byte word on its own cache line, so a single producer and a single consumer (SPSC) need no lock. With
+multi=True, producers share one lock and consumers share another (MPMC).
+
+Two record modes:
+    1) typecode (e.g. 'q', 'd'): every slot holds one machine-typed number, written straight into shared memory;
+    2) slot_size: every slot holds a pickled object of up to slot_size - 4 bytes, behind a 4-byte length.
+
+Pass the queue to a multiprocessing.Process as an argument (it pickles as a handle to the shared block and its
+locks), or attach to a lock-free queue by name with SharedQueue.attach(name).
+"""
+import pickle
+import struct
+from array import array
+from contextlib import nullcontext
+from multiprocessing import Lock
+from multiprocessing.shared_memory import SharedMemory
+
+from arrays import Array
+from queue_array import power_of_two
+
+HEADER_SIZE = 128  # 头部：head、tail计数器各占一个缓存行，容量等元数据跟在head之后
+HEAD, CAPACITY, SLOT_SIZE, TYPECODE = 0, 1, 2, 3  # 计数器视图('Q')中的下标
+TAIL = 8
+LENGTH = struct.Struct('I')  # pickle模式下每个槽位开头的长度字段
+
+
+class SharedArray(Array):
+    """Represents an Array over a memoryview of shared memory"""
+
+    def __init__(self, items, typecode):
+        """items is a memoryview cast to typecode"""
+        self._items = items
+        self._typecode = typecode
+
+
+class SharedQueue(object):
+    """A shared-memory queue implement"""
+
+    # Constructor
+    def __init__(self, source_collection=None, capacity=1024, typecode='q', slot_size=None, multi=False, name=None):
+        """
+        Create the shared block of a queue of capacity slots (rounded up to a power of two), which includes the
+        contents of source_collection, if it's present.
+        If slot_size is given, every slot holds a pickled object of up to slot_size - 4 bytes, and typecode is not used.
+        If multi is True, any number of processes may add and pop at the same time.
+        """
+        capacity = power_of_two(capacity)
+        if slot_size is None:
+            slot_size = array(typecode).itemsize
+        else:
+            typecode = None
+        memory = SharedMemory(name, create=True, size=HEADER_SIZE + capacity * slot_size)
+        header = memory.buf[:HEADER_SIZE].cast('Q')
+        header[CAPACITY], header[SLOT_SIZE], header[TYPECODE] = capacity, slot_size, ord(typecode or '\0')
+        header.release()
+        self._open(memory, (Lock(), Lock()) if multi else None)
+
+        if source_collection is not None:
+            self.add_many(source_collection)
+
+    @classmethod
+    def attach(cls, name):
+        """Return a handle to the lock-free (SPSC) queue whose shared block is called name"""
+        queue = cls.__new__(cls)
+        queue._open(SharedMemory(name), None)
+        return queue
+
+    def _open(self, memory, locks):
+        """Build the views of self over the shared block memory"""
+        self._memory = memory
+        self._locks = locks
+        self._header = memory.buf[:HEADER_SIZE].cast('Q')
+        self._mask = self._header[CAPACITY] - 1
+        self._slot_size = self._header[SLOT_SIZE]
+        typecode = chr(self._header[TYPECODE]) if self._header[TYPECODE] else None
+        self._data = memory.buf[HEADER_SIZE:]
+        self._slots = SharedArray(self._data.cast(typecode), typecode) if typecode else None
+        self._add_lock = locks[0] if locks else nullcontext()
+        self._pop_lock = locks[1] if locks else nullcontext()
+
+    def __getstate__(self):
+        """Pickle self as the name of its shared block and its locks"""
+        return self._memory.name, self._locks
+
+    def __setstate__(self, state):
+        """Attach to the shared block of a pickled queue"""
+        name, locks = state
+        self._open(SharedMemory(name), locks)
+
+    @property
+    def name(self):
+        """The name of the shared block of self"""
+        return self._memory.name
+
+    @property
+    def capacity(self):
+        """The number of slots of self"""
+        return self._mask + 1
+
+    # Mutator
+    def isEmpty(self):
+        """Return True if len(self)==0, or False otherwise"""
+        return len(self) == 0
+
+    def __len__(self):
+        """Return the number of items in self"""
+        return self._header[TAIL] - self._header[HEAD]
+
+    def __str__(self):
+        """Return the string representation of self"""
+        return '{' + ', '.join(map(str, self)) + '}'
+
+    def __iter__(self):
+        """Supports iteration over a view of self, the items between head and tail when it starts"""
+        head, tail = self._header[HEAD], self._header[TAIL]
+        for index in range(head, tail):
+            yield self._read(index & self._mask)
+
+    def __contains__(self, target):
+        """Return True if item is in self, or False otherwise"""
+        for item in iter(self):
+            if item == target:
+                return True
+        return False
+
+    def __eq__(self, other):
+        """Return True if self equals other, or False otherwise"""
+        if self is other:
+            return True
+        if type(self) != type(other):
+            return False
+        return list(self) == list(other)
+
+    def __add__(self, other):
+        """Return a new queue, in a new shared block, containing self and other"""
+        items = list(self) + list(other)
+        return SharedQueue(items, max(self.capacity, len(items)), self._slots and self._slots.typecode,
+                           None if self._slots else self._slot_size, self._locks is not None)
+
+    def clear(self):
+        """Make self become empty"""
+        with self._add_lock, self._pop_lock:
+            self._header[HEAD] = self._header[TAIL]
+
+    # Accessor
+    def peek(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Head item in self is returned
+        """
+        head = self._header[HEAD]
+        if head == self._header[TAIL]:
+            raise ValueError('Queue is empty!')
+        return self._read(head & self._mask)
+
+    def add(self, item):
+        """
+        Add item to tail of self.
+        Raise: OverflowError if every slot is taken, since shared memory can not grow
+        """
+        with self._add_lock:
+            tail = self._header[TAIL]
+            if tail - self._header[HEAD] > self._mask:
+                raise OverflowError('Queue is full!')
+            self._write(tail & self._mask, item)
+            self._header[TAIL] = tail + 1  # 先写入槽位，再发布tail
+
+    def add_many(self, items):
+        """
+        Add the items to tail of self in order, with at most two block copies in the typed record mode.
+        Raise: OverflowError if there are not enough free slots; then nothing is added
+        """
+        if not isinstance(items, (Array, list)):
+            items = list(items)
+        count = len(items)
+        with self._add_lock:
+            tail = self._header[TAIL]
+            if tail - self._header[HEAD] + count > self._mask + 1:
+                raise OverflowError('Queue is full!')
+            rear = tail & self._mask
+            if self._slots is not None:
+                first = min(count, self._mask + 1 - rear)
+                self._slots[rear:rear + first] = items[:first]
+                self._slots[:count - first] = items[first:]
+            else:
+                for offset, item in enumerate(items):
+                    self._write((tail + offset) & self._mask, item)
+            self._header[TAIL] = tail + count
+
+    def pop(self):
+        """
+        Precondition: Self is not empty
+        Raise: ValueError if self if empty
+        Postcondition: Head item in self is returned
+        """
+        with self._pop_lock:
+            head = self._header[HEAD]
+            if head == self._header[TAIL]:
+                raise ValueError('Queue is empty!')
+            item = self._read(head & self._mask)
+            self._header[HEAD] = head + 1  # 先读出槽位，再释放它
+            return item
+
+    def pop_many(self, count):
+        """
+        Precondition: 0 <= count <= len(self)
+        Raise: ValueError if self holds less than count items
+        Postcondition: The count head items in self are returned, as an Array copied out in at most two blocks in the
+                       typed record mode, or as a list in the pickled mode
+        """
+        with self._pop_lock:
+            head = self._header[HEAD]
+            if not 0 <= count <= self._header[TAIL] - head:
+                raise ValueError('Queue holds %d items, can not pop %d!' % (len(self), count))
+            front = head & self._mask
+            if self._slots is not None:
+                result = Array(count, typecode=self._slots.typecode)
+                first = min(count, self._mask + 1 - front)
+                result[:first] = self._slots[front:front + first]
+                result[first:] = self._slots[:count - first]
+            else:
+                result = [self._read((head + offset) & self._mask) for offset in range(count)]
+            self._header[HEAD] = head + count
+            return result
+
+    def close(self):
+        """Detach self from the shared block. The creator should call unlink() as well once every process is done"""
+        if self._slots is not None:
+            self._slots._items.release()
+        self._header.release()
+        self._data.release()
+        self._memory.close()
+
+    def __del__(self):
+        """Release the views of self, which would otherwise keep the shared block from being closed"""
+        if hasattr(self, '_memory'):
+            self.close()
+
+    def unlink(self):
+        """Destroy the shared block"""
+        self._memory.unlink()
+
+    def _read(self, slot):
+        """Return the item in slot"""
+        if self._slots is not None:
+            return self._slots[slot]
+        offset = slot * self._slot_size
+        length = LENGTH.unpack_from(self._data, offset)[0]
+        return pickle.loads(self._data[offset + LENGTH.size:offset + LENGTH.size + length])
+
+    def _write(self, slot, item):
+        """Store item in slot"""
+        if self._slots is not None:
+            self._slots[slot] = item
+            return
+        blob = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self._slot_size - LENGTH.size:
+            raise ValueError('Pickled item takes %d bytes, a slot holds %d' % (len(blob), self._slot_size - LENGTH.size))
+        offset = slot * self._slot_size
+        LENGTH.pack_into(self._data, offset, len(blob))
+        self._data[offset + LENGTH.size:offset + LENGTH.size + len(blob)] = blob
@@ -4,20 +4,28 @@ Author: Chen Zhang
 
 基于数组(array)的栈(stack)的实现
 """
-from arrays import Array
+from arrays import Array, GrowthPolicy
 
 
 class ArrayStack(object):
     """An array-based stack implementation """
 
     DEFAULTCAPACITY = 10  # 栈的默认容量
+    POLICY = GrowthPolicy(minimum=DEFAULTCAPACITY)  # 栈的扩容与缩容策略
 
     # Constructor 构建器
-    def __init__(self, sourceCollection=None):
-        """Sets the initial state of self, witch includes the contents of sourceCollection, if it's present."""
-        self._items = Array(ArrayStack.DEFAULTCAPACITY)  # 栈的基本数据结构
+    def __init__(self, sourceCollection=None, typecode=None, storage=None, policy=None):
+        """
+        Sets the initial state of self, witch includes the contents of sourceCollection, if it's present.
+        If typecode is given, the items are stored in a compact machine-typed array.
+        If storage is given, it is used as the array of self, e.g. a MappedArray.
+        If policy is given, it replaces ArrayStack.POLICY to decide when the array grows or shrinks.
+        """
+        if storage is None:
+            storage = Array(ArrayStack.DEFAULTCAPACITY, typecode=typecode)
+        self._items = storage  # 栈的基本数据结构
         self._size = 0  # 栈使用量
-        self._mark = 0  # 栈容量标志，若为0则表示栈的实际容量等于默认容量，若不为0则表示栈的实际容量大于默认容量
+        self._policy = policy or ArrayStack.POLICY  # 栈的扩容与缩容策略
         if sourceCollection:  # 若给定了初始元素，则将其添加到栈中
             for item in sourceCollection:
                 self.push(item)
@@ -37,7 +45,7 @@ class ArrayStack(object):
 
     def __add__(self, other):  # 魔法函数，+
         """Returns a new stack containing contents of self and others."""
-        result = ArrayStack(self)  # 将self作为新创建的result的sourceCollection参数传入，result中包含了self内元素
+        result = ArrayStack(self, self._items.typecode, policy=self._policy)  # 将self作为新创建的result的sourceCollection参数传入，result中包含了self内元素
         for item in other:  # 将other中元素传入新建的result栈中
             result.push(item)
         return result
@@ -82,12 +90,8 @@ class ArrayStack(object):
     # Mutators 设置器，对对象的属性或内容进行修改对象
     def push(self, item):
         """Push item on the top of self"""
-        if len(self) == ArrayStack.DEFAULTCAPACITY * (self._mark + 1):  # 若栈容量已满，则需要扩大栈的容量
-            new_items = Array(ArrayStack.DEFAULTCAPACITY * (self._mark + 2))  # 扩大一个默认容量大小的容量
-            self._mark += 1  # 栈容量标志增加
-            for n, items in enumerate(self._items):  # 栈内元素转移
-                new_items[n] = items
-            self._items = new_items
+        if len(self) == len(self._items):  # 若栈容量已满，则按扩容策略成倍扩大栈的容量，并转移栈内元素
+            self._items = self._items.resize(self._policy.grow(len(self._items), len(self)), len(self))
         self._items[len(self)] = item
         self._size += 1
 
@@ -99,12 +103,14 @@ class ArrayStack(object):
         """
         if len(self) == 0:
             raise ValueError('Stack is empty')
-        item = self._items[-1]
-        self._items = self._items[:-1]  # 弹出栈顶元素
-        self._size -= 1  # 栈的使用量减1
+        item = self._items[len(self) - 1]  # 栈顶元素
+        self._size -= 1  # 栈的使用量减1，栈顶位置留给下一次push覆盖，无需复制数组
+        capacity = self._policy.shrink(len(self._items), len(self))
+        if capacity != len(self._items):  # 若栈的使用量过低，则按缩容策略缩小栈的容量
+            self._items = self._items.resize(capacity, len(self))
         return item
 
     def clear(self):
         """Make self become empty"""
-        self._items = Array(ArrayStack.DEFAULTCAPACITY)
+        self._items = self._items.resize(ArrayStack.DEFAULTCAPACITY, 0)
         self._size = 0
@@ -0,0 +1,225 @@
+"""
+File: test_bstree.py
+Author: Chen Zhang
+A test program for binary search tree implementations
+
+Random trees are checked against a sorted list or a dict: the search order of every node, the height and balance of
+every AVL node, the four traversals against recursive reference walks, and the answers of floor, ceiling, predecessor,
+successor, range and the mapping methods. The traversals also run on a degenerate tree deeper than the recursion limit,
+and stop early without touching the nodes they have not reached.
+"""
+import bisect
+import math
+import random
+import sys
+from itertools import islice
+
+from tree_bstree_avl import AVLTree
+from tree_bstree_linked import LinkedBST
+
+
+class Untouchable(object):
+    """Stands in for a subtree that a traversal stopping early must not look into"""
+
+    def __getattr__(self, name):
+        raise AssertionError('Touched %s of a node past the early stop' % name)
+
+
+def check_tree(tree):
+    """Raise AssertionError if tree breaks the search order, or an AVL node has a wrong height or is out of balance."""
+    def check(node, lo, hi):
+        """Check the subtree of node, whose items must be within [lo, hi], and return its height."""
+        if node is None:
+            return 0
+        assert (lo is None or lo <= node.data) and (hi is None or node.data <= hi), 'Misplaced %r' % (node.data,)
+        left, right = check(node.left, lo, node.data), check(node.right, node.data, hi)
+        if isinstance(tree, AVLTree):
+            assert abs(left - right) <= 1, 'Out of balance at %r' % (node.data,)
+            assert node.height == max(left, right) + 1, 'Wrong height of %r' % (node.data,)
+        return max(left, right) + 1
+
+    height = 0 if tree.isEmpty() else check(tree._root, None, None)  # 空树的根节点为BSTNode(None)
+    assert len(tree) == len(list(tree.inorder())), 'Wrong length'
+    assert tree.height() == height, 'Wrong height'
+
+
+def reference_orders(tree):
+    """Return the preorder, inorder, postorder and levelorder lists of tree, by recursion and a list of levels."""
+    pre, ino, post, level = [], [], [], []
+
+    def walk(node):
+        if node is not None:
+            pre.append(node.data)
+            walk(node.left)
+            ino.append(node.data)
+            walk(node.right)
+            post.append(node.data)
+
+    nodes = [] if tree.isEmpty() else [tree._root]
+    while nodes:
+        level.extend(node.data for node in nodes)
+        nodes = [child for node in nodes for child in (node.left, node.right) if child is not None]
+    if not tree.isEmpty():
+        walk(tree._root)
+    return pre, ino, post, level
+
+
+def random_traversals(treetype, trials=200, bound=50):
+    """Compare the traversals of random trees, duplicates included, with the reference walks; return True."""
+    for _ in range(trials):
+        ref = [random.randrange(bound) for _ in range(random.randrange(60))]
+        tree = treetype(ref)
+        check_tree(tree)
+        orders = (list(tree.preorder()), list(tree.inorder()), list(tree.postorder()), list(tree.levelorder()))
+        assert orders == reference_orders(tree)
+        assert list(tree) == orders[0] and orders[1] == sorted(ref)
+    return True
+
+
+def check_queries(tree, ref, bound):
+    """Compare the ordered queries of tree with those of the sorted list ref, for items within [-2, bound + 2)."""
+    assert list(tree.inorder()) == ref
+    for x in range(-2, bound + 2):
+        i, j = bisect.bisect_right(ref, x), bisect.bisect_left(ref, x)
+        assert tree.floor(x) == (ref[i - 1] if i else None)
+        assert tree.predecessor(x) == (ref[j - 1] if j else None)
+        assert tree.ceiling(x) == (ref[j] if j < len(ref) else None)
+        assert tree.successor(x) == (ref[i] if i < len(ref) else None)
+    for _ in range(10):
+        lo, hi = random.randrange(-2, bound + 2), random.randrange(-2, bound + 2)
+        assert list(tree.range(lo, hi)) == [item for item in ref if lo <= item < hi]
+        assert list(tree.range(lo)) == [item for item in ref if lo <= item]
+        assert list(tree.range(hi=hi)) == [item for item in ref if item < hi]
+    if ref:
+        assert tree.min() == ref[0] and tree.max() == ref[-1]
+
+
+def random_updates(treetype, trials=200, bound=50):
+    """Add, remove and replace random items, duplicates included, checking the tree after each step; return True."""
+    for _ in range(trials):
+        tree, ref = treetype(), []
+        for _ in range(random.randrange(1, 100)):
+            choice = random.random()
+            if choice < 0.55 or not ref:
+                item = random.randrange(bound)
+                tree.add(item)
+                ref.append(item)
+            elif choice < 0.85:
+                item = random.choice(ref)
+                tree.remove(item)
+                ref.remove(item)
+            else:
+                item, newItem = random.choice(ref), random.randrange(bound)
+                assert tree.replace(item, newItem) == item
+                ref.remove(item)
+                ref.append(newItem)
+            check_tree(tree)
+            assert tree.find(item) == (item if item in ref else None)
+        check_queries(tree, sorted(ref), bound)
+    return True
+
+
+def random_mapping(treetype, trials=100, bound=50):
+    """Set, delete and rename random keys, comparing the tree with a dict; return True."""
+    for _ in range(trials):
+        tree, ref = treetype(), {}
+        for _ in range(random.randrange(1, 80)):
+            choice = random.random()
+            key = random.randrange(bound)
+            if choice < 0.55 or not ref:
+                tree[key] = ref[key] = str(key) * random.randrange(1, 3)
+            elif choice < 0.85:
+                key = random.choice(list(ref))
+                del tree[key]
+                del ref[key]
+            elif key not in ref:  # 改名后保留原来的值
+                old = random.choice(list(ref))
+                tree.replace(old, key)
+                ref[key] = ref.pop(old)
+            check_tree(tree)
+        keys = sorted(ref)
+        assert list(tree.keys()) == keys and list(tree.values()) == [ref[key] for key in keys]
+        assert list(tree.items()) == [(key, ref[key]) for key in keys]
+        lo = random.randrange(bound)
+        assert list(tree.items(lo)) == [(key, ref[key]) for key in keys if lo <= key]
+        assert all(tree.get(key) == ref.get(key) for key in range(bound))
+        assert all(tree[key] == ref[key] for key in keys)
+    return True
+
+
+def sorted_heights(treetype, n=10 ** 4):
+    """Return the heights of trees of n sorted and of n reverse-sorted items, both below 1.44 * log2(n + 2)."""
+    heights = [treetype(range(n)).height(), treetype(range(n, 0, -1)).height()]
+    assert max(heights) < 1.44 * math.log2(n + 2)
+    return heights
+
+
+def early_stops(treetype, trials=100):
+    """Stop each traversal early on random trees, with the rest of the tree made untouchable; return True."""
+    for _ in range(trials):
+        tree = treetype(random.sample(range(100), random.randrange(2, 60)))
+        pre, ino, post, level = reference_orders(tree)
+        root = tree._root
+        if root.right is not None:
+            # 右子树之前的部分：前序为根与左子树，中序为左子树与根，后序为左子树
+            count = len([item for item in ino if item < root.data])
+            right, root.right = root.right, Untouchable()
+            assert list(islice(tree.preorder(), count + 1)) == pre[:count + 1]
+            assert list(islice(tree.inorder(), count + 1)) == ino[:count + 1]
+            assert list(islice(tree.postorder(), count)) == post[:count]
+            root.right = right
+        # 层序遍历在某个叶节点之前停止
+        father, node, side = None, root, None
+        while node.left is not None or node.right is not None:
+            side = random.choice([name for name in ('left', 'right') if getattr(node, name) is not None])
+            father, node = node, getattr(node, side)
+        if father is not None:
+            setattr(father, side, Untouchable())
+            index = level.index(node.data)
+            assert list(islice(tree.levelorder(), index)) == level[:index]
+            setattr(father, side, node)
+    return True
+
+
+def deep_tree(treetype):
+    """Traverse and print a degenerate tree deeper than the recursion limit; return True."""
+    n = sys.getrecursionlimit() + 1000
+    tree = treetype(range(n))
+    for order in (tree.preorder(), tree.inorder(), tree.postorder(), tree.levelorder()):
+        assert sum(1 for _ in order) == n
+    assert len(str(tree).splitlines()) == n
+    return True
+
+
+def test(treetype):
+    """Expects a binary search tree type as an argument and runs some tests on objects of that type"""
+    print(treetype.__name__)
+    tree = treetype([4, 2, 6, 1, 3, 5, 7])
+    print("Expect [4, 2, 1, 3, 6, 5, 7]:", list(tree.preorder()))
+    print("Expect [1, 2, 3, 4, 5, 6, 7]:", list(tree.inorder()))
+    print("Expect [1, 3, 2, 5, 7, 6, 4]:", list(tree.postorder()))
+    print("Expect [4, 2, 6, 1, 3, 5, 7]:", list(tree.levelorder()))
+    print("Expect []:", list(treetype().inorder()))
+    print("Expect True:", random_traversals(treetype))
+    print("Expect True:", random_updates(treetype))
+    print("Expect 3 5 [3, 4, 5]:", tree.floor(3), tree.successor(4), list(tree.range(3, 6)))
+    tree[8] = 'eight'
+    print("Expect 1 eight:", tree.replace(1, 9), tree.get(8))
+    print("Expect True:", random_mapping(treetype))
+    print("Expect True:", early_stops(treetype))
+    print("Expect True:", deep_tree(treetype))
+    if treetype is AVLTree:
+        print("Expect [14, 14]:", sorted_heights(treetype))
+    try:
+        tree.remove(100)
+    except ValueError as error:
+        print("Expect ValueError:", error)
+    try:
+        tree[100]
+    except KeyError as error:
+        print("Expect KeyError:", error)
+
+
+if __name__ == '__main__':
+    test(LinkedBST)
+    test(AVLTree)
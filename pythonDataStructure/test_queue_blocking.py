@@ -0,0 +1,138 @@
+"""
+File: test_queue_blocking.py
+Author: Chen Zhang
+A test program for the blocking queue implementation
+
+Covers put/get timeouts, close() waking blocked producers and consumers, the close/drain shutdown protocol, and
+get_many over both LinkedQueue and ArrayQueue, also under several producer and consumer threads.
+"""
+import threading
+import time
+
+from queue_array import ArrayQueue
+from queue_blocking import BlockingQueue, QueueClosed
+from queue_linked import LinkedQueue
+
+
+def outcome(function, *args, **kwargs):
+    """Return the result of function(*args, **kwargs), or the type of the exception it raises"""
+    try:
+        return function(*args, **kwargs)
+    except Exception as error:
+        return type(error)
+
+
+def in_thread(function, *args, **kwargs):
+    """Start function(*args, **kwargs) in a thread, and return the thread and a list that receives its outcome"""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(outcome(function, *args, **kwargs)))
+    thread.start()
+    time.sleep(0.05)  # 等待线程阻塞
+    return thread, result
+
+
+def timed(function, *args, **kwargs):
+    """Return the outcome of function(*args, **kwargs), by name if it is an exception, and the seconds it took"""
+    start = time.monotonic()
+    result = outcome(function, *args, **kwargs)
+    return getattr(result, '__name__', result), round(time.monotonic() - start, 1)
+
+
+def producers_and_consumers(queue_type, producers=4, consumers=4, count=2000):
+    """
+    Move count items from each producer to consumers that take batches with get_many, through a queue of 16 slots.
+    Return True if every item arrives exactly once and in its producer's order.
+    """
+    q = BlockingQueue(maxsize=16, queue_type=queue_type)
+    received = [[] for _ in range(consumers)]
+
+    def produce(index):
+        for number in range(count):
+            q.put((index, number))
+
+    def consume(batches):
+        while True:
+            try:
+                batches.append(q.get_many(5))
+            except QueueClosed:
+                return
+
+    threads = [threading.Thread(target=consume, args=(batches,)) for batches in received]
+    threads += [threading.Thread(target=produce, args=(index,)) for index in range(producers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads[consumers:]:
+        thread.join()
+    q.close()
+    for thread in threads[:consumers]:
+        thread.join()
+
+    items = [item for batches in received for batch in batches for item in batch]
+    assert all(0 < len(batch) <= 5 for batches in received for batch in batches)
+    assert sorted(items) == [(index, number) for index in range(producers) for number in range(count)]
+    for batches in received:  # 每个消费者收到的同一生产者的元素保持先后顺序
+        mine = [item for batch in batches for item in batch]
+        for index in range(producers):
+            numbers = [number for producer, number in mine if producer == index]
+            assert numbers == sorted(numbers)
+    return True
+
+
+def test(queue_type):
+    """Expects a queue type as an argument and runs some tests on blocking queues over that type"""
+    print(queue_type.__name__)
+    q = BlockingQueue([1, 2], maxsize=2, queue_type=queue_type)
+    print("Expect {1, 2} True:", q, q.isFull())
+    print("Expect Full:", outcome(q.put, 3, block=False).__name__)
+    print("Expect ('Full', 0.1):", timed(q.put, 3, timeout=0.1))
+    print("Expect 1 2:", q.get(), q.get(timeout=0.1))
+    print("Expect Empty:", outcome(q.get, block=False).__name__)
+    print("Expect ('Empty', 0.1):", timed(q.get, timeout=0.1))
+    print("Expect ValueError:", outcome(q.get, timeout=-1).__name__)
+
+    # 取出元素唤醒等待空位的生产者
+    q = BlockingQueue([1, 2], maxsize=2, queue_type=queue_type)
+    putter, result = in_thread(q.put, 3)
+    print("Expect 1 True:", q.get(), not putter.join(1) and result == [None])
+    print("Expect [2, 3]:", list(q))
+
+    # close()唤醒阻塞的生产者与消费者
+    putter, put_result = in_thread(q.put, 4)
+    empty = BlockingQueue(queue_type=queue_type)
+    getter, get_result = in_thread(empty.get)
+    many_getter, many_result = in_thread(empty.get_many, 3)
+    q.close()
+    empty.close()
+    for thread in (putter, getter, many_getter):
+        thread.join(1)
+    print("Expect False False False:", putter.is_alive(), getter.is_alive(), many_getter.is_alive())
+    print("Expect QueueClosed QueueClosed QueueClosed:",
+          put_result[0].__name__, get_result[0].__name__, many_result[0].__name__)
+
+    # 关闭后继续取出剩余元素，取空后抛出QueueClosed
+    print("Expect True QueueClosed:", q.closed, outcome(q.put, 5).__name__)
+    print("Expect 2 3 QueueClosed:", q.get(), q.get(), outcome(q.get).__name__)
+    print("Expect QueueClosed:", outcome(q.get, timeout=0.1).__name__)
+
+    # drain()一次取出全部剩余元素
+    q = BlockingQueue(range(5), queue_type=queue_type)
+    q.close()
+    print("Expect [0, 1, 2, 3, 4] []:", q.drain(), q.drain())
+    full = BlockingQueue([1, 2], maxsize=2, queue_type=queue_type)
+    putter, result = in_thread(full.put, 3)
+    print("Expect [1, 2] True [3]:", full.drain(), not putter.join(1) and result == [None], full.drain())
+
+    # get_many按先后顺序成批取出，队列为空时与get()一样等待
+    q = BlockingQueue(range(10), queue_type=queue_type)
+    print("Expect [0, 1, 2] [] [3, 4, 5, 6, 7, 8, 9]:", q.get_many(3), q.get_many(0), q.get_many())
+    print("Expect Empty:", outcome(q.get_many, block=False).__name__)
+    print("Expect ('Empty', 0.1):", timed(q.get_many, timeout=0.1))
+    getter, result = in_thread(q.get_many, 3)
+    q.put(10)
+    print("Expect True:", not getter.join(1) and result == [[10]])
+    print("Expect True:", producers_and_consumers(queue_type))
+
+
+if __name__ == '__main__':
+    test(LinkedQueue)
+    test(ArrayQueue)
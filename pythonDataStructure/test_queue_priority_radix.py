@@ -0,0 +1,92 @@
+"""
+File: test_queue_priority_radix.py
+Author: Chen Zhang
+A test program for the radix heap and bucket queue implementations
+
+Random monotone workloads run against heapq: pop order (first in, first out among equal priorities), peek not moving
+the last popped priority, __add__ after some pops, and the ValueError for a priority below the last popped one.
+"""
+import heapq
+import random
+from operator import itemgetter
+
+from queue_priority_radix import BucketPriorityQueue, RadixPriorityQueue
+
+
+def outcome(function, *args):
+    """Return the result of function(*args), or the name of the exception it raises"""
+    try:
+        return function(*args)
+    except Exception as error:
+        return type(error).__name__
+
+
+def random_workload(queuetype, trials=200, spread=300):
+    """
+    Mix adds of (priority, sequence) items at or above the last popped priority, pops, peeks and __add__ copies, and
+    compare every answer with a heapq of the same items; return True.
+    """
+    options = {'span': spread} if queuetype is BucketPriorityQueue else {}  # 桶数只需覆盖优先级的跨度
+    for _ in range(trials):
+        q, heap, sequence, last = queuetype(key=itemgetter(0), **options), [], 0, 0
+        for _ in range(random.randrange(1, 300)):
+            choice = random.random()
+            if choice < 0.45 or not heap:
+                item = (random.randrange(last, last + spread), sequence)
+                sequence += 1
+                q.add(item)
+                heapq.heappush(heap, item)
+            elif choice < 0.75:
+                item = heapq.heappop(heap)
+                assert q.pop() == item
+                last = item[0]
+            elif choice < 0.9:
+                before = list(q)
+                assert q.peek() == heap[0] and list(q) == before == sorted(heap)
+            else:  # 合并的结果接受不低于最后弹出优先级的元素，原队列不变
+                before = list(q)
+                more = [(random.randrange(last, last + spread), sequence + index) for index in range(5)]
+                sequence += 5
+                merged = q + more
+                assert list(q) == before and list(merged) == sorted(heap + more)
+                for item in more:
+                    heapq.heappush(heap, item)
+                q = merged
+            assert len(q) == len(heap)
+        assert [q.pop() for _ in range(len(q))] == [heapq.heappop(heap) for _ in range(len(heap))]
+    return True
+
+
+def test(queuetype):
+    """Expects a monotone priority queue type as an argument and runs some tests on objects of that type"""
+    print(queuetype.__name__)
+    q = queuetype([5, 1, 3, 1, 100])
+    print("Expect 5 {1, 1, 3, 5, 100}:", len(q), q)
+    print("Expect 1 1 3:", q.pop(), q.pop(), q.pop())
+    print("Expect ValueError:", outcome(q.add, 2))
+    q.add(3)
+    print("Expect 3 5:", q.pop(), q.peek())
+
+    # peek不改变最后弹出的优先级，之后仍可加入介于二者之间的优先级
+    q = queuetype([0, 10])
+    q.pop()
+    print("Expect 10 3 [3, 10]:", q.peek(), q.add(3) or 3, list(q))
+
+    # 合并的结果沿用最后弹出的优先级
+    q = queuetype([5, 6, 100])
+    q.pop()
+    merged = q + []
+    merged.add(7)
+    print("Expect [6, 7, 100]:", [merged.pop() for _ in range(len(merged))])
+    print("Expect ValueError:", outcome((q + [7]).add, 4))
+    print("Expect True:", random_workload(queuetype))
+
+
+if __name__ == '__main__':
+    test(RadixPriorityQueue)
+    test(BucketPriorityQueue)
+    q = BucketPriorityQueue([10, 60], span=64)
+    q.pop()
+    q.pop()
+    q.add(100)
+    print("Expect [100] ValueError:", list(q + []), outcome(q.add, 164))
@@ -0,0 +1,96 @@
+"""
+File: test_timer_wheel.py
+Author: Chen Zhang
+A test program for the timing wheel implementation
+
+Random delays across every level of the wheel and beyond slots ** levels are scheduled while the wheel advances, some
+timers are cancelled, and every item must expire at exactly the tick of its deadline, with len() right after each step.
+"""
+import random
+
+from timer_wheel import TimingWheel
+
+
+def random_delays(slots, levels, trials=50, steps=400):
+    """
+    Drive a wheel of slots and levels with random schedules, cancels and advances, checking each expired batch against
+    the pending timers; return True.
+    """
+    reach = slots ** levels
+    edges = [slots ** level + shift for level in range(levels + 1) for shift in (-1, 0, 1)]  # 各层的边界
+    for _ in range(trials):
+        wheel, pending = TimingWheel(slots, levels), {}  # pending: 计时器 -> 到期的tick
+        for step in range(steps):
+            choice = random.random()
+            if choice < 0.4:
+                delay = random.choice(edges) if random.random() < 0.3 else random.randrange(3 * reach)
+                timer = wheel.schedule((step, delay), delay)
+                assert timer.deadline == wheel.now + delay
+                pending[timer] = timer.deadline
+            elif choice < 0.5 and pending:
+                timer = random.choice(list(pending))
+                assert timer.cancel() and not timer.cancel() and not timer.pending
+                del pending[timer]
+            else:
+                ticks = 1 if random.random() < 0.7 else random.randrange(2 * reach)
+                start = wheel.now
+                batch = wheel.advance(ticks)
+                assert wheel.now == start + ticks
+                due = {timer.item: deadline for timer, deadline in pending.items() if deadline < start + ticks}
+                assert sorted(batch) == sorted(due), 'Expired %r instead of %r' % (batch, sorted(due))
+                deadlines = [due[item] for item in batch]  # 同一tick到期的元素之间没有先后要求
+                assert deadlines == sorted(deadlines), 'Expired out of deadline order'
+                for timer in [timer for timer in pending if timer.item in due]:
+                    assert not timer.pending and not timer.cancel()
+                    del pending[timer]
+            assert len(wheel) == len(pending)
+        batch = wheel.advance(3 * reach)
+        assert sorted(batch) == sorted(timer.item for timer in pending) and len(wheel) == 0
+    return True
+
+
+def exact_ticks(slots, levels, count=300):
+    """
+    Schedule count random delays up to twice slots ** levels, cancel a fifth of them, and advance one tick at a time.
+    Return True if every other item expires at exactly the tick of its delay.
+    """
+    wheel = TimingWheel(slots, levels)
+    reach = slots ** levels
+    delays = [random.randrange(2 * reach) for _ in range(count)]
+    timers = [wheel.schedule(index, delay) for index, delay in enumerate(delays)]
+    cancelled = set(random.sample(range(count), count // 5))
+    for index in cancelled:
+        timers[index].cancel()
+    left = count - len(cancelled)
+    for tick in range(2 * reach):
+        assert wheel.now == tick and len(wheel) == left
+        batch = wheel.advance()
+        assert sorted(batch) == [index for index in range(count) if delays[index] == tick and index not in cancelled]
+        left -= len(batch)
+    return wheel.isEmpty()
+
+
+def test():
+    """Runs some tests on timing wheels"""
+    wheel = TimingWheel(slots=8, levels=2)
+    timers = [wheel.schedule('timer %d' % delay, delay) for delay in (0, 1, 5, 9, 63, 64, 200)]
+    print("Expect True False:", timers[3].cancel(), timers[3].cancel())
+    print("Expect 6 ['timer 0']:", len(wheel), wheel.advance())
+    print("Expect ['timer 1', 'timer 5']:", wheel.advance(5))
+    print("Expect ['timer 63'] 2:", wheel.advance(58), len(wheel))
+    print("Expect ['timer 64', 'timer 200'] 0 264:", wheel.advance(200), len(wheel), wheel.now)
+    try:
+        wheel.schedule('late', -1)
+    except ValueError as error:
+        print("Expect ValueError:", error)
+    try:
+        TimingWheel(slots=6)
+    except ValueError as error:
+        print("Expect ValueError:", error)
+    for slots, levels in ((2, 1), (4, 1), (4, 3), (8, 2), (2, 5)):
+        print("Expect True True (%d slots, %d levels):" % (slots, levels),
+              exact_ticks(slots, levels), random_delays(slots, levels))
+
+
+if __name__ == '__main__':
+    test()
@@ -0,0 +1,195 @@
+"""
+File: timer_wheel.py
+Author: Chen Zhang
+
+A hierarchical timing wheel: a timer queue for many timeouts, with O(1) schedule and cancel.
+
+Time is counted in ticks. Level 0 has one bucket per tick for the next `slots` ticks; each bucket of level l covers
+slots ** l ticks, so levels levels reach slots ** levels ticks ahead (later deadlines wait in the last bucket in reach
+and are placed again when it comes up). A timer goes to the lowest level whose range covers its delay, into the bucket
+of its deadline. Whenever level 0 wraps around, the next bucket of level 1 is emptied into lower levels, and so on up
+the levels ("cascading"), so every timer is moved at most levels times. advance() walks the ticks and returns the items
+whose deadline passed as one batch.
+
+Buckets are LinkedQueues, so a timer can not be unlinked from its bucket: cancel() only marks it, and it is dropped
+when its bucket comes up.
+
+Use it from a sync loop with advance(ticks), or with poll(), which advances to the tick of clock(); from asyncio,
+"async for batch in wheel.batches()" sleeps until each tick and yields the non-empty batches.
+"""
+import asyncio
+import time
+
+from queue_linked import LinkedQueue
+
+
+class Timer(object):
+    """A scheduled item, the handle to cancel it"""
+
+    def __init__(self, wheel, item, deadline):
+        self.item = item
+        self.deadline = deadline  # 到期的tick
+        self._wheel = wheel  # 到期或取消后为None
+
+    @property
+    def pending(self):
+        """True until self expires or is cancelled"""
+        return self._wheel is not None
+
+    def cancel(self):
+        """Cancel self in O(1); return False if it already expired or was cancelled"""
+        if self._wheel is None:
+            return False
+        self._wheel._size -= 1
+        self._wheel = None
+        return True
+
+
+class TimingWheel(object):
+    """A hierarchical timing wheel implement"""
+
+    # Constructor
+    def __init__(self, slots=256, levels=4, resolution=1.0, clock=time.monotonic):
+        """
+        slots is the number of buckets of each level, a power of two; levels is the number of levels.
+        resolution is the seconds of a tick and clock the time source, for poll() and batches(); tick 0 starts when
+        self is created.
+        """
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError('slots must be a power of two, not %r' % (slots,))
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._levels = levels
+        self._reach = slots ** levels - 1  # 能直接放入的最大延迟
+        self._wheels = [[LinkedQueue() for _ in range(slots)] for _ in range(levels)]
+        self._current = 0  # 下一个要处理的tick
+        self._size = 0
+        self._resolution = resolution
+        self._clock = clock
+        self._origin = clock()
+
+    @property
+    def now(self):
+        """The next tick to be processed; every tick before it has been processed"""
+        return self._current
+
+    def isEmpty(self):
+        """Return True if len(self)==0, or False otherwise"""
+        return len(self) == 0
+
+    def __len__(self):
+        """Return the number of pending timers in self"""
+        return self._size
+
+    def schedule(self, item, delay):
+        """
+        Schedule item to expire delay ticks from now, and return its Timer. A delay of 0 expires with the tick now.
+        Raise: ValueError if delay is negative
+        """
+        if delay < 0:
+            raise ValueError('delay must be a non-negative number of ticks')
+        timer = Timer(self, item, self._current + delay)
+        self._place(timer)
+        self._size += 1
+        return timer
+
+    def cancel(self, timer):
+        """Cancel timer in O(1); return False if it already expired or was cancelled"""
+        return timer.cancel()
+
+    def clear(self):
+        """Cancel every timer"""
+        for wheel in self._wheels:
+            for index in range(len(wheel)):
+                for timer in wheel[index]:
+                    timer._wheel = None
+                wheel[index] = LinkedQueue()
+        self._size = 0
+
+    def advance(self, ticks=1):
+        """Process the next ticks ticks, and return a list of the items that expired, in the order of their deadlines"""
+        expired = []
+        end = self._current + ticks
+        while self._current < end:
+            if self._size == 0:
+                self._current = end  # 没有计时器时直接跳过空的tick
+                break
+            self._tick(expired)
+        return expired
+
+    def poll(self):
+        """Process every tick up to the current tick of clock, and return a list of the items that expired"""
+        target = int((self._clock() - self._origin) / self._resolution)
+        return self.advance(target + 1 - self._current) if target >= self._current else []
+
+    async def batches(self):
+        """Yield the non-empty batches of expired items, sleeping with asyncio until each tick comes"""
+        while True:
+            delay = self._origin + self._current * self._resolution - self._clock()
+            await asyncio.sleep(max(delay, 0))
+            batch = self.poll()
+            if batch:
+                yield batch
+
+    def _tick(self, expired):
+        """Process the tick now: cascade the levels that wrapped around, then expire the bucket of level 0"""
+        current = self._current
+        index = current & self._mask
+        level = 1
+        while index == 0 and level < self._levels:
+            index = (current >> (self._bits * level)) & self._mask
+            self._cascade(level, index)
+            level += 1
+        bucket = self._wheels[0][current & self._mask]
+        if not bucket.isEmpty():
+            self._wheels[0][current & self._mask] = LinkedQueue()
+            for timer in bucket:
+                if timer._wheel is None:
+                    continue
+                if timer.deadline > current:
+                    self._place(timer)  # 只有一层时，超出范围的计时器在这里重新放置
+                else:
+                    timer._wheel = None
+                    self._size -= 1
+                    expired.append(timer.item)
+        self._current = current + 1
+
+    def _cascade(self, level, index):
+        """Empty bucket index of level into the lower levels, dropping the cancelled timers"""
+        bucket = self._wheels[level][index]
+        if bucket.isEmpty():
+            return
+        self._wheels[level][index] = LinkedQueue()
+        for timer in bucket:
+            if timer._wheel is not None:
+                self._place(timer)
+
+    def _place(self, timer):
+        """Add timer to the bucket of its deadline, in the lowest level that covers its delay"""
+        deadline = max(timer.deadline, self._current)
+        delay = deadline - self._current
+        if delay > self._reach:
+            deadline = self._current + self._reach  # 超出范围：先放入最远的桶，届时再重新放置
+            delay = self._reach
+        level = 0
+        while delay >> (self._bits * (level + 1)):
+            level += 1
+        self._wheels[level][(deadline >> (self._bits * level)) & self._mask].add(timer)
+
+
+if __name__ == '__main__':
+    wheel = TimingWheel(slots=8, levels=2)
+    timers = [wheel.schedule('timer %d' % delay, delay) for delay in (0, 1, 5, 9, 63, 64, 200)]
+    timers[3].cancel()
+    print(len(wheel), wheel.advance(), wheel.advance(5), wheel.advance(60), wheel.advance(200), len(wheel))
+
+    async def main():
+        async_wheel = TimingWheel(resolution=0.01)
+        for delay in (3, 1, 2, 1):
+            async_wheel.schedule('after %d ticks' % delay, delay)
+        async for batch in async_wheel.batches():
+            print(batch)
+            if async_wheel.isEmpty():
+                break
+
+    asyncio.run(main())
@@ -0,0 +1,148 @@
+"""
+File: tree_bstree_avl.py
+Author: Chen Zhang
+
+An implement of AVL Tree, a self-balancing Binary Search Tree
+AVL树（自平衡二叉搜索树）的实现.
+
+Every node records the height of its subtree, and the heights of the two subtrees of any node differ by at most one,
+so the height of the tree stays below 1.44 * log2(n + 2). add and remove walk down from the root, keeping the path in a
+list, then walk back up it, updating heights and rotating where a node got out of balance. Nothing recurses.
+"""
+from node_bst import AVLNode, BSTNode
+from tree_bstree_linked import LinkedBST
+
+
+def _height(node):
+    """Return the height of the subtree of node, 0 for None."""
+    return node.height if node is not None else 0
+
+
+class AVLTree(LinkedBST):
+
+    def add(self, item, payload=None):
+        """Add item to the tree, with payload as its value in mapping mode, and rebalance the path to it."""
+        if self.isEmpty():
+            self._root = AVLNode(item, payload=payload)
+            self._size += 1
+            return
+        path = []  # 自根节点到新节点父节点的路径
+        node = self._root
+        while node is not None:
+            path.append(node)
+            node = node.left if item < node.data else node.right
+        if item < path[-1].data:
+            path[-1].left = AVLNode(item, payload=payload)
+        else:
+            path[-1].right = AVLNode(item, payload=payload)
+        self._size += 1
+        self._rebalance(path)
+
+    def remove(self, item):
+        """
+        Precondition: The item is in self.
+        Raise: Value error if self is emtpy or item is not in self.
+        Post-condition: Item is moved out from self, and the path to the removed node is rebalanced
+        """
+        if self.isEmpty():
+            raise ValueError('Tree is empty!')
+        path = []  # 自根节点到待删节点父节点的路径
+        node = self._root
+        while node is not None and item != node.data:
+            path.append(node)
+            node = node.left if item < node.data else node.right
+        if node is None:
+            raise ValueError('%s is not in tree!' % str(item))
+
+        if node.left is not None and node.right is not None:
+            # 若待删节点有两个子节点，则用其右子树的最左节点数据覆盖待删数据，转而删除该最左节点
+            path.append(node)
+            leftmost = node.right
+            while leftmost.left is not None:
+                path.append(leftmost)
+                leftmost = leftmost.left
+            node.data, node.payload = leftmost.data, leftmost.payload
+            node = leftmost
+
+        child = node.left if node.left is not None else node.right
+        self._size -= 1
+        if not path:
+            self._root = child if child is not None else BSTNode(None)
+            return
+        if path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self._rebalance(path)
+
+    def height(self):
+        """Return the number of levels of self, 0 if it is empty."""
+        return 0 if self.isEmpty() else self._root.height
+
+    def _rebalance(self, path):
+        """Update the heights along path, from the bottom up, rotating every node that got out of balance."""
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            height = node.height
+            subtree = self._balance(node)
+            if subtree is node and node.height == height:
+                break  # 子树高度未变，上方节点不受影响
+            if subtree is not node:
+                if index == 0:
+                    self._root = subtree
+                elif path[index - 1].left is node:
+                    path[index - 1].left = subtree
+                else:
+                    path[index - 1].right = subtree
+
+    def _balance(self, node):
+        """Update the height of node, rotate its subtree if it is out of balance, and return the root of the subtree."""
+        left, right = _height(node.left), _height(node.right)
+        if left > right + 1:  # 左子树过高
+            if _height(node.left.left) < _height(node.left.right):
+                node.left = self._rotate_left(node.left)  # 左右型：先左旋左子节点
+            return self._rotate_right(node)
+        if right > left + 1:  # 右子树过高
+            if _height(node.right.right) < _height(node.right.left):
+                node.right = self._rotate_right(node.right)  # 右左型：先右旋右子节点
+            return self._rotate_left(node)
+        node.height = max(left, right) + 1
+        return node
+
+    @staticmethod
+    def _rotate_left(node):
+        """Rotate the subtree of node to the left, and return its new root, the former right child."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        node.height = max(_height(node.left), _height(node.right)) + 1
+        pivot.height = max(_height(pivot.left), _height(pivot.right)) + 1
+        return pivot
+
+    @staticmethod
+    def _rotate_right(node):
+        """Rotate the subtree of node to the right, and return its new root, the former left child."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        node.height = max(_height(node.left), _height(node.right)) + 1
+        pivot.height = max(_height(pivot.left), _height(pivot.right)) + 1
+        return pivot
+
+
+if __name__ == '__main__':
+    tree = AVLTree(range(1, 16))
+    print(tree)
+    print('height:', tree.height(), 'inorder:', list(tree.inorder()))
+    for value in (8, 1, 2, 3):
+        tree.remove(value)
+    print(tree)
+    print(tree.find(9), tree.find(8), tree.replace(9, 100), list(tree.inorder()))
+    print(tree.min(), tree.max(), tree.floor(8), tree.ceiling(8), tree.predecessor(10), tree.successor(10),
+          list(tree.range(5, 12)))
+
+    prices = AVLTree()
+    for name, price in (('pear', 3), ('apple', 5), ('fig', 8), ('apple', 4)):
+        prices[name] = price
+    del prices['pear']
+    print(len(prices), prices['apple'], prices.get('kiwi', 0), list(prices.items()))
@@ -4,8 +4,14 @@ Author: Ken Lambert
 
 An implement of Binary Search Tree
 二叉搜索树的实现.
+
+Besides the traversals, the tree answers ordered queries: min, max, floor, ceiling, successor, predecessor, and a lazy
+range(lo, hi) that only descends to lo and then walks the k nodes below hi, O(h + k). It also works as a sorted mapping:
+tree[key] = value keeps every key once and stores the value at its node, and keys(), values() and items() walk it in
+key order.
 """
 from node_bst import BSTNode
+from queue_linked import LinkedQueue
 from stack_array import ArrayStack
 
 
@@ -30,22 +36,27 @@ class LinkedBST:
         return self._size
 
     def __str__(self):
-        """Returns a string representation with the tree rotated 90 degrees counterclockwise."""
-
-        def recurse(node, level):  # 节点递归函数
-            s = ''
-            if node is not None:  # 若节点存在
-                s += recurse(node.right, level + 1)  # 递归右节点
-                s += '| ' * level
-                s += str(node.data) + '\n'
-                s += recurse(node.left, level + 1)  # 递归左节点
-            return s
-
-        return recurse(self._root, 0)
+        """
+        Returns a string representation with the tree rotated 90 degrees counterclockwise.
+        A reverse inorder walk with an explicit stack of (node, level), so it takes O(h) memory and never recurses.
+        """
+        if self.isEmpty():
+            return ''
+        lines = []
+        node_stack = ArrayStack()
+        node, level = self._root, 0
+        while node is not None or not node_stack.isEmpty():
+            while node is not None:  # 沿右子树下行，将路径上的节点及其层数压入栈中
+                node_stack.push((node, level))
+                node, level = node.right, level + 1
+            node, level = node_stack.pop()  # 栈顶节点的右子树已输出完
+            lines.append('| ' * level + str(node.data) + '\n')
+            node, level = node.left, level + 1  # 转向左子树
+        return ''.join(lines)
 
     def __add__(self, other):  # 魔法函数，+
         """Return a new BS-tree containing self and other."""
-        result = LinkedBST(self)
+        result = type(self)(self)
         for item in other:
             result.add(item)
         return result
@@ -55,27 +66,36 @@ class LinkedBST:
         self._size = 0
         self._root = BSTNode(None)
 
-    def add(self, item):
-        """Add item to the tree."""
-
-        def recurse(node):  # 寻找item位置的递归函数
-            if item < node.data:  # 若item小于当前节点保存的数据，则搜索左子树。
-                if node.left is None:
-                    node.left = BSTNode(item)  # 若当前节点无左节点，则直接将item添加为左节点
-                else:
-                    recurse(node.left)  # 否则继续搜索左子树
-            elif node.right is None:
-                node.right = BSTNode(item)  # 若当前节点无右节点，则直接将item添加为右节点
-            else:
-                recurse(node.right)  # 若item不小于当前节点，则搜索右子树
-            # End of recurse
-
+    def add(self, item, payload=None):
+        """Add item to the tree, with payload as its value in mapping mode."""
         if self.isEmpty():  # 若树为空，则将item添加为根节点
-            self._root = BSTNode(item)
-        else:  # 若树不为空，则搜索item的位置
-            recurse(self._root)
+            self._root = BSTNode(item, payload=payload)
+        else:  # 若树不为空，则自根节点向下搜索item的位置
+            node = self._root
+            while True:
+                if item < node.data:  # 若item小于当前节点保存的数据，则搜索左子树。
+                    if node.left is None:
+                        node.left = BSTNode(item, payload=payload)  # 若当前节点无左节点，则直接将item添加为左节点
+                        break
+                    node = node.left
+                else:  # 若item不小于当前节点，则搜索右子树
+                    if node.right is None:
+                        node.right = BSTNode(item, payload=payload)  # 若当前节点无右节点，则直接将item添加为右节点
+                        break
+                    node = node.right
         self._size += 1  # 树的节点数加1
 
+    def height(self):
+        """Return the number of levels of self, 0 if it is empty."""
+        levels = 0
+        if self.isEmpty():
+            return levels
+        level = [self._root]
+        while level:  # 逐层向下，统计层数
+            levels += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return levels
+
     # Accessor
     def __iter__(self):  # 前序遍历
         """
@@ -95,6 +115,15 @@ class LinkedBST:
             recurse(self._root)
             return iter(value_list)
         """
+        return self.preorder()
+
+    def preorder(self):
+        """
+        Supports a lazy preorder traversal on a view of self.
+        The stack holds at most one waiting right child per level, so it takes O(h) memory.
+        """
+        if self.isEmpty():
+            return
         node_stack = ArrayStack()  # 创建一个空栈
         node_stack.push(self._root)  # 将根节点压入空栈中
         while not node_stack.isEmpty():  # 当栈不为空
@@ -106,46 +135,56 @@ class LinkedBST:
                 node_stack.push(node.left)
 
     def inorder(self):
-        """Supports an inorder traversal on a view of self."""
-        value_list = []
-
-        def recurse(node):  # 中序遍历递归函数
-            if node is not None:
-                recurse(node.left)
-                value_list.append(node.data)
-                recurse(node.right)
-
-        recurse(self._root)
-        return iter(value_list)
+        """
+        Supports a lazy inorder traversal on a view of self.
+        The stack holds the left spine of the path to the next node, so it takes O(h) memory.
+        """
+        if self.isEmpty():
+            return
+        node_stack = ArrayStack()
+        node = self._root
+        while node is not None or not node_stack.isEmpty():
+            while node is not None:  # 沿左子树下行，将路径上的节点压入栈中
+                node_stack.push(node)
+                node = node.left
+            node = node_stack.pop()  # 栈顶节点的左子树已遍历完
+            yield node.data
+            node = node.right  # 转向右子树
 
     def postorder(self):
-        """Supports an postorder traversal on a view of self."""
-        value_list = []
-
-        def recurse(node):  # 后序遍历递归函数
-            if node.left is not None:
-                recurse(node.left)
-            if node.right is not None:
-                recurse(node.right)
-            value_list.append(node.data)
-
-        recurse(self._root)
-        return iter(value_list)
+        """
+        Supports a lazy postorder traversal on a view of self.
+        The stack holds the path to the current node, so it takes O(h) memory.
+        """
+        if self.isEmpty():
+            return
+        node_stack = ArrayStack()
+        node = self._root
+        last = None  # 上一个传出数据的节点
+        while node is not None or not node_stack.isEmpty():
+            while node is not None:  # 沿左子树下行
+                node_stack.push(node)
+                node = node.left
+            top = node_stack.peek()
+            if top.right is not None and top.right is not last:  # 右子树尚未遍历，转向右子树
+                node = top.right
+            else:  # 左右子树均已遍历，传出栈顶节点
+                node_stack.pop()
+                yield top.data
+                last = top
 
     def levelorder(self):
-        """Supports an levelorder traversal on a view of self."""
-        value_list = []
-
-        def recurse(node):  # 层序遍历递归函数
+        """Supports a lazy levelorder (breadth-first) traversal on a view of self, level by level from the root."""
+        if self.isEmpty():
+            return
+        node_queue = LinkedQueue([self._root])
+        while not node_queue.isEmpty():
+            node = node_queue.pop()
+            yield node.data
             if node.left is not None:
-                value_list.append(node.left.data)
+                node_queue.add(node.left)
             if node.right is not None:
-                value_list.append(node.right.data)
-            recurse(node.left)
-            recurse(node.right)
-
-        recurse(self._root)
-        return iter(value_list)
+                node_queue.add(node.right)
 
     def __contains__(self, item):  # 魔法函数，in
         """Return True if item is in self, or False otherwise"""
@@ -157,50 +196,32 @@ class LinkedBST:
         Raise: Value error if self is emtpy or item is not in self.
         Post-condition: Item is moved out from self
         """
-        def backend(node_to_del):  # 辅助删除递归函数
-            father_node = node_to_del  # 将父节点设为待删节点
-            if father_node.left is not None:  # 若待删节点有左子节点
-                node = father_node.left
-                if node.right is not None:  # 若待删节点的左子节点有右子节点
-                    while node.right is not None:  # 找到待删节点左子树的最右叶子节点
-                        father_node = node
-                        node = node.right
-                    node_to_del.data = node.data  # 用待删节点左子树的最右叶子节点数据覆盖待删数据
-                    father_node.right = None  # 删除待删节点左子树的最右叶子节点
-                else:  # 若待删节点的左子节点无右子节点，则直接将待删节点的左子节点及其附属子树覆盖待删节点
-                    father_node.data = node.data
-                    father_node.left = node.left
-            else:  # 若待删节点无左子节点，则直接将待删节点的有子节点及其附属子树覆盖待删节点
-                # father_node.right = father_node.right.left
-                father_node.data = father_node.right.data
-                father_node.left = father_node.right.left
-                father_node.right = father_node.right.right
-
-        def recurse(root, val):  # 目标节点搜索函数
-            """
-            node = root
-            if node.left.data != val and node.right.data != val:
-                recurse(node.left, val)
-                recurse(node.right, val)
-            else:
-                if node.left.data == val:
-                    return node, node.left  # 若节点的左子节点数据等于val，则返回该节点及其左子节点
-                else:
-                    return node, node.right
-            """
-            node = root
-            if node.data == val:
-                return node
-            elif node.data < val:  # 若val大于node.data
-                recurse(node.right, val)
-            else:
-                recurse(node.left, val)
-
-        root = self._root
-        node = recurse(root, item)  # 得到item所在节点与其父节点
-        backend(node)  # 删除节点
+        if self.isEmpty():
+            raise ValueError('Tree is empty!')
+        father_node, node = None, self._root  # 待删节点及其父节点
+        while node is not None and item != node.data:
+            father_node = node
+            node = node.left if item < node.data else node.right
+        if node is None:
+            raise ValueError('%s is not in tree!' % str(item))
+
+        if node.left is not None and node.right is not None:
+            # 若待删节点有两个子节点，则用其左子树的最右节点数据覆盖待删数据，转而删除该最右节点
+            father_node, rightmost = node, node.left
+            while rightmost.right is not None:
+                father_node = rightmost
+                rightmost = rightmost.right
+            node.data, node.payload = rightmost.data, rightmost.payload
+            node = rightmost
+
+        child = node.left if node.left is not None else node.right  # 待删节点至多还有一个子节点，将其上移
+        if father_node is None:
+            self._root = child if child is not None else BSTNode(None)
+        elif father_node.left is node:
+            father_node.left = child
+        else:
+            father_node.right = child
         self._size -= 1  # 树节点数减1
-        self._root = root
 
     def find(self, item):
         """
@@ -208,39 +229,180 @@ class LinkedBST:
         Raise: Value error if self is empty.
         Post-condition: Return the item if it is in self, or None if it is not.
         """
-        def recurse(node):  # 递归搜索函数
-            if node is None:
-                return None
-            elif item == node.data:
-                return node.data
-            elif item < node.data:
-                return recurse(node.left)
-            else:
-                return recurse(node.right)
+        node = self._find_node(item)
+        return None if node is None else node.data
 
-        # Top-level call on the root node
-        return recurse(self._root)
+    def _find_node(self, item):
+        """Return the node of item, or None if item is not in self."""
+        node = None if self.isEmpty() else self._root
+        while node is not None:  # 自根节点向下搜索
+            if item == node.data:
+                return node
+            node = node.left if item < node.data else node.right
+        return None
 
     def replace(self, item, newItem):
         """
         Precondition: Self is not empty and item is in self.
         Raise: Value error if self is empty or item is not in self.
-        Post-condition: The item is replaced by the newItem.
+        Post-condition: The item is replaced by the newItem, and the replaced item is returned.
         """
-        def recurse(node, replaced=False):  # 迭代搜索替换函数
+        if self.isEmpty():
+            raise ValueError('Tree is empty!')
+        if newItem != item:  # 排序位置可能改变，先删除再添加，并保留原节点的值
+            node = self._find_node(item)
+            if node is None:
+                raise ValueError('%s is not in tree!' % str(item))
+            old, payload = node.data, node.payload
+            self.remove(item)
+            self.add(newItem, payload)
+            return old
+        node = self._root
+        while node is not None:
             if item == node.data:
-                node.data = newItem
-                replaced = True  # 若替换发生，则说明找到了item，将replaced置位为True
-                return replaced
-            elif item < node.data:
-                recurse(node.left)
-            elif item > node.data:
-                recurse(node.right)
+                old, node.data = node.data, newItem
+                return old
+            node = node.left if item < node.data else node.right
+        raise ValueError('%s is not in tree!' % str(item))
 
+    # Ordered queries
+    def min(self):
+        """
+        Precondition: Self is not empty.
+        Raise: Value error if self is empty.
+        Post-condition: Return the smallest item of self.
+        """
         if self.isEmpty():
             raise ValueError('Tree is empty!')
-        is_replaced = recurse(self._root)  # 搜索替换
-        if is_replaced:
-            print('%s不在当前树中，替换操作未发生' % str(item))
+        node = self._root
+        while node.left is not None:
+            node = node.left
+        return node.data
 
+    def max(self):
+        """
+        Precondition: Self is not empty.
+        Raise: Value error if self is empty.
+        Post-condition: Return the largest item of self.
+        """
+        if self.isEmpty():
+            raise ValueError('Tree is empty!')
+        node = self._root
+        while node.right is not None:
+            node = node.right
+        return node.data
+
+    def floor(self, item):
+        """Return the largest item of self not above item, or None if there is none."""
+        node = self._below(item, True)
+        return None if node is None else node.data
+
+    def ceiling(self, item):
+        """Return the smallest item of self not below item, or None if there is none."""
+        node = self._above(item, True)
+        return None if node is None else node.data
+
+    def predecessor(self, item):
+        """Return the largest item of self below item, or None if there is none. item need not be in self."""
+        node = self._below(item, False)
+        return None if node is None else node.data
+
+    def successor(self, item):
+        """Return the smallest item of self above item, or None if there is none. item need not be in self."""
+        node = self._above(item, False)
+        return None if node is None else node.data
+
+    def range(self, lo=None, hi=None):
+        """Supports a lazy inorder traversal of the items in [lo, hi); a bound of None leaves that side open."""
+        for node in self._nodes(lo, hi):
+            yield node.data
+
+    def _below(self, item, inclusive):
+        """Return the node of the largest item below item (or equal to it if inclusive), or None."""
+        found = None
+        node = None if self.isEmpty() else self._root
+        while node is not None:
+            if node.data < item or inclusive and node.data == item:
+                found = node  # 候选节点，继续在右子树中找更大的
+                node = node.right
+            else:
+                node = node.left
+        return found
+
+    def _above(self, item, inclusive):
+        """Return the node of the smallest item above item (or equal to it if inclusive), or None."""
+        found = None
+        node = None if self.isEmpty() else self._root
+        while node is not None:
+            if item < node.data or inclusive and node.data == item:
+                found = node  # 候选节点，继续在左子树中找更小的
+                node = node.left
+            else:
+                node = node.right
+        return found
 
+    def _nodes(self, lo=None, hi=None):
+        """
+        Supports a lazy inorder traversal of the nodes with items in [lo, hi).
+        Subtrees below lo are skipped on the way down, and the walk stops at the first item not below hi, so it takes
+        O(h + k) time for k nodes, and the stack O(h) memory.
+        """
+        if self.isEmpty():
+            return
+        node_stack = ArrayStack()
+        node = self._root
+        while node is not None or not node_stack.isEmpty():
+            while node is not None:
+                if lo is not None and node.data < lo:
+                    node = node.right  # 该节点及其左子树均小于lo
+                else:
+                    node_stack.push(node)
+                    node = node.left
+            if node_stack.isEmpty():
+                return  # 余下的节点均小于lo
+            node = node_stack.pop()
+            if hi is not None and not node.data < hi:
+                return
+            yield node
+            node = node.right
+
+    # Mapping mode
+    def __getitem__(self, key):
+        """Return the value of key; raise KeyError if key is not in self."""
+        node = self._find_node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.payload
+
+    def __setitem__(self, key, value):
+        """Set the value of key, adding key if it is not in self yet."""
+        node = self._find_node(key)
+        if node is None:
+            self.add(key, value)
+        else:
+            node.payload = value
+
+    def __delitem__(self, key):
+        """Remove key and its value; raise KeyError if key is not in self."""
+        if self._find_node(key) is None:
+            raise KeyError(key)
+        self.remove(key)
+
+    def get(self, key, default=None):
+        """Return the value of key, or default if key is not in self."""
+        node = self._find_node(key)
+        return default if node is None else node.payload
+
+    def keys(self):
+        """Supports a lazy iteration over the keys of self, in order."""
+        return self.range()
+
+    def values(self):
+        """Supports a lazy iteration over the values of self, in the order of their keys."""
+        for node in self._nodes():
+            yield node.payload
+
+    def items(self, lo=None, hi=None):
+        """Supports a lazy iteration over the (key, value) pairs of self with keys in [lo, hi), in order."""
+        for node in self._nodes(lo, hi):
+            yield node.data, node.payload